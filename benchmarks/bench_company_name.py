@@ -0,0 +1,244 @@
+"""
+Micro-benchmark for website company-name extraction.
+
+Runs the precompiled engine (event_scraper.extract_company_name_from_soup) and the previous
+pattern-by-pattern implementation over the synthetic HTML pages in benchmarks/fixtures, checks
+that both give the same answer for every page and prints the time per page.
+
+    python benchmarks/bench_company_name.py --repeat 200
+"""
+import argparse
+import re
+import sys
+import time
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+from corpus import FIXTURES_DIR, load_website_pages
+from event_scraper import extract_company_name_from_soup
+
+def quiet(*args):
+    pass
+
+def legacy_extract_company_name(soup, website_url, event_name, log=print):
+    """The pre-engine implementation: patterns rebuilt and searched one by one on every call."""
+    # Look for company name in specific, high-priority locations
+    company_name = ""
+    extraction_methods = []
+
+    # 1. Check for specific "About" or "Contact" sections first
+    about_sections = soup.find_all(['div', 'section'], class_=re.compile(r'about|contact|company|organization', re.IGNORECASE))
+    about_result = "Not found"
+    for section in about_sections:
+        section_text = section.get_text().lower()
+        # Look for very specific patterns in about sections
+        specific_patterns = [
+            r'organized by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+            r'hosted by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+            r'sponsored by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+            r'presented by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+            r'produced by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+            r'managed by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+            r'we are\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+            r'our company\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+            r'our organization\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)'
+        ]
+        for pattern in specific_patterns:
+            match = re.search(pattern, section_text)
+            if match:
+                potential_name = match.group(1).strip()
+                if len(potential_name) > 3 and not any(word in potential_name.lower() for word in ['conference', 'expo', 'show', 'event', 'the', 'and', 'or']):
+                    company_name = potential_name.title()
+                    about_result = f"Found: {company_name}"
+                    break
+        if company_name:
+            break
+    extraction_methods.append(f"1. About/Contact sections: {about_result}")
+
+    # 2. Check footer for company info (often most reliable)
+    footer_result = "Not found"
+    if not company_name:
+        footer = soup.find(['footer', 'div'], class_=re.compile(r'footer|bottom', re.IGNORECASE))
+        if footer:
+            footer_text = footer.get_text()
+            # Look for copyright or company info in footer
+            copyright_patterns = [
+                r'©\s*\d{4}\s*([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+                r'copyright\s*\d{4}\s*([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+                r'all rights reserved\s*([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+                r'powered by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)'
+            ]
+            for pattern in copyright_patterns:
+                match = re.search(pattern, footer_text, re.IGNORECASE)
+                if match:
+                    potential_name = match.group(1).strip()
+                    if len(potential_name) > 3:
+                        company_name = potential_name.title()
+                        footer_result = f"Found: {company_name}"
+                        break
+    extraction_methods.append(f"2. Footer copyright: {footer_result}")
+
+    # 3. Check meta tags for organization info
+    og_result = "Not found"
+    org_result = "Not found"
+    author_result = "Not found"
+    desc_result = "Not found"
+
+    if not company_name:
+        # Check Open Graph site name (often contains company name)
+        og_site_name = soup.find('meta', attrs={'property': 'og:site_name'})
+        if og_site_name:
+            company_name = og_site_name.get('content', '').strip().title()
+            og_result = f"Found: {company_name}"
+
+        if not company_name:
+            meta_org = soup.find('meta', attrs={'name': 'organization'})
+            if meta_org:
+                company_name = meta_org.get('content', '').strip().title()
+                org_result = f"Found: {company_name}"
+
+        if not company_name:
+            meta_author = soup.find('meta', attrs={'name': 'author'})
+            if meta_author:
+                author_content = meta_author.get('content', '')
+                if '@' not in author_content:  # Not an email
+                    company_name = author_content.strip().title()
+                    author_result = f"Found: {company_name}"
+
+        if not company_name:
+            # Check meta description for company mentions
+            meta_desc = soup.find('meta', attrs={'name': 'description'})
+            if meta_desc:
+                desc_text = meta_desc.get('content', '').lower()
+                # Look for "organized by" or "hosted by" patterns in description
+                desc_patterns = [
+                    r'organized by\s+([a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+                    r'hosted by\s+([a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+                    r'sponsored by\s+([a-zA-Z\s&]+?)(?:\s|\.|,|$)',
+                    r'presented by\s+([a-zA-Z\s&]+?)(?:\s|\.|,|$)'
+                ]
+                for pattern in desc_patterns:
+                    match = re.search(pattern, desc_text)
+                    if match:
+                        potential_name = match.group(1).strip()
+                        if len(potential_name) > 3 and not any(word in potential_name.lower() for word in ['conference', 'expo', 'show', 'event']):
+                            company_name = potential_name.title()
+                            desc_result = f"Found: {company_name}"
+                            break
+
+    extraction_methods.append(f"3. Open Graph site name: {og_result}")
+    extraction_methods.append(f"4. Organization meta tag: {org_result}")
+    extraction_methods.append(f"5. Author meta tag: {author_result}")
+    extraction_methods.append(f"6. Meta description: {desc_result}")
+
+    # 7. Check title tag (but be more selective)
+    title_result = "Not found"
+    if not company_name:
+        title = soup.find('title')
+        if title:
+            title_text = title.get_text()
+            # Only extract if title looks like it contains company name
+            if ' - ' in title_text or ' | ' in title_text:
+                parts = re.split(r'\s*[-|]\s*', title_text)
+                if len(parts) > 1:
+                    potential_name = parts[0].strip()
+                    if len(potential_name) > 3 and not any(word in potential_name.lower() for word in ['conference', 'expo', 'show', 'event']):
+                        company_name = potential_name.title()
+                        title_result = f"Found: {company_name}"
+    extraction_methods.append(f"7. Title tag: {title_result}")
+
+    # 8. Check domain name as last resort (but be more careful)
+    domain_result = "Not found"
+    if not company_name:
+        domain = urlparse(website_url).netloc
+        if domain:
+            domain_parts = domain.replace('www.', '').split('.')
+            if len(domain_parts) > 0:
+                domain_name = domain_parts[0]
+                # Only use domain if it looks like a company name (not generic)
+                if len(domain_name) > 3 and not any(word in domain_name.lower() for word in ['event', 'show', 'expo', 'conference', 'trade', 'fair']):
+                    domain_name = domain_name.replace('-', ' ').replace('_', ' ')
+                    company_name = domain_name.title()
+                    domain_result = f"Found: {company_name}"
+    extraction_methods.append(f"8. Domain name: {domain_result}")
+
+    # Print all extraction methods for this website
+    log(f"  Website extraction methods for {event_name}:")
+    for method in extraction_methods:
+        log(f"    {method}")
+
+    # Clean up the company name
+    if company_name:
+        # Remove common suffixes
+        suffixes = [' Inc', ' LLC', ' Corp', ' Corporation', ' Company', ' Co', ' Ltd', ' Limited']
+        for suffix in suffixes:
+            if company_name.endswith(suffix):
+                company_name = company_name[:-len(suffix)]
+                break
+
+        # Clean up extra spaces and common words
+        company_name = ' '.join(company_name.split())
+
+        # Remove common prefixes that aren't part of company name
+        prefixes_to_remove = ['The ', 'Welcome to ', 'Home - ', 'About - ']
+        for prefix in prefixes_to_remove:
+            if company_name.startswith(prefix):
+                company_name = company_name[len(prefix):]
+                break
+
+        log(f"  Final result: {company_name}")
+        return company_name
+
+    log(f"  Final result: Not found")
+    return ""
+
+
+
+def load_fixtures():
+    """Parse every fixture the way fetch_page does (scripts and styles removed)."""
+    pages = []
+    for name, url, content in load_website_pages():
+        soup = BeautifulSoup(content, "html.parser")
+        for tag in soup(["script", "style"]):
+            tag.decompose()
+        pages.append((name, url, soup))
+    return pages
+
+def time_extractor(extract, pages, repeat):
+    """Seconds per page for extract over all pages, best of three rounds."""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for name, url, soup in pages:
+                extract(soup, url, name, log=quiet)
+        elapsed = (time.perf_counter() - start) / (repeat * len(pages))
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark website company-name extraction on the fixture pages.")
+    parser.add_argument("--repeat", type=int, default=100, help="Passes over the fixtures per round (default: 100)")
+    args = parser.parse_args(argv)
+    
+    pages = load_fixtures()
+    print(f"{len(pages)} fixtures from {FIXTURES_DIR}")
+    
+    mismatches = 0
+    for name, url, soup in pages:
+        new = extract_company_name_from_soup(soup, url, name, log=quiet)
+        old = legacy_extract_company_name(soup, url, name, log=quiet)
+        marker = "" if new == old else f"  MISMATCH (previous: {old!r})"
+        mismatches += bool(marker)
+        print(f"  {name:<24} {new!r}{marker}")
+    
+    legacy_time = time_extractor(legacy_extract_company_name, pages, args.repeat)
+    engine_time = time_extractor(extract_company_name_from_soup, pages, args.repeat)
+    print(f"Previous implementation: {legacy_time * 1e6:8.1f} us/page")
+    print(f"Compiled engine:         {engine_time * 1e6:8.1f} us/page")
+    print(f"Speedup:                 {legacy_time / engine_time:8.2f}x")
+    return 1 if mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+Micro-benchmark for parsing event website pages.
+
+Compares the previous page handling (a full html.parser tree, get_text and five email
+regexes over the text) with what fetch_page and extract_contact_info do now - emails scanned
+from the raw bytes and a partial tree holding only the regions the extractors read
+(event_scraper.PageRegionFilter) - for each available parser backend, over the synthetic HTML
+pages in benchmarks/fixtures.
+
+    python benchmarks/bench_html_parsing.py --repeat 20
+"""
+import argparse
+import re
+import time
+
+from bs4 import BeautifulSoup
+
+from corpus import FIXTURES_DIR, load_website_pages
+import event_scraper
+from event_scraper import PageRegionFilter, make_soup, scan_emails, set_html_parser
+
+# The email patterns extract_contact_info used to run one after another over the page text
+LEGACY_EMAIL_PATTERNS = [
+    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+    r'info@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
+    r'contact@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
+    r'events@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
+    r'sales@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+]
+
+def parse_full(content):
+    """The previous fetch_page parsing and email search: whole html.parser tree, text, regexes."""
+    soup = BeautifulSoup(content, 'html.parser')
+    text = soup.get_text().lower()
+    for script in soup(["script", "style"]):
+        script.decompose()
+    emails = []
+    for pattern in LEGACY_EMAIL_PATTERNS:
+        emails = re.findall(pattern, text)
+        if emails:
+            break
+    return soup, emails
+
+def parse_partial(content):
+    """The current fetch_page parsing with the configured backend, plus the raw-bytes email scan."""
+    emails = scan_emails(content)
+    soup = make_soup(content, parse_only=PageRegionFilter())
+    for script in soup(["script", "style"]):
+        script.decompose()
+    return soup, emails
+
+def time_parse(parse, content, repeat):
+    """Seconds per parse, best of three rounds."""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            parse(content)
+        elapsed = (time.perf_counter() - start) / repeat
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark HTML parsing of event website pages.")
+    parser.add_argument("--repeat", type=int, default=10, help="Parses per page per round (default: 10)")
+    args = parser.parse_args(argv)
+    
+    backends = ["html.parser"] + (["lxml"] if event_scraper.lxml is not None else [])
+    pages = [(name, content) for name, url, content in load_website_pages()]
+    print(f"{len(pages)} fixtures from {FIXTURES_DIR}; backends: {', '.join(backends)}")
+    
+    header = f"  {'page':<24} {'KB':>6} {'full tree':>10}"
+    for backend in backends:
+        header += f" {'partial ' + backend:>20} {'speedup':>8}"
+    print(header)
+    
+    totals = {'full': 0.0}
+    for name, content in pages:
+        full_time = time_parse(parse_full, content, args.repeat)
+        totals['full'] += full_time
+        line = f"  {name:<24} {len(content) / 1024:6.0f} {full_time * 1e3:8.2f}ms"
+        for backend in backends:
+            set_html_parser(backend)
+            partial_time = time_parse(parse_partial, content, args.repeat)
+            totals[backend] = totals.get(backend, 0.0) + partial_time
+            line += f" {partial_time * 1e3:18.2f}ms {full_time / partial_time:7.2f}x"
+        print(line)
+    
+    line = f"  {'total':<24} {'':>6} {totals['full'] * 1e3:8.2f}ms"
+    for backend in backends:
+        line += f" {totals[backend] * 1e3:18.2f}ms {totals['full'] / totals[backend]:7.2f}x"
+    print(line)
+
+if __name__ == "__main__":
+    main()
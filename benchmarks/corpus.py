@@ -0,0 +1,111 @@
+"""
+Checked-in page corpus for the offline benchmarks.
+
+The corpus is synthetic: the pages were written by hand after the layout of real event
+websites and calendar result pages, not recorded from them. benchmarks/fixtures holds the
+event website pages and benchmarks/fixtures/calendar the calendar result pages, covering
+both pagination shapes, a td.next link and a td.next whose div is clicked through onclick;
+next_page_request replays either the way the HTTP listing backend does.
+FixtureAdapter serves the website pages to the scraper's shared requests session by URL,
+so the full fetch -> parse -> extract path runs without a network.
+"""
+import io
+import os
+import sys
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import event_scraper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+CALENDAR_DIR = os.path.join(FIXTURES_DIR, "calendar")
+CALENDAR_URL = "https://www.example.com/index.php?"  # Base URL the calendar pages are resolved against
+
+# Website fixture file -> the URL it stands in for (the domain is also extraction input)
+WEBSITE_URLS = {
+    "footer_copyright.html": "https://www.abilities.com/houston/",
+    "og_site_name.html": "https://www.buildersshow.com/",
+    "author_meta.html": "https://www.informamarkets-events.com/",
+    "description.html": "https://www.shoptalk.com/",
+    "title_tag.html": "https://globalpetexpo.org/",
+    "domain_fallback.html": "https://www.dentalsolutionsnetwork.com/",
+    "large_marketing.html": "https://www.worldteaexpo.com/",
+}
+
+# Calendar fixture file -> (month aliases, year) the page was searched for
+CALENDAR_PAGES = {
+    "july_2025_page1.html": (["JUL", "JULY"], 2025),
+    "july_2025_page2.html": (["JUL", "JULY"], 2025),
+    "september_2025_page1.html": (["SEP", "SEPT", "SEPTEMBER"], 2025),  # td.next paged by onclick
+    "december_2025_page1.html": (["DEC", "DECEMBER"], 2025),
+}
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+def load_website_pages():
+    """Return [(file name, url, raw bytes)] for every website page in the corpus."""
+    pages = []
+    for name in sorted(os.listdir(FIXTURES_DIR)):
+        if name.endswith(".html"):
+            pages.append((name, WEBSITE_URLS.get(name, "https://example.com/"), _read(os.path.join(FIXTURES_DIR, name))))
+    return pages
+
+def load_calendar_pages():
+    """Return [(file name, month aliases, year, raw bytes)] for every calendar page in the corpus."""
+    pages = []
+    for name in sorted(os.listdir(CALENDAR_DIR)):
+        if name in CALENDAR_PAGES:
+            aliases, year = CALENDAR_PAGES[name]
+            pages.append((name, aliases, year, _read(os.path.join(CALENDAR_DIR, name))))
+    return pages
+
+def next_page_request(content, page_url=CALENDAR_URL):
+    """Work out the next-page request of a calendar page the way scrape_month_rows_http does."""
+    soup = BeautifulSoup(content, "html.parser")
+    form = soup.find("select", attrs={"name": "vMo"}).find_parent("form")
+    return event_scraper._next_page_request(soup, page_url, form, event_scraper._search_form_fields(form))
+
+class FixtureAdapter(BaseAdapter):
+    """Answers requests from the corpus website pages; anything else is a 404."""
+
+    def __init__(self):
+        super().__init__()
+        self.pages = {url: content for name, url, content in load_website_pages()}
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        content = self.pages.get(request.url)
+        if content is None:
+            response.status_code = 404
+            response.reason = "Not Found"
+            content = b""
+        else:
+            response.status_code = 200
+            response.reason = "OK"
+            response.headers["Content-Type"] = "text/html; charset=utf-8"
+        response.headers["Content-Length"] = str(len(content))
+        response.raw = io.BytesIO(content)
+        return response
+
+    def close(self):
+        pass
+
+def install_fixture_session():
+    """Point the scraper's shared HTTP session at the corpus and turn off delays and disk caches."""
+    session = requests.Session()
+    adapter = FixtureAdapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    event_scraper.close_http_session()
+    event_scraper._http_session = session
+    event_scraper.set_host_delay(0)
+    event_scraper.configure_http_cache(enabled=False)
+    event_scraper.clear_page_cache()
+    return session
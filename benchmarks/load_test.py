@@ -0,0 +1,147 @@
+"""
+Offline end-to-end load test: a full event_scraper.main() run against the local mock calendar,
+OpenAI endpoint and website farm (see mock_servers.py), timed from the first calendar request
+to the finished spreadsheet.
+
+    python benchmarks/load_test.py --events 10000
+    python benchmarks/load_test.py --events 2000 --latency-ms 100 --runs 2 --output load.json
+
+Each run works in a scratch directory, so the first run starts with empty caches and no event
+history; later runs (--runs 2 or more) reuse them like a real rerun in delta mode. The per-host
+politeness delay (--contact-delay) defaults to 0 here, because every synthetic website is
+served from the same host.
+"""
+import argparse
+import contextlib
+import json
+import math
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+from openpyxl import load_workbook
+
+from mock_servers import start_mock_servers
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import event_scraper
+
+MONTHS_PER_RUN = 6  # event_scraper.main() lists July to December
+
+def peak_memory_mb():
+    """Peak resident memory of this process in MB, or None where the resource module is missing."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def saved_event_count(path):
+    if not os.path.exists(path):
+        return 0
+    workbook = load_workbook(path, read_only=True)
+    try:
+        # Streamed workbooks carry no dimensions, so the rows are counted
+        return sum(1 for row in workbook.active.iter_rows(min_row=2, values_only=True))
+    finally:
+        workbook.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test a full scraping run against local mock servers.")
+    parser.add_argument("--events", type=int, default=10000, help="Events to collect and enrich (default: 10000)")
+    parser.add_argument("--rows-per-page", type=int, default=50, help="Calendar rows per result page (default: 50)")
+    parser.add_argument("--latency-ms", type=float, default=20,
+                        help="Delay added to every mock response, calendar, OpenAI and websites alike (default: 20)")
+    parser.add_argument("--page-kb", type=int, default=40, help="Approximate size of each website page (default: 40)")
+    parser.add_argument("--runs", type=int, default=1, help="Runs in the same scratch directory (default: 1)")
+    parser.add_argument("--contact-delay", type=float, default=0,
+                        help="Seconds between requests to one website host (default: 0)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the generated data (default: 1)")
+    parser.add_argument("--workdir", help="Keep the run's files (spreadsheet, caches, log) in this directory")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("scraper_args", nargs=argparse.REMAINDER,
+                        help="Extra event_scraper options after --, e.g. -- --workers 16 --batch-size 40")
+    args = parser.parse_args(argv)
+    scraper_args = [arg for arg in args.scraper_args if arg != '--']
+    output_path = os.path.abspath(args.output) if args.output else None
+
+    # Enough pages that the US rows of all months cover the requested events
+    us_share = 0.8
+    pages = math.ceil(args.events / (MONTHS_PER_RUN * args.rows_per_page * us_share)) + 1
+    calendar, openai_server, websites = start_mock_servers(
+        pages, args.rows_per_page, us_share, page_kb=args.page_kb, latency=args.latency_ms / 1000, seed=args.seed
+    )
+    os.environ['OPENAI_BASE_URL'] = f"{openai_server.url}/v1"
+    os.environ['OPENAI_API_KEY'] = "mock"
+
+    workdir = os.path.abspath(args.workdir) if args.workdir else tempfile.mkdtemp(prefix="scraper-load-")
+    os.makedirs(workdir, exist_ok=True)
+    original_dir = os.getcwd()
+    os.chdir(workdir)
+    print(f"Calendar {calendar.url} ({pages} pages x {args.rows_per_page} rows per month), "
+          f"OpenAI {openai_server.url}, websites {websites.url}; latency {args.latency_ms:g} ms")
+    print(f"Working directory: {workdir}")
+
+    runs = []
+    try:
+        for run_number in range(1, args.runs + 1):
+            before = {name: server.requests for name, server in
+                      (('calendar', calendar), ('openai', openai_server), ('websites', websites))}
+            log_path = os.path.join(workdir, f"run{run_number}.log")
+            start = time.perf_counter()
+            with open(log_path, 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+                event_scraper.main(["--url", f"{calendar.url}/index.php?", "--max-events", str(args.events),
+                                    "--contact-delay", str(args.contact_delay)] + scraper_args)
+            elapsed = time.perf_counter() - start
+
+            events = saved_event_count(os.path.join(workdir, event_scraper.EXCEL_PATH))
+            with open(os.path.join(workdir, event_scraper.METRICS_REPORT_PATH), 'r', encoding='utf-8') as f:
+                stages = json.load(f)['stages']
+            run = {
+                'run': run_number,
+                'events': events,
+                'seconds': elapsed,
+                'events_per_sec': events / elapsed if elapsed else 0.0,
+                'requests': {
+                    'calendar': calendar.requests - before['calendar'],
+                    'openai': openai_server.requests - before['openai'],
+                    'websites': websites.requests - before['websites'],
+                },
+                'peak_memory_mb': peak_memory_mb(),
+                'stages': stages,
+            }
+            runs.append(run)
+            requests = run['requests']
+            print(f"Run {run_number}: {events} events in {elapsed:.1f}s ({run['events_per_sec']:.1f} events/s); "
+                  f"requests: {requests['calendar']} calendar, {requests['openai']} OpenAI, "
+                  f"{requests['websites']} website; log in {log_path}")
+    finally:
+        os.chdir(original_dir)
+        for server in (calendar, openai_server, websites):
+            server.stop()
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if output_path:
+        results = {
+            'meta': {
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'events': args.events,
+                'latency_ms': args.latency_ms,
+                'page_kb': args.page_kb,
+                'scraper_args': scraper_args,
+            },
+            'runs': runs,
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {output_path}")
+
+if __name__ == "__main__":
+    main()
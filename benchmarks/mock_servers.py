@@ -0,0 +1,338 @@
+"""
+Local stand-ins for everything a scraping run talks to, for offline end-to-end load tests.
+
+- MockCalendarServer: the calendar search page (a form with the vMo month field) and its
+  result pages (tr.row tables with td.next pagination), with a configurable number of pages
+  per month, rows per page and response latency.
+- MockOpenAIServer: a chat-completions endpoint that answers both the single-event prompt and
+  the batched JSON prompt with synthetic organizer names and token usage.
+- MockWebsiteFarm: synthetic event websites under /site/<id>/. Some have their email on the
+  homepage, some only on a contact page and some none at all, so the contact crawl is exercised.
+
+Everything is generated from a seed, so a load test sees the same data on every run.
+Run the servers on their own (for pointing the CLI or GUI at them by hand) with:
+
+    python benchmarks/mock_servers.py --pages 5 --latency-ms 50
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+MONTH_ABBREVIATIONS = ['JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN', 'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC']
+TOPICS = ['Dental', 'Healthcare IT', 'Solar Energy', 'Plastics', 'Boat', 'Fitness', 'Builders', 'Pet',
+          'Tea', 'Cybersecurity', 'Packaging', 'Robotics', 'Food Service', 'Aviation', 'Textile', 'Hardware']
+EVENT_KINDS = ['Expo', 'Conference', 'Summit', 'Trade Show', 'Convention', 'Forum']
+US_CITIES = ['Chicago', 'Houston', 'Orlando', 'Las Vegas', 'Atlanta', 'Denver', 'Boston', 'San Diego']
+OTHER_LOCATIONS = [('Toronto', 'Canada'), ('Frankfurt', 'Germany'), ('Mexico City', 'Mexico')]
+FILLER = ("Join thousands of industry professionals for three days of education, networking and "
+          "hands-on product demonstrations. Explore the latest technology and meet suppliers. ")
+
+class MockServer(ThreadingHTTPServer):
+    """A threaded HTTP server on a free local port that runs in a background thread."""
+    daemon_threads = True
+    request_queue_size = 128  # The default of 5 drops connections when many workers connect at once
+
+    def __init__(self, handler, latency=0.0, host="127.0.0.1", port=0):
+        super().__init__((host, port), handler)
+        self.latency = latency
+        self.requests = 0
+        self.counter_lock = threading.Lock()
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count_request(self):
+        with self.counter_lock:
+            self.requests += 1
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Shared plumbing: request counting, latency, and quiet logging."""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def respond(self, status, body, content_type="text/html; charset=utf-8"):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.server.count_request()
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+# --- Calendar -----------------------------------------------------------------------------
+
+class CalendarHandler(MockHandler):
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        if 'vMo' not in query:
+            self.respond(200, self.server.search_page())
+        else:
+            self.respond(200, self.server.results_page(query))
+
+    def do_POST(self):
+        self.respond(200, self.server.results_page(parse_qs(self.read_body().decode('utf-8'))))
+
+class MockCalendarServer(MockServer):
+    """
+    The trade show calendar. Every month has pages result pages of rows_per_page rows; a
+    us_share of the rows are US events in the searched month (the rest are filtered out by
+    the scraper). Event websites point at website_url (the MockWebsiteFarm).
+    """
+
+    def __init__(self, website_url, pages=5, rows_per_page=50, us_share=0.8, latency=0.0, seed=1):
+        super().__init__(CalendarHandler, latency)
+        self.website_url = website_url.rstrip('/')
+        self.pages = pages
+        self.rows_per_page = rows_per_page
+        self.us_share = us_share
+        self.seed = seed
+
+    def search_form(self, month=7, year=2025, page=1):
+        options = "\n".join(
+            f'<option value="{number}"{" selected" if number == month else ""}>{abbreviation}</option>'
+            for number, abbreviation in enumerate(MONTH_ABBREVIATIONS, start=1)
+        )
+        return (f'<form name="search" method="post" action="index.php?"><table class="search"><tr>'
+                f'<td>Month</td><td><select name="vMo">\n{options}\n</select></td>'
+                f'<td><input type="text" name="vYr" value="{year}"><input type="hidden" name="page" value="{page}"></td>'
+                f'<td><input type="submit" class="sc-button-submit" name="search" value="Search"></td>'
+                f'</tr></table></form>')
+
+    def page_shell(self, body):
+        return ('<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>Trade Show Calendar</title></head><body>\n'
+                f'{body}\n<div id="footer">&copy; 2025 Trade Show Calendar</div></body></html>')
+
+    def search_page(self):
+        return self.page_shell(self.search_form())
+
+    def results_page(self, query):
+        def number(name, default):
+            try:
+                return int(query.get(name, [default])[0])
+            except (TypeError, ValueError):
+                return default
+        month, year, page = number('vMo', 7), number('vYr', 2025), number('page', 1)
+
+        rows = []
+        if 1 <= page <= self.pages:
+            for row_number in range(self.rows_per_page):
+                rows.append(self.result_row(month, year, page, row_number))
+        next_link = (f'<a href="index.php?vMo={month}&amp;vYr={year}&amp;page={page + 1}">Next &raquo;</a>'
+                     if page < self.pages else '')
+        body = (self.search_form(month, year, page) +
+                '\n<table class="results"><tr class="header"><td>Event</td><td>Dates</td><td>City</td>'
+                '<td>Country</td><td>Attendance</td><td>Exhibitors</td></tr>\n' +
+                "\n".join(rows) +
+                f'\n</table><table class="pager"><tr><td class="prev"></td><td>Page {page}</td>'
+                f'<td class="next">{next_link}</td></tr></table>')
+        return self.page_shell(body)
+
+    def result_row(self, month, year, page, row_number):
+        """One result row, the same for the same month, year, page and position on every request."""
+        site_id = ((year * 12 + month) * self.pages + page) * self.rows_per_page + row_number
+        rng = random.Random(self.seed * 1000003 + site_id)
+        topic = rng.choice(TOPICS)
+        if rng.random() < 0.3:
+            # Names the rules resolver can answer without ChatGPT
+            name = f"{topic} Association {rng.choice(EVENT_KINDS)} {site_id}"
+        else:
+            name = f"{topic} {rng.choice(EVENT_KINDS)} {year} #{site_id}"
+        if rng.random() < self.us_share:
+            city, country = rng.choice(US_CITIES), "United States"
+        else:
+            city, country = rng.choice(OTHER_LOCATIONS)
+        start_day = rng.randint(1, 25)
+        dates = f"{MONTH_ABBREVIATIONS[month - 1]} {start_day}-{start_day + 2}, {year}"
+        return (f'<tr class="row"><td><a href="{self.website_url}/site/{site_id}/" target="_blank">{escape(name)}</a>'
+                f'<br><span class="small">{rng.choice(["Conference", "Exhibition"])}</span></td>'
+                f'<td>{dates}</td><td>{city}</td><td>{country}</td>'
+                f'<td>{rng.randint(10, 600) * 50:,}</td><td>{rng.randint(20, 1500)}</td></tr>')
+
+# --- OpenAI chat completions --------------------------------------------------------------
+
+class OpenAIHandler(MockHandler):
+    def do_POST(self):
+        if not urlparse(self.path).path.endswith('/chat/completions'):
+            self.respond(404, json.dumps({'error': {'message': 'Not found'}}), "application/json")
+            return
+        try:
+            request = json.loads(self.read_body() or b'{}')
+        except ValueError:
+            self.respond(400, json.dumps({'error': {'message': 'Invalid JSON'}}), "application/json")
+            return
+        self.respond(200, json.dumps(self.server.completion(request)), "application/json")
+
+class MockOpenAIServer(MockServer):
+    """
+    Chat completions: batched requests (response_format json_object) get one company per
+    numbered event line, single requests a plain name. About unknown_share of the events are
+    answered "Unknown" so the website fallback runs too. Use url + "/v1" as the API base URL.
+    """
+
+    def __init__(self, unknown_share=0.2, latency=0.0, seed=1):
+        super().__init__(OpenAIHandler, latency)
+        self.unknown_share = unknown_share
+        self.seed = seed
+        self.batches = 0
+
+    def company_for(self, event_info):
+        rng = random.Random(f"{self.seed}:{event_info}")
+        if rng.random() < self.unknown_share:
+            return "Unknown"
+        return f"{event_info.split()[0]} Events Group"
+
+    def completion(self, request):
+        messages = request.get('messages') or []
+        prompt = str(messages[-1].get('content', '')) if messages else ''
+        if (request.get('response_format') or {}).get('type') == 'json_object':
+            with self.counter_lock:
+                self.batches += 1
+            companies = []
+            in_events = False
+            for line in prompt.splitlines():
+                if line.strip() == 'Events:':
+                    in_events = True
+                    continue
+                number, dot, info = line.partition('. ')
+                if in_events and dot and number.isdigit():
+                    companies.append({'id': int(number), 'company': self.company_for(info)})
+                elif in_events and not line.strip():
+                    break
+            content = json.dumps({'companies': companies})
+        else:
+            info = prompt.split('Event Information:', 1)[-1].strip()
+            content = self.company_for(info)
+
+        prompt_tokens = sum(len(str(message.get('content', ''))) for message in messages) // 4
+        completion_tokens = len(content) // 4 + 1
+        return {
+            'id': f"chatcmpl-mock-{self.requests}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'mock'),
+            'choices': [{'index': 0, 'finish_reason': 'stop',
+                         'message': {'role': 'assistant', 'content': content}}],
+            'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                      'total_tokens': prompt_tokens + completion_tokens},
+        }
+
+# --- Event websites -----------------------------------------------------------------------
+
+class WebsiteHandler(MockHandler):
+    def do_GET(self):
+        status, body = self.server.page(urlparse(self.path).path)
+        self.respond(status, body)
+
+class MockWebsiteFarm(MockServer):
+    """
+    Synthetic event websites at /site/<id>/ with /contact and /about pages. Each site is about
+    page_kb kilobytes; its email is on the homepage, only on the contact page, or nowhere.
+    """
+
+    def __init__(self, page_kb=40, latency=0.0, seed=1):
+        super().__init__(WebsiteHandler, latency)
+        self.page_kb = page_kb
+        self.seed = seed
+
+    def site(self, site_id):
+        rng = random.Random(self.seed * 7919 + site_id)
+        company = f"{rng.choice(TOPICS)} {rng.choice(['Media', 'Events', 'Exhibitions', 'Trade Group'])} Inc"
+        email_on = rng.choices(['home', 'contact', 'none'], weights=[6, 3, 1])[0]
+        return company, f"info@site{site_id}.example.org", email_on
+
+    def page(self, path):
+        parts = [part for part in path.split('/') if part]
+        if len(parts) < 2 or parts[0] != 'site' or not parts[1].isdigit() or len(parts) > 3:
+            return 404, "<html><body>Not found</body></html>"
+        site_id = int(parts[1])
+        company, email, email_on = self.site(site_id)
+        subpage = parts[2] if len(parts) == 3 else ''
+        if subpage not in ('', 'contact', 'about'):
+            return 404, "<html><body>Not found</body></html>"
+
+        filler_blocks = max(1, self.page_kb * 1024 // len(FILLER) // 4)
+        sections = "\n".join(
+            f'<section class="content-block"><h2>Track {number}</h2><p>{FILLER * 4}</p></section>'
+            for number in range(1, filler_blocks + 1)
+        )
+        if subpage == 'contact':
+            contact = f'<div class="contact-box"><p>Write to us at {email if email_on != "none" else "our office"}.</p></div>'
+        elif subpage == '' and email_on == 'home':
+            contact = f'<div class="contact-box"><p>Questions? <a href="mailto:{email}">{email}</a></p></div>'
+        else:
+            contact = ''
+        return 200, (
+            '<!DOCTYPE html>\n<html lang="en"><head><meta charset="utf-8">'
+            f'<title>{escape(company)} | Event {site_id}</title>'
+            f'<meta name="description" content="The annual event organized by {escape(company)}.">'
+            '</head><body>\n'
+            f'<nav class="navbar"><ul><li><a href="/site/{site_id}/">Home</a></li>'
+            f'<li><a href="/site/{site_id}/about">About</a></li>'
+            f'<li><a href="/site/{site_id}/contact">Contact</a></li></ul></nav>\n'
+            f'{sections}\n{contact}\n'
+            f'<footer class="site-footer"><p>© 2025 {escape(company)}. All rights reserved.</p></footer>\n'
+            '</body></html>'
+        )
+
+def start_mock_servers(pages=5, rows_per_page=50, us_share=0.8, unknown_share=0.2, page_kb=40,
+                       latency=0.0, seed=1):
+    """Start the website farm, calendar and OpenAI mocks. Returns (calendar, openai, websites)."""
+    websites = MockWebsiteFarm(page_kb, latency, seed).start()
+    calendar = MockCalendarServer(websites.url, pages, rows_per_page, us_share, latency, seed).start()
+    openai_server = MockOpenAIServer(unknown_share, latency, seed).start()
+    return calendar, openai_server, websites
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the mock calendar, OpenAI and website servers until interrupted.")
+    parser.add_argument("--pages", type=int, default=5, help="Result pages per month (default: 5)")
+    parser.add_argument("--rows-per-page", type=int, default=50, help="Rows per result page (default: 50)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every response (default: 0)")
+    parser.add_argument("--page-kb", type=int, default=40, help="Approximate size of each website page (default: 40)")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the generated data (default: 1)")
+    args = parser.parse_args(argv)
+
+    calendar, openai_server, websites = start_mock_servers(
+        args.pages, args.rows_per_page, page_kb=args.page_kb, latency=args.latency_ms / 1000, seed=args.seed
+    )
+    print(f"Calendar:  {calendar.url}/index.php?")
+    print(f"OpenAI:    {openai_server.url}/v1  (set OPENAI_BASE_URL to this and OPENAI_API_KEY to any value)")
+    print(f"Websites:  {websites.url}/site/<id>/")
+    print(f"Example:   OPENAI_BASE_URL={openai_server.url}/v1 OPENAI_API_KEY=mock "
+          f"python event_scraper.py --url {calendar.url}/index.php? --max-events 1000")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for server in (calendar, openai_server, websites):
+            server.stop()
+
+if __name__ == "__main__":
+    main()
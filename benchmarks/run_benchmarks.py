@@ -0,0 +1,169 @@
+"""
+Offline benchmark suite over the checked-in synthetic fixture corpus (see corpus.py).
+
+Times the scraper's hot functions call by call - calendar row parsing and pagination replay,
+rule-based company names, email scanning, and the full website company-name and contact-info
+extraction (fetched from the corpus, parsed and extracted) - and reports throughput and
+latency percentiles. Results can be written as JSON and compared with a run from another commit:
+
+    python benchmarks/run_benchmarks.py --output before.json
+    (switch commits)
+    python benchmarks/run_benchmarks.py --output after.json --compare before.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import time
+
+from corpus import install_fixture_session, load_calendar_pages, load_website_pages, next_page_request
+import event_scraper
+
+def percentile(sorted_samples, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(sorted_samples) - 1, max(0, int(round(fraction * len(sorted_samples))) - 1))
+    return sorted_samples[index]
+
+def summarize(samples):
+    """Latency percentiles (milliseconds) and throughput (calls per second) for one benchmark."""
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        'calls': len(ordered),
+        'ops_per_sec': len(ordered) / total if total else 0.0,
+        'mean_ms': total / len(ordered) * 1e3,
+        'p50_ms': percentile(ordered, 0.50) * 1e3,
+        'p90_ms': percentile(ordered, 0.90) * 1e3,
+        'p99_ms': percentile(ordered, 0.99) * 1e3,
+        'min_ms': ordered[0] * 1e3,
+        'max_ms': ordered[-1] * 1e3,
+    }
+
+def build_benchmarks():
+    """Return {name: (function, [argument tuples], fresh_pages)} over the corpus."""
+    websites = load_website_pages()
+    calendar = load_calendar_pages()
+    event_names = []
+    for name, aliases, year, content in calendar:
+        rows, row_count = event_scraper.parse_listing_rows(content, aliases, year)
+        event_names.extend(row['name'] for row in rows)
+
+    return {
+        'parse_listing_rows': (
+            event_scraper.parse_listing_rows,
+            [(content, aliases, year) for name, aliases, year, content in calendar],
+            False
+        ),
+        # Raises ListingBackendError if a page's td.next (link or onclick) cannot be replayed
+        'next_page_request': (
+            next_page_request,
+            [(content,) for name, aliases, year, content in calendar],
+            False
+        ),
+        'resolve_company_name_by_rules': (
+            event_scraper.resolve_company_name_by_rules,
+            [(event_name,) for event_name in event_names],
+            False
+        ),
+        'scan_emails': (
+            event_scraper.scan_emails,
+            [(content, url) for name, url, content in websites],
+            False
+        ),
+        # The website extractors are timed from an empty page cache: fetch, parse and extract
+        'extract_company_name_from_website': (
+            event_scraper.extract_company_name_from_website,
+            [(url, name) for name, url, content in websites],
+            True
+        ),
+        'extract_contact_info': (
+            event_scraper.extract_contact_info,
+            [(url, name) for name, url, content in websites],
+            True
+        ),
+    }
+
+def run_benchmark(function, arguments, fresh_pages, repeat):
+    """Call function once per argument tuple, repeat times over (after one warm-up pass)."""
+    samples = []
+    for round_number in range(repeat + 1):
+        for args in arguments:
+            if fresh_pages:
+                event_scraper.clear_page_cache()
+            start = time.perf_counter()
+            function(*args)
+            elapsed = time.perf_counter() - start
+            if round_number:
+                samples.append(elapsed)
+    return summarize(samples)
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)), stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return None
+
+def print_results(results, baseline=None):
+    print(f"{'benchmark':<36} {'ops/s':>10} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9}" + (f" {'p50 change':>11}" if baseline else ""))
+    for name, stats in results['benchmarks'].items():
+        line = f"{name:<36} {stats['ops_per_sec']:10.1f} {stats['p50_ms']:9.3f} {stats['p90_ms']:9.3f} {stats['p99_ms']:9.3f}"
+        if baseline:
+            old = baseline.get('benchmarks', {}).get(name)
+            if old and old['p50_ms']:
+                line += f" {(stats['p50_ms'] / old['p50_ms'] - 1) * 100:+10.1f}%"
+            else:
+                line += f" {'new':>11}"
+        print(line)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the offline benchmark suite over the fixture corpus.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes over the corpus per benchmark (default: 5)")
+    parser.add_argument("--only", action="append", help="Run only this benchmark (can be given more than once)")
+    parser.add_argument("--html-parser", choices=["lxml", "html.parser"], default=event_scraper.HTML_PARSER,
+                        help=f"HTML parser backend (default: {event_scraper.HTML_PARSER})")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument("--compare", help="Earlier JSON results to compare the p50 latencies against")
+    args = parser.parse_args(argv)
+
+    event_scraper.set_html_parser(args.html_parser)
+    install_fixture_session()
+    benchmarks = build_benchmarks()
+
+    results = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'html_parser': event_scraper.get_html_parser(),
+            'repeat': args.repeat,
+        },
+        'benchmarks': {}
+    }
+    for name, (function, arguments, fresh_pages) in benchmarks.items():
+        if args.only and name not in args.only:
+            continue
+        # The extractors log every step; keep that out of the timings' output
+        with contextlib.redirect_stdout(io.StringIO()):
+            results['benchmarks'][name] = run_benchmark(function, arguments, fresh_pages, args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"Comparing with {args.compare} (commit {baseline.get('meta', {}).get('commit')})")
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,36 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException, TimeoutException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException, TimeoutException, StaleElementReferenceException
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from bs4.filter import ElementFilter
 import re
 import time
+import argparse
+import threading
+import sys
 import openpyxl
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from collections import deque, OrderedDict, Counter
+from contextlib import contextmanager
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait as wait_futures, TimeoutError as FutureTimeoutError
 from urllib.parse import urljoin, urlparse
 
 import openai
 import os
+import json
+import sqlite3
+import hashlib
 from dotenv import load_dotenv
 
+try:
+    import lxml
+except ImportError:  # Optional: falls back to the pure-Python html.parser
+    lxml = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -24,8 +42,13 @@ global event_counter
 
 # --- CONFIGURATION ---
 URL = "https://thetradeshowcalendar.com/orbus/index.php?"
-WAIT_SECONDS = 7  # Increase if your internet is slow or the table loads slowly
-CONTACT_SCRAPE_DELAY = 2  # Delay between website visits to be respectful
+WAIT_SECONDS = 30  # Longest to wait for the results table after a page load or click (it is read as soon as it is ready)
+CONTACT_SCRAPE_DELAY = 2  # Minimum seconds between requests to the same website host, to be respectful
+CONTACT_CRAWL_PAGES = 3  # Candidate contact/about pages fetched concurrently when the homepage has no email
+CONTACT_CRAWL_SECONDS = 10  # Per-event time budget for that crawl (requests still respect CONTACT_SCRAPE_DELAY)
+CONTACT_CRAWL_BYTES = 3 * 1024 * 1024  # Per-event download budget for that crawl
+LISTING_SESSIONS = 3  # Months listed in parallel, each in its own HTTP session / browser
+LISTING_BACKEND = "http"  # "http" replays the calendar search without a browser (Selenium is the fallback); "selenium" always uses Chrome
 
 # OpenAI Configuration - Will be provided at runtime
 # No global API key - all functions accept api_key parameter
@@ -33,389 +56,1669 @@ CONTACT_SCRAPE_DELAY = 2  # Delay between website visits to be respectful
 # Token counter for ChatGPT usage
 chatgpt_token_count = 0
 
+# ChatGPT settings; bump the prompt version whenever the prompt changes so cached answers are not reused
+CHATGPT_MODEL = "gpt-4o"
+CHATGPT_PROMPT_VERSION = "1"
+
+# Shared by the single-event and batch prompts (both are covered by CHATGPT_PROMPT_VERSION)
+CHATGPT_SYSTEM_PROMPT = "You are a helpful assistant that extracts company names from trade show event information. Look for the main organizing company or association. Be more aggressive in extracting company names - many event names contain the company name."
+CHATGPT_EXAMPLES = """Examples:
+- "American Academy of Family Physicians - AAFP FUTURE" → "American Academy of Family Physicians"
+- "The Foodservice Conference - International Fresh Produce Association" → "International Fresh Produce Association"
+- "Black Hat USA" → "Black Hat"
+- "Louisiana Restaurant Association - LRA Showcase" → "Louisiana Restaurant Association"
+- "RE+ Storage" → "RE+"
+- "Abilities Expo - Houston" → "Abilities Expo"
+- "The Foodservice Conference" → "International Fresh Produce Association" (from context)
+
+Look for:
+1. The main organizing company/association before any dash or hyphen
+2. The company name that appears before "Conference", "Expo", "Show", "Event"
+3. The primary organization hosting the event"""
+UNKNOWN_COMPANY_ANSWERS = ['unknown', 'none', 'n/a', 'not found', 'cannot determine', 'no company found', '']
+CHATGPT_BATCH_SIZE = 20  # Events per batched ChatGPT request (1 sends every event on its own)
+
+# Rule-based company-name resolver (runs before ChatGPT and website scraping)
+RULES_CONFIDENCE_THRESHOLD = 0.8  # Rule answers below this score still go to ChatGPT / the website
+ORGANIZATION_WORDS = r'Association|Associations|Institute|Society|Academy|Council|Federation|Alliance|Foundation|Chamber|Coalition|League|Union|Guild|Organization|Board|College|Consortium'
+EVENT_WORDS = r'Conference|Expo|Exposition|Show|Showcase|Summit|Forum|Symposium|Congress|Convention|Meeting|Annual|Fair|Week|Event|Festival'
+GENERIC_EVENT_NAME_WORDS = r'The|Trade|International|National|Regional|Global|World|Industry|Business|Consumer|Public|Home|New|Big|Great|Grand|Mega|Super|Spring|Summer|Fall|Autumn|Winter|Holiday'
+_ORGANIZATION_RE = re.compile(rf'\b(?:{ORGANIZATION_WORDS})\b')
+_ORGANIZATION_TAIL = rf"\s+(?:of|for|on)(?:\s+the)?(?:\s+(?!(?:{EVENT_WORDS})\b)[A-Z][a-z][\w&'.+-]*)+"
+# Organization phrase at the start of a name, e.g. "National Association of Broadcasters" in "National Association of Broadcasters Show".
+# The keyword needs a qualifier word before it or an "of/for X" tail (group "bare"), so "Board" in "Board Game Expo" is no organization.
+_LEADING_ORGANIZATION_RE = re.compile(
+    rf"^((?:The\s+)?(?:"
+    rf"(?:(?!The\s)[A-Z][\w&'.+-]*\s+)+?(?:{ORGANIZATION_WORDS})\b(?:{_ORGANIZATION_TAIL})?"
+    rf"|(?P<bare>(?:{ORGANIZATION_WORDS}){_ORGANIZATION_TAIL})))"
+)
+_EVENT_PREFIX_RE = re.compile(rf'^(?:(?:19|20)\d{{2}}\s+)?(?:{EVENT_WORDS})\b')
+# Brand-style expo names: "Abilities Expo", but not "Trade Show" or "International Expo"
+_BRAND_EVENT_SUFFIX_RE = re.compile(r'\b(?:Expo|Exposition|Show)$')
+_GENERIC_EVENT_NAME_WORD_RE = re.compile(
+    rf'^(?:{GENERIC_EVENT_NAME_WORDS}|{EVENT_WORDS}|(?:19|20)\d{{2}}|\d+(?:st|nd|rd|th))$', re.IGNORECASE
+)
+_NAME_SPLIT_RE = re.compile(r'\s+[-–—|]\s+')
+
+# Persistent cache of ChatGPT company-name answers (see CompanyNameCache)
+CHATGPT_CACHE_PATH = "chatgpt_cache.db"
+chatgpt_cache_hits = 0
+chatgpt_cache_misses = 0
+_chatgpt_cache = None
+
 # Event counter for processing limited events
 event_counter = 0
 MAX_EVENTS = 600  # Limit to 20 events
+ENRICHMENT_WORKERS = 8  # Number of events enriched concurrently (ChatGPT + website lookups)
+
+# Guards chatgpt_token_count when enrichment runs on several worker threads
+_token_lock = threading.Lock()
+
+# HTTP settings shared by every website fetch
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+HTTP_TIMEOUT = 10  # Seconds to wait for a website to respond
+HTTP_VERIFY_TLS = False  # Many event websites have broken certificate chains
+HTTP_POOL_HOSTS = 100  # Number of hosts to keep connection pools for
+HTTP_POOL_SIZE = ENRICHMENT_WORKERS  # Keep-alive connections per host
+HTTP_MAX_PAGE_BYTES = 2 * 1024 * 1024  # Website pages are downloaded (and parsed) only up to this size
+HTTP_HTML_TYPES = ('text/html', 'application/xhtml+xml', 'text/plain')  # Anything else (PDFs, images, ...) is rejected by header
+
+if not HTTP_VERIFY_TLS:
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+_http_session = None
+_http_session_lock = threading.Lock()
+_openai_clients = {}
+
+# Crash-safe record of finished events, used to resume interrupted runs (see EventJournal)
+JOURNAL_PATH = "events_journal.jsonl"
+
+# Enrichment results of earlier runs; unchanged events are not enriched again (see EventHistory)
+EVENT_HISTORY_PATH = "event_history.db"
+
+# Spreadsheet output, streamed row by row (see ExcelEventWriter)
+EXCEL_PATH = "events.xlsx"
+EXCEL_SHEET_TITLE = "US Events with Contact Info"
+EXCEL_HEADERS = [
+    "Event Name", "Dates", "City", "Country", "Attendance", "Exhibitors",
+    "Website", "Email", "Company Name", "Company Name Source"
+]
+
+# Per-host politeness for website fetches (see HostRateLimiter)
+_host_limiter = None
+
+# On-disk website cache reused across runs (see HttpCache)
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_PATH = "http_cache.db"
+HTTP_CACHE_TTL = 7 * 24 * 3600  # Seconds before a cached page is revalidated (unless the site sets max-age)
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024  # Least recently used pages are evicted above this size
+_http_cache = None
+
+# HTML parsing: "lxml" (C-based, several times faster) or "html.parser" (pure Python, always available)
+HTML_PARSER = "lxml"
+
+# Parsed pages shared by company-name and contact extraction within a run
+PAGE_CACHE_SIZE = 64  # Most recent pages kept in memory (each holds a parsed tree)
+_page_cache = OrderedDict()
+_page_cache_lock = threading.Lock()
+
+# Per-stage timings, downloaded bytes, errors and cache hits of the current run (see record_stage)
+METRICS_REPORT_PATH = "run_metrics.json"
+METRICS_PROMETHEUS_PATH = ""  # Also write the metrics in Prometheus text format here (e.g. for node_exporter's textfile collector); "" disables
+METRICS_WRITE_EVERY = 100  # Events between refreshes of the metric files during a run, so long runs can be watched
+METRIC_STAGES = [
+    'listing_page', 'listing_wait', 'row_parse', 'chatgpt_batch', 'chatgpt_single',
+    'website_fetch', 'host_wait', 'contact_crawl', 'event_enrichment'
+]
+_stage_metrics = {}
+_stage_metrics_lock = threading.Lock()
+_metrics_started = time.time()
+
+def reset_metrics():
+    """Forget all stage metrics (called at the start of each run)."""
+    global _metrics_started
+    with _stage_metrics_lock:
+        _stage_metrics.clear()
+        _metrics_started = time.time()
+
+def record_stage(stage, seconds=None, nbytes=0, error=False, cache_hit=False):
+    """Record one call of a pipeline stage: its duration (None for no latency sample), bytes, error and cache hit."""
+    with _stage_metrics_lock:
+        stats = _stage_metrics.get(stage)
+        if stats is None:
+            stats = _stage_metrics[stage] = {'durations': [], 'errors': 0, 'cache_hits': 0, 'bytes': 0}
+        if seconds is not None:
+            stats['durations'].append(seconds)
+        stats['bytes'] += nbytes
+        stats['errors'] += bool(error)
+        stats['cache_hits'] += bool(cache_hit)
+
+@contextmanager
+def timed_stage(stage):
+    """
+    Time the with-block as one call of stage. The block can set 'bytes' and 'cache_hit' on the
+    yielded dictionary; an exception escaping the block is recorded as an error and re-raised.
+    """
+    info = {'bytes': 0, 'cache_hit': False, 'error': False}
+    start = time.perf_counter()
+    try:
+        yield info
+    except BaseException:
+        info['error'] = True
+        raise
+    finally:
+        record_stage(stage, time.perf_counter() - start, info['bytes'], info['error'], info['cache_hit'])
+
+def _percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def get_metrics_report(events=None):
+    """
+    Return the run's metrics: per stage the call count, errors, cache hits, bytes and latency
+    (total, p50/p95/p99 and max, in seconds), plus ChatGPT usage and page waits.
+    events is the number of events saved, for the overall throughput.
+    """
+    with _stage_metrics_lock:
+        snapshot = {stage: dict(stats, durations=sorted(stats['durations'])) for stage, stats in _stage_metrics.items()}
+        started = _metrics_started
+    duration = time.time() - started
+    
+    stages = {}
+    for stage in METRIC_STAGES + sorted(set(snapshot) - set(METRIC_STAGES)):
+        stats = snapshot.get(stage)
+        if stats is None:
+            continue
+        durations = stats['durations']
+        stages[stage] = {
+            'count': len(durations),
+            'errors': stats['errors'],
+            'cache_hits': stats['cache_hits'],
+            'bytes': stats['bytes'],
+            'total_seconds': sum(durations),
+            'p50_seconds': _percentile(durations, 0.50) if durations else 0.0,
+            'p95_seconds': _percentile(durations, 0.95) if durations else 0.0,
+            'p99_seconds': _percentile(durations, 0.99) if durations else 0.0,
+            'max_seconds': durations[-1] if durations else 0.0,
+        }
+    
+    report = {
+        'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(started)),
+        'duration_seconds': duration,
+        'stages': stages,
+        'chatgpt': get_chatgpt_usage(),
+        'listing_waits': get_wait_stats(),
+    }
+    if events is not None:
+        report['events'] = events
+        report['events_per_second'] = events / duration if duration > 0 else 0.0
+    return report
+
+def _write_atomically(path, text):
+    """Write text to a temporary file and rename it over path, so readers never see half a file."""
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+def write_metrics_report(report, path=METRICS_REPORT_PATH, prometheus_path=METRICS_PROMETHEUS_PATH):
+    """Write a get_metrics_report() result as JSON, and in Prometheus text format when prometheus_path is set."""
+    _write_atomically(path, json.dumps(report, indent=2))
+    if prometheus_path:
+        _write_atomically(prometheus_path, format_prometheus_metrics(report))
+
+def format_prometheus_metrics(report):
+    """Render a get_metrics_report() result in the Prometheus text exposition format."""
+    lines = [
+        "# HELP event_scraper_stage_seconds Latency of each pipeline stage call.",
+        "# TYPE event_scraper_stage_seconds summary",
+    ]
+    for stage, stats in report['stages'].items():
+        for quantile, key in (("0.5", 'p50_seconds'), ("0.95", 'p95_seconds'), ("0.99", 'p99_seconds')):
+            lines.append(f'event_scraper_stage_seconds{{stage="{stage}",quantile="{quantile}"}} {stats[key]:.6f}')
+        lines.append(f'event_scraper_stage_seconds_sum{{stage="{stage}"}} {stats["total_seconds"]:.6f}')
+        lines.append(f'event_scraper_stage_seconds_count{{stage="{stage}"}} {stats["count"]}')
+    for name, key, help_text in (
+        ("errors", 'errors', "Stage calls that failed."),
+        ("cache_hits", 'cache_hits', "Stage calls answered from a cache."),
+        ("bytes", 'bytes', "Bytes downloaded or parsed by each stage."),
+    ):
+        lines.append(f"# HELP event_scraper_stage_{name}_total {help_text}")
+        lines.append(f"# TYPE event_scraper_stage_{name}_total counter")
+        for stage, stats in report['stages'].items():
+            lines.append(f'event_scraper_stage_{name}_total{{stage="{stage}"}} {stats[key]}')
+    
+    lines += [
+        "# HELP event_scraper_run_duration_seconds Duration of the run so far.",
+        "# TYPE event_scraper_run_duration_seconds gauge",
+        f"event_scraper_run_duration_seconds {report['duration_seconds']:.3f}",
+        "# HELP event_scraper_chatgpt_tokens_total ChatGPT tokens used by the run.",
+        "# TYPE event_scraper_chatgpt_tokens_total counter",
+        f"event_scraper_chatgpt_tokens_total {report['chatgpt']['tokens']}",
+    ]
+    if 'events' in report:
+        lines += [
+            "# HELP event_scraper_events_total Events saved by the run.",
+            "# TYPE event_scraper_events_total counter",
+            f"event_scraper_events_total {report['events']}",
+        ]
+    return "\n".join(lines) + "\n"
+
+# Opt-in sampling profiler for whole runs or selected stages (see RunProfiler)
+PROFILE_INTERVAL = 0.01  # Seconds between samples of every thread's stack
+PROFILE_STAGES = {  # Stage -> the functions that start it; a sample belongs to a stage while one is on the stack
+    'listing': ['scrape_month_rows'],
+    'listing_wait': ['wait_for_listing_ready'],
+    'row_parse': ['parse_listing_rows'],
+    'chatgpt': ['get_company_names_from_chatgpt_batch', 'get_company_name_from_chatgpt'],
+    'event_enrichment': ['enrich_event'],
+    'company_name': ['extract_company_name_from_soup'],
+    'contact_info': ['extract_contact_info'],
+    'contact_crawl': ['crawl_contact_pages'],
+    'website_fetch': ['fetch_url'],
+    'html_parse': ['make_soup'],
+    'email_scan': ['scan_emails'],
+}
+
+def parse_profile_stages(text):
+    """Turn "all" (or "") into None and "stage,stage" into a list. Raises ValueError for unknown stages."""
+    names = [name.strip() for name in (text or '').split(',') if name.strip()]
+    if not names or 'all' in names:
+        return None
+    unknown = [name for name in names if name not in PROFILE_STAGES]
+    if unknown:
+        raise ValueError(f"Unknown profile stage(s): {', '.join(unknown)} (choose from {', '.join(PROFILE_STAGES)})")
+    return names
+
+class RunProfiler:
+    """
+    Wall-clock sampling profiler covering every thread of a run.
+    A background thread samples all stacks each interval, so network waits show up next to
+    parsing and regex work. Each sample counts toward every profiled stage whose entry function
+    is on the stack (as a stack starting at that function) and, when the whole run is profiled,
+    toward "all" with its full stack. Output is collapsed stacks ("frame;frame;frame count"), as
+    read by flamegraph.pl, inferno and speedscope.
+    """
+    
+    def __init__(self, stages=None, interval=PROFILE_INTERVAL):
+        self.whole_run = not stages
+        self.stages = list(PROFILE_STAGES) if self.whole_run else list(stages)
+        self.interval = interval
+        self.samples = 0
+        self.counts = {stage: Counter() for stage in self.stages}
+        self.counts['all'] = Counter()
+        self._entry_points = {}
+        for stage in self.stages:
+            for function_name in PROFILE_STAGES[stage]:
+                self._entry_points[globals()[function_name].__code__] = stage
+        self._labels = {}
+        self._stop_event = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="run-profiler", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+    
+    def _label(self, code):
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+        return label
+    
+    def _run(self):
+        own_thread = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != own_thread:
+                    self._record(frame)
+            self.samples += 1
+    
+    def _record(self, frame):
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        labels = [self._label(code) for code in codes]
+        if self.whole_run:
+            self.counts['all'][';'.join(labels)] += 1
+        seen = set()
+        for position, code in enumerate(codes):
+            stage = self._entry_points.get(code)
+            if stage is not None and stage not in seen:
+                seen.add(stage)
+                self.counts[stage][';'.join(labels[position:])] += 1
+    
+    def top_functions(self, stage='all', limit=10):
+        """Return [(frame label, share of the stage's samples)] for the functions most often on top of the stack."""
+        leaves = Counter()
+        for stack, count in self.counts.get(stage, {}).items():
+            leaves[stack.rsplit(';', 1)[-1]] += count
+        total = sum(leaves.values())
+        return [(label, count / total) for label, count in leaves.most_common(limit)] if total else []
+    
+    def write(self, output_path=EXCEL_PATH):
+        """
+        Write one <name>_profile_<stage>.folded file per stage with samples, next to output_path
+        (the spreadsheet). Returns the paths written.
+        """
+        base = os.path.splitext(os.path.abspath(output_path))[0]
+        paths = []
+        for stage, counts in self.counts.items():
+            if not counts:
+                continue
+            path = f"{base}_profile_{stage}.folded"
+            with open(path, 'w', encoding='utf-8') as f:
+                for stack, count in counts.most_common():
+                    f.write(f"{stack} {count}\n")
+            paths.append(path)
+        return paths
+
+class HttpCache:
+    """
+    SQLite-backed cache of website responses shared across runs.
+    Entries expire after their TTL and are then revalidated with ETag/Last-Modified;
+    once the stored bodies exceed max_bytes the least recently used entries are evicted.
+    """
+    
+    def __init__(self, path=HTTP_CACHE_PATH, ttl=HTTP_CACHE_TTL, max_bytes=HTTP_CACHE_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                headers TEXT,
+                body BLOB,
+                size INTEGER,
+                expires_at REAL,
+                last_access REAL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+        self.conn.commit()
+        # Running total of the stored body sizes, so stores do not have to sum the whole table
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+    
+    @staticmethod
+    def _key(url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+    
+    def _entry_ttl(self, headers):
+        """Use the site's Cache-Control max-age when it gives one, otherwise the default TTL."""
+        cache_control = headers.get('Cache-Control', '').lower()
+        match = re.search(r'max-age=(\d+)', cache_control)
+        if match:
+            return int(match.group(1))
+        return self.ttl
+    
+    def get(self, url):
+        """Return the cached entry for url as a dictionary, or None."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT headers, body, expires_at FROM responses WHERE key = ?", (self._key(url),)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), self._key(url))
+            )
+            self.conn.commit()
+        return {
+            'headers': json.loads(row[0]),
+            'body': row[1],
+            'fresh': row[2] > time.time()
+        }
+    
+    def store(self, url, response):
+        """Store a successful response, then evict old entries if the cache is over its size cap."""
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control:
+            return
+        
+        headers = {
+            name: response.headers[name]
+            for name in ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control')
+            if name in response.headers
+        }
+        body = response.content
+        now = time.time()
+        key = self._key(url)
+        with self.lock:
+            old = self.conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, url, json.dumps(headers), body, len(body), now + self._entry_ttl(headers), now)
+            )
+            self.total_bytes += len(body) - (old[0] if old else 0)
+            self._evict()
+            self.conn.commit()
+    
+    def touch(self, url, headers):
+        """Mark an entry fresh again after the site answered 304 Not Modified."""
+        with self.lock:
+            self.conn.execute(
+                "UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?",
+                (time.time() + self._entry_ttl(headers), time.time(), self._key(url))
+            )
+            self.conn.commit()
+    
+    def _evict(self):
+        if self.total_bytes <= self.max_bytes:
+            return
+        cursor = self.conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC")
+        evicted = []
+        for key, size in cursor:
+            evicted.append((key,))
+            self.total_bytes -= size
+            if self.total_bytes <= self.max_bytes:
+                break
+        cursor.close()
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+    
+    def clear(self):
+        """Delete every cached response."""
+        with self.lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.commit()
+            self.conn.execute("VACUUM")
+            self.total_bytes = 0
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class HostRateLimiter:
+    """
+    Space out requests to the same host by at least interval seconds.
+    Each call reserves the next free slot for its host, so concurrent workers never wait
+    on requests to other hosts.
+    """
+    
+    def __init__(self, interval=CONTACT_SCRAPE_DELAY):
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.next_allowed = {}
+    
+    @staticmethod
+    def host_key(url):
+        host = urlparse(url).netloc.lower()
+        return host[4:] if host.startswith('www.') else host
+    
+    def wait(self, url, cancel=None):
+        """
+        Block until a request to url's host is allowed. Returns the seconds waited.
+        cancel is an optional threading.Event that ends the wait early; the slot is then given
+        back unless a later request has already reserved the one after it.
+        """
+        if self.interval <= 0:
+            return 0.0
+        host = self.host_key(url)
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_allowed.get(host, 0.0))
+            self.next_allowed[host] = slot + self.interval
+        delay = slot - now
+        if delay <= 0:
+            return 0.0
+        if cancel is None:
+            time.sleep(delay)
+        elif cancel.wait(delay):
+            with self.lock:
+                if self.next_allowed.get(host) == slot + self.interval:
+                    self.next_allowed[host] = slot
+            return time.monotonic() - now
+        return delay
+
+def set_host_delay(seconds):
+    """Set the minimum delay between requests to the same website host (0 disables it)."""
+    global _host_limiter
+    _host_limiter = HostRateLimiter(seconds)
+
+def configure_http_cache(enabled=HTTP_CACHE_ENABLED, path=HTTP_CACHE_PATH, clear=False):
+    """
+    Turn the on-disk website cache on or off for the following fetches.
+    With clear=True all cached responses are deleted first.
+    """
+    global _http_cache
+    if _http_cache is not None:
+        _http_cache.close()
+        _http_cache = None
+    
+    if clear and os.path.exists(path):
+        cache = HttpCache(path)
+        cache.clear()
+        cache.close()
+        print("Cleared website cache")
+    
+    if enabled:
+        _http_cache = HttpCache(path)
+
+def _cached_response(url, entry, max_bytes=HTTP_MAX_PAGE_BYTES):
+    """Build a requests.Response from a cache entry so callers cannot tell the difference."""
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers.update(entry['headers'])
+    response._content = entry['body'][:max_bytes]
+    response.truncated = len(entry['body']) >= max_bytes  # Stored bodies were already capped
+    response.budget_cut = False
+    response.from_cache = True
+    return response
+
+def get_http_session():
+    """
+    Return the shared requests session used for all website fetches.
+    Connections are pooled per host and kept alive, so repeat visits skip the TCP/TLS handshake.
+    """
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            _http_session = new_http_session()
+        return _http_session
+
+def new_http_session():
+    """Create a session with the shared user agent, TLS settings and connection pooling."""
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+    session.verify = HTTP_VERIFY_TLS
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_HOSTS, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def close_http_session():
+    """Close the shared session and drop its pooled connections."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is not None:
+            _http_session.close()
+            _http_session = None
+
+class UnsupportedContentError(requests.RequestException):
+    """Raised when a website answers with something other than an HTML page (e.g. a PDF)."""
+
+def _check_content_type(url, headers):
+    """Reject non-HTML responses from their Content-Type header, before the body is read."""
+    content_type = headers.get('Content-Type', '').split(';')[0].strip().lower()
+    if content_type and content_type not in HTTP_HTML_TYPES:
+        raise UnsupportedContentError(f"Skipped {url}: {content_type} is not an HTML page")
+
+class ByteBudgetExceeded(requests.RequestException):
+    """Raised when a fetch starts after its shared ByteBudget is used up or closed."""
+
+class ByteBudget:
+    """
+    Download allowance shared by concurrent fetches (see crawl_contact_pages).
+    Every fetch claims bytes as its chunks arrive, so together they never keep more than limit;
+    once the allowance is used up or the budget is closed, the remaining fetches stop reading.
+    """
+    
+    def __init__(self, limit):
+        self.limit = limit
+        self.used = 0
+        self.closed = threading.Event()  # Also ends host-limiter waits of fetches using this budget
+        self.lock = threading.Lock()
+    
+    def take(self, size):
+        """Claim up to size bytes. Returns how many were granted (0 once exhausted or closed)."""
+        with self.lock:
+            if self.closed.is_set():
+                return 0
+            granted = max(0, min(size, self.limit - self.used))
+            self.used += granted
+            return granted
+    
+    @property
+    def exhausted(self):
+        return self.closed.is_set() or self.used >= self.limit
+    
+    def close(self):
+        """Stop every fetch still reading against this budget at its next chunk or host wait."""
+        self.closed.set()
+
+def _read_capped(response, max_bytes, budget=None):
+    """
+    Stream a response body into response.content, stopping at max_bytes or when the shared
+    budget (a ByteBudget) grants no more bytes; response.budget_cut tells whether it did.
+    """
+    chunks = []
+    size = 0
+    budget_cut = False
+    for chunk in response.iter_content(64 * 1024):
+        if budget is not None:
+            wanted = min(len(chunk), max_bytes - size)
+            granted = budget.take(wanted)
+            if granted < wanted:
+                chunk = chunk[:granted]
+                budget_cut = True
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= max_bytes or budget_cut:
+            break
+    response._content = b''.join(chunks)[:max_bytes]
+    response.truncated = size > max_bytes or budget_cut or not response._content_consumed
+    response.budget_cut = budget_cut
+
+def fetch_url(url, timeout=HTTP_TIMEOUT, max_bytes=HTTP_MAX_PAGE_BYTES, budget=None):
+    """
+    GET a website page through the shared session, using the on-disk cache when it is enabled.
+    The body is streamed and kept only up to max_bytes (response.truncated tells whether it was
+    cut); non-HTML responses are rejected by header with UnsupportedContentError.
+    With a ByteBudget the download also stops when the budget runs out (response.budget_cut),
+    and ByteBudgetExceeded is raised instead of sending the request once it is used up or
+    closed, also when that happens during the host wait.
+    Raises requests exceptions on network errors and HTTP error statuses.
+    """
+    cache = _http_cache
+    entry = cache.get(url) if cache is not None else None
+    if entry is not None and entry['fresh']:
+        _check_content_type(url, entry['headers'])
+        record_stage('website_fetch', cache_hit=True)
+        return _cached_response(url, entry, max_bytes)
+    
+    # Stale entry: ask the site whether it changed instead of downloading it again
+    headers = {}
+    if entry is not None:
+        if 'ETag' in entry['headers']:
+            headers['If-None-Match'] = entry['headers']['ETag']
+        if 'Last-Modified' in entry['headers']:
+            headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+    
+    # Only requests that reach the network count against the host's politeness budget
+    if _host_limiter is not None and _host_limiter.interval > 0:
+        if budget is not None and budget.exhausted:
+            raise ByteBudgetExceeded(f"Download budget used up before {url}")
+        record_stage('host_wait', _host_limiter.wait(url, budget.closed if budget is not None else None))
+    if budget is not None and budget.exhausted:
+        raise ByteBudgetExceeded(f"Download budget used up before {url}")
+    
+    with timed_stage('website_fetch') as stage:
+        response = get_http_session().get(url, timeout=timeout, headers=headers, stream=True)
+        try:
+            if entry is not None and response.status_code == 304:
+                stage['cache_hit'] = True
+                cache.touch(url, response.headers)
+                _check_content_type(url, entry['headers'])
+                return _cached_response(url, entry, max_bytes)
+            
+            response.raise_for_status()
+            _check_content_type(url, response.headers)
+            _read_capped(response, max_bytes, budget)
+            stage['bytes'] = len(response.content)
+        finally:
+            # Hands a fully read connection back to the pool; a cut-off one is dropped
+            response.close()
+    
+    # A body cut short by the budget is not the page, so it is not cached
+    if cache is not None and response.status_code == 200 and not response.budget_cut:
+        cache.store(url, response)
+    return response
+
+def set_html_parser(name):
+    """Choose the HTML parser backend ("lxml" or "html.parser")."""
+    global HTML_PARSER
+    HTML_PARSER = name
+
+def get_html_parser():
+    """The configured parser backend, or html.parser when lxml is not installed."""
+    if HTML_PARSER == "lxml" and lxml is None:
+        return "html.parser"
+    return HTML_PARSER
+
+def make_soup(markup, parse_only=None):
+    """Parse markup with the configured backend, optionally building only part of the tree."""
+    return BeautifulSoup(markup, get_html_parser(), parse_only=parse_only)
+
+class PageRegionFilter(ElementFilter):
+    """
+    Partial parsing for event websites: only the elements the extractors read become tags.
+    Keeps <meta>, <title>, <a href> and div/section/footer elements whose class marks an
+    about/contact or footer region (with everything inside them); the rest of the page is
+    tokenized but never built into the tree.
+    """
+    
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        if name in ('meta', 'title'):
+            return True
+        if name == 'a':
+            return 'href' in attrs
+        if name in ('div', 'section', 'footer'):
+            classes = attrs.get('class')
+            if not classes:
+                return False
+            if not isinstance(classes, str):
+                classes = ' '.join(classes)
+            return bool(_ABOUT_SECTION_CLASS_RE.search(classes) or _FOOTER_CLASS_RE.search(classes))
+        return False
+    
+    def allow_string_creation(self, string):
+        # Text outside the kept elements is never read from the tree
+        return False
+
+def fetch_page(url, parse=True, budget=None):
+    """
+    Fetch and parse a page once per run.
+    Returns a dictionary with the raw bytes ('content', scanned for emails) and the partially
+    parsed tree with scripts and styles removed ('soup', see PageRegionFilter).
+    With parse=False the page is only fetched and 'soup' may be None (e.g. contact pages that
+    are only scanned for emails); a later call with parse=True fills it in.
+    Repeat calls for the same URL reuse the artifact; a failed fetch is remembered and
+    re-raised instead of retried. budget is passed to fetch_url; pages it cut short and
+    fetches it refused are not remembered.
+    """
+    with _page_cache_lock:
+        page = _page_cache.get(url)
+        if page is not None:
+            _page_cache.move_to_end(url)
+    
+    if page is None:
+        complete = True
+        try:
+            response = fetch_url(url, budget=budget)
+            complete = not response.budget_cut
+            page = {
+                'url': url,
+                'content': response.content,
+                'soup': None,
+                'error': None
+            }
+        except ByteBudgetExceeded as e:
+            complete = False
+            page = {'url': url, 'content': b'', 'soup': None, 'error': e}
+        except Exception as e:
+            page = {'url': url, 'content': b'', 'soup': None, 'error': e}
+        
+        if complete:
+            with _page_cache_lock:
+                _page_cache[url] = page
+                while len(_page_cache) > PAGE_CACHE_SIZE:
+                    _page_cache.popitem(last=False)
+    
+    if page['error'] is not None:
+        raise page['error']
+    
+    if parse and page['soup'] is None:
+        soup = make_soup(page['content'], parse_only=PageRegionFilter())
+        for script in soup(["script", "style"]):
+            script.decompose()
+        page['soup'] = soup
+    return page
+
+def clear_page_cache():
+    """Forget all parsed pages (called at the start of each run)."""
+    with _page_cache_lock:
+        _page_cache.clear()
+
+def get_openai_client(api_key):
+    """Return a cached OpenAI client for this API key so its HTTP connections are reused."""
+    with _http_session_lock:
+        client = _openai_clients.get(api_key)
+        if client is None:
+            client = openai.OpenAI(api_key=api_key)
+            _openai_clients[api_key] = client
+        return client
+
+class CompanyNameCache:
+    """
+    SQLite-backed memo of ChatGPT company-name answers shared across runs.
+    Keyed by the normalized event name plus the model and prompt version.
+    """
+    
+    def __init__(self, path=CHATGPT_CACHE_PATH):
+        self.path = path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS company_names (
+                event_key TEXT,
+                model TEXT,
+                prompt_version TEXT,
+                company_name TEXT,
+                created_at REAL,
+                PRIMARY KEY (event_key, model, prompt_version)
+            )
+        """)
+        self.conn.commit()
+    
+    def get(self, event_name, model=CHATGPT_MODEL, prompt_version=CHATGPT_PROMPT_VERSION):
+        """Return the cached company name ('' for a cached 'Unknown'), or None on a miss."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT company_name FROM company_names WHERE event_key = ? AND model = ? AND prompt_version = ?",
+                (normalize_event_name(event_name), model, prompt_version)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def store(self, event_name, company_name, model=CHATGPT_MODEL, prompt_version=CHATGPT_PROMPT_VERSION):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO company_names VALUES (?, ?, ?, ?, ?)",
+                (normalize_event_name(event_name), model, prompt_version, company_name, time.time())
+            )
+            self.conn.commit()
+    
+    def clear(self):
+        with self.lock:
+            self.conn.execute("DELETE FROM company_names")
+            self.conn.commit()
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def normalize_event_name(event_name):
+    """
+    Normalize an event name for cache lookups so yearly editions share an entry.
+    e.g. "Abilities Expo - Houston 2025" -> "abilities expo - houston"
+    """
+    name = event_name.lower()
+    name = re.sub(r'\b(?:19|20)\d{2}\b', ' ', name)
+    return ' '.join(name.split())
+
+def configure_chatgpt_cache(enabled=True, path=CHATGPT_CACHE_PATH, clear=False):
+    """
+    Turn the persistent ChatGPT answer cache on or off.
+    With clear=True all cached answers are deleted first.
+    """
+    global _chatgpt_cache
+    if _chatgpt_cache is not None:
+        _chatgpt_cache.close()
+        _chatgpt_cache = None
+    
+    if clear and os.path.exists(path):
+        cache = CompanyNameCache(path)
+        cache.clear()
+        cache.close()
+        print("Cleared ChatGPT cache")
+    
+    if enabled:
+        _chatgpt_cache = CompanyNameCache(path)
 
+def reset_chatgpt_usage():
+    """Reset the ChatGPT token and cache counters at the start of a run."""
+    global chatgpt_token_count, chatgpt_cache_hits, chatgpt_cache_misses
+    with _token_lock:
+        chatgpt_token_count = 0
+        chatgpt_cache_hits = 0
+        chatgpt_cache_misses = 0
 
+def get_chatgpt_usage():
+    """Return the ChatGPT token and cache counters for the current run."""
+    return {
+        'tokens': chatgpt_token_count,
+        'cache_hits': chatgpt_cache_hits,
+        'cache_misses': chatgpt_cache_misses
+    }
 
-def get_company_name_from_chatgpt(event_name, event_info, api_key=None):
+def get_company_name_from_chatgpt(event_name, event_info, api_key=None, check_cache=True):
     """
     Use ChatGPT to extract the company/organizer name from event information.
+    Answers are memoized in the persistent cache, so known events skip the API call.
+    check_cache=False skips the lookup (and its hit/miss count) when a batched request
+    already missed the cache for this event.
+    Returns '' when ChatGPT does not know the company, or None when it could not be asked
+    (no API key or a failed request).
     """
+    global chatgpt_cache_hits, chatgpt_cache_misses
+    cache = _chatgpt_cache
+    if cache is not None and check_cache:
+        cached_name = cache.get(event_name)
+        with _token_lock:
+            if cached_name is not None:
+                chatgpt_cache_hits += 1
+            else:
+                chatgpt_cache_misses += 1
+        if cached_name is not None:
+            record_stage('chatgpt_single', cache_hit=True)
+            return cached_name
+    
     if not api_key:
         print(f"    ERROR: OpenAI API key not provided. Skipping ChatGPT extraction.")
-        return ""
+        return None
     
     try:
         prompt = f"""Extract the company or organizer name from this trade show event.
 
 Event Information: {event_info}
 
-Examples:
-- "American Academy of Family Physicians - AAFP FUTURE" → "American Academy of Family Physicians"
-- "The Foodservice Conference - International Fresh Produce Association" → "International Fresh Produce Association"
-- "Black Hat USA" → "Black Hat"
-- "Louisiana Restaurant Association - LRA Showcase" → "Louisiana Restaurant Association"
-- "RE+ Storage" → "RE+"
-- "Abilities Expo - Houston" → "Abilities Expo"
-- "The Foodservice Conference" → "International Fresh Produce Association" (from context)
-
-Look for:
-1. The main organizing company/association before any dash or hyphen
-2. The company name that appears before "Conference", "Expo", "Show", "Event"
-3. The primary organization hosting the event
+{CHATGPT_EXAMPLES}
 
 Please provide ONLY the company/organizer name, nothing else. If you can't determine it, respond with 'Unknown'."""
         
-        client = openai.OpenAI(api_key=api_key)
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that extracts company names from trade show event information. Look for the main organizing company or association. Be more aggressive in extracting company names - many event names contain the company name. Respond with only the company name or 'Unknown' if you can't determine it."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=50,
-            temperature=0.1
-        )
+        client = get_openai_client(api_key)
+        with timed_stage('chatgpt_single'):
+            response = client.chat.completions.create(
+                model=CHATGPT_MODEL,
+                messages=[
+                    {"role": "system", "content": CHATGPT_SYSTEM_PROMPT + " Respond with only the company name or 'Unknown' if you can't determine it."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=50,
+                temperature=0.1
+            )
         
         company_name = response.choices[0].message.content.strip()
         
         # Track token usage
-        global chatgpt_token_count
-        if hasattr(response, 'usage') and response.usage:
-            tokens_used = response.usage.total_tokens
-            chatgpt_token_count += tokens_used
+        _track_token_usage(response)
         
         # Clean up the response - only filter out actual "unknown" responses
-        if company_name.lower() in ['unknown', 'none', 'n/a', 'not found', 'cannot determine', 'no company found', '']:
-            return ""
+        if company_name.lower() in UNKNOWN_COMPANY_ANSWERS:
+            company_name = ""
+        
+        if cache is not None:
+            cache.store(event_name, company_name)
         
         return company_name
         
     except Exception as e:
         print(f"Error getting company name from ChatGPT: {e}")
-        return ""
+        return None
 
-def extract_company_name_from_website(website_url, event_name):
+def get_company_names_from_chatgpt_batch(events, api_key=None):
     """
-    Extract company name by scraping the event website with improved accuracy.
+    Ask ChatGPT for the company names of several events in a single request.
+    events is a list of (event_name, event_info) tuples. Returns a list with one entry per event:
+    the company name ('' when ChatGPT answered Unknown), or None when the event is missing from
+    the answer and should fall back to get_company_name_from_chatgpt.
     """
-    if not website_url:
-        return ""
+    global chatgpt_cache_hits, chatgpt_cache_misses
+    results = [None] * len(events)
+    
+    # Answer what we can from the cache; only the misses go to the API
+    cache = _chatgpt_cache
+    to_ask = []
+    for index, (event_name, event_info) in enumerate(events):
+        cached_name = cache.get(event_name) if cache is not None else None
+        if cached_name is not None:
+            results[index] = cached_name
+            with _token_lock:
+                chatgpt_cache_hits += 1
+            record_stage('chatgpt_batch', cache_hit=True)
+        else:
+            to_ask.append(index)
+            if cache is not None:
+                with _token_lock:
+                    chatgpt_cache_misses += 1
+    
+    if not to_ask or not api_key:
+        return results
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(website_url, headers=headers, timeout=10, verify=False)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Look for company name in specific, high-priority locations
-        company_name = ""
-        extraction_methods = []
-        
-        # 1. Check for specific "About" or "Contact" sections first
-        about_sections = soup.find_all(['div', 'section'], class_=re.compile(r'about|contact|company|organization', re.IGNORECASE))
-        about_result = "Not found"
-        for section in about_sections:
-            section_text = section.get_text().lower()
-            # Look for very specific patterns in about sections
-            specific_patterns = [
-                r'organized by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                r'hosted by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                r'sponsored by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                r'presented by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                r'produced by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                r'managed by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                r'we are\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                r'our company\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                r'our organization\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)'
-            ]
-            for pattern in specific_patterns:
-                match = re.search(pattern, section_text)
-                if match:
-                    potential_name = match.group(1).strip()
-                    if len(potential_name) > 3 and not any(word in potential_name.lower() for word in ['conference', 'expo', 'show', 'event', 'the', 'and', 'or']):
-                        company_name = potential_name.title()
-                        about_result = f"Found: {company_name}"
-                        break
-            if company_name:
-                break
-        extraction_methods.append(f"1. About/Contact sections: {about_result}")
+        event_lines = "\n".join(
+            f"{number}. {events[index][1]}" for number, index in enumerate(to_ask, start=1)
+        )
+        prompt = f"""Extract the company or organizer name for each of these trade show events.
+
+Events:
+{event_lines}
+
+{CHATGPT_EXAMPLES}
+
+Respond with a JSON object of the form {{"companies": [{{"id": 1, "company": "..."}}]}} with one entry per event id.
+Use "Unknown" as the company if you can't determine it."""
         
-        # 2. Check footer for company info (often most reliable)
-        footer_result = "Not found"
-        if not company_name:
-            footer = soup.find(['footer', 'div'], class_=re.compile(r'footer|bottom', re.IGNORECASE))
-            if footer:
-                footer_text = footer.get_text()
-                # Look for copyright or company info in footer
-                copyright_patterns = [
-                    r'©\s*\d{4}\s*([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                    r'copyright\s*\d{4}\s*([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                    r'all rights reserved\s*([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                    r'powered by\s+([A-Z][a-zA-Z\s&]+?)(?:\s|\.|,|$)'
-                ]
-                for pattern in copyright_patterns:
-                    match = re.search(pattern, footer_text, re.IGNORECASE)
-                    if match:
-                        potential_name = match.group(1).strip()
-                        if len(potential_name) > 3:
-                            company_name = potential_name.title()
-                            footer_result = f"Found: {company_name}"
-                            break
-        extraction_methods.append(f"2. Footer copyright: {footer_result}")
+        client = get_openai_client(api_key)
+        with timed_stage('chatgpt_batch'):
+            response = client.chat.completions.create(
+                model=CHATGPT_MODEL,
+                messages=[
+                    {"role": "system", "content": CHATGPT_SYSTEM_PROMPT + " Respond only with the requested JSON object."},
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=40 * len(to_ask) + 50,
+                temperature=0.1,
+                response_format={"type": "json_object"}
+            )
         
-        # 3. Check meta tags for organization info
-        og_result = "Not found"
-        org_result = "Not found"
-        author_result = "Not found"
-        desc_result = "Not found"
+        _track_token_usage(response)
         
-        if not company_name:
-            # Check Open Graph site name (often contains company name)
-            og_site_name = soup.find('meta', attrs={'property': 'og:site_name'})
-            if og_site_name:
-                company_name = og_site_name.get('content', '').strip().title()
-                og_result = f"Found: {company_name}"
-            
-            if not company_name:
-                meta_org = soup.find('meta', attrs={'name': 'organization'})
-                if meta_org:
-                    company_name = meta_org.get('content', '').strip().title()
-                    org_result = f"Found: {company_name}"
-            
-            if not company_name:
-                meta_author = soup.find('meta', attrs={'name': 'author'})
-                if meta_author:
-                    author_content = meta_author.get('content', '')
-                    if '@' not in author_content:  # Not an email
-                        company_name = author_content.strip().title()
-                        author_result = f"Found: {company_name}"
-            
-            if not company_name:
-                # Check meta description for company mentions
-                meta_desc = soup.find('meta', attrs={'name': 'description'})
-                if meta_desc:
-                    desc_text = meta_desc.get('content', '').lower()
-                    # Look for "organized by" or "hosted by" patterns in description
-                    desc_patterns = [
-                        r'organized by\s+([a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                        r'hosted by\s+([a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                        r'sponsored by\s+([a-zA-Z\s&]+?)(?:\s|\.|,|$)',
-                        r'presented by\s+([a-zA-Z\s&]+?)(?:\s|\.|,|$)'
-                    ]
-                    for pattern in desc_patterns:
-                        match = re.search(pattern, desc_text)
-                        if match:
-                            potential_name = match.group(1).strip()
-                            if len(potential_name) > 3 and not any(word in potential_name.lower() for word in ['conference', 'expo', 'show', 'event']):
-                                company_name = potential_name.title()
-                                desc_result = f"Found: {company_name}"
-                                break
-        
-        extraction_methods.append(f"3. Open Graph site name: {og_result}")
-        extraction_methods.append(f"4. Organization meta tag: {org_result}")
-        extraction_methods.append(f"5. Author meta tag: {author_result}")
-        extraction_methods.append(f"6. Meta description: {desc_result}")
-        
-        # 7. Check title tag (but be more selective)
-        title_result = "Not found"
-        if not company_name:
-            title = soup.find('title')
-            if title:
-                title_text = title.get_text()
-                # Only extract if title looks like it contains company name
-                if ' - ' in title_text or ' | ' in title_text:
-                    parts = re.split(r'\s*[-|]\s*', title_text)
-                    if len(parts) > 1:
-                        potential_name = parts[0].strip()
-                        if len(potential_name) > 3 and not any(word in potential_name.lower() for word in ['conference', 'expo', 'show', 'event']):
-                            company_name = potential_name.title()
-                            title_result = f"Found: {company_name}"
-        extraction_methods.append(f"7. Title tag: {title_result}")
-        
-        # 8. Check domain name as last resort (but be more careful)
-        domain_result = "Not found"
-        if not company_name:
-            domain = urlparse(website_url).netloc
-            if domain:
-                domain_parts = domain.replace('www.', '').split('.')
-                if len(domain_parts) > 0:
-                    domain_name = domain_parts[0]
-                    # Only use domain if it looks like a company name (not generic)
-                    if len(domain_name) > 3 and not any(word in domain_name.lower() for word in ['event', 'show', 'expo', 'conference', 'trade', 'fair']):
-                        domain_name = domain_name.replace('-', ' ').replace('_', ' ')
-                        company_name = domain_name.title()
-                        domain_result = f"Found: {company_name}"
-        extraction_methods.append(f"8. Domain name: {domain_result}")
-        
-        # Print all extraction methods for this website
-        print(f"  Website extraction methods for {event_name}:")
-        for method in extraction_methods:
-            print(f"    {method}")
-        
-        # Clean up the company name
-        if company_name:
-            # Remove common suffixes
-            suffixes = [' Inc', ' LLC', ' Corp', ' Corporation', ' Company', ' Co', ' Ltd', ' Limited']
-            for suffix in suffixes:
-                if company_name.endswith(suffix):
-                    company_name = company_name[:-len(suffix)]
-                    break
-            
-            # Clean up extra spaces and common words
-            company_name = ' '.join(company_name.split())
+        answer = json.loads(response.choices[0].message.content)
+        for item in answer.get('companies', []):
+            try:
+                number = int(item.get('id'))
+                company_name = str(item.get('company') or '').strip()
+            except (TypeError, ValueError, AttributeError):
+                continue
+            if not 1 <= number <= len(to_ask):
+                continue
             
-            # Remove common prefixes that aren't part of company name
-            prefixes_to_remove = ['The ', 'Welcome to ', 'Home - ', 'About - ']
-            for prefix in prefixes_to_remove:
-                if company_name.startswith(prefix):
-                    company_name = company_name[len(prefix):]
-                    break
-            
-            print(f"  Final result: {company_name}")
-            return company_name
-        
-        print(f"  Final result: Not found")
-        return ""
-        
+            if company_name.lower() in UNKNOWN_COMPANY_ANSWERS:
+                company_name = ""
+            index = to_ask[number - 1]
+            results[index] = company_name
+            if cache is not None:
+                cache.store(events[index][0], company_name)
+    
     except Exception as e:
-        print(f"Error extracting company name from website for {event_name}: {e}")
-        return ""
+        print(f"Error getting company names from ChatGPT batch: {e}")
+    
+    return results
 
-def get_company_name_hybrid(event_name, event_info, website_url="", api_key=None):
+def _track_token_usage(response):
+    """Add the tokens used by a ChatGPT response to chatgpt_token_count."""
+    global chatgpt_token_count
+    if hasattr(response, 'usage') and response.usage:
+        with _token_lock:
+            chatgpt_token_count += response.usage.total_tokens
+
+class PhrasePatternSet:
     """
-    Try ChatGPT first, then fall back to website extraction if ChatGPT fails.
-    Returns tuple: (company_name, source)
+    Ordered "phrase + name" patterns (e.g. "organized by <Name>") compiled once.
+    first_match gives the same answer as trying each pattern's re.search in list order and
+    keeping the first accepted name. The patterns are kept separate rather than joined into
+    one alternation: each starts with a literal phrase, which lets the regex engine skip
+    through the text, while an alternation would be tried at every position.
     """
-    # Try ChatGPT first (faster and more accurate for event names)
-    company_name = get_company_name_from_chatgpt(event_name, event_info, api_key)
     
-    if company_name:
-        return company_name, "ChatGPT"
+    def __init__(self, prefixes, name_pattern, flags=0):
+        self.patterns = [re.compile(rf'{prefix}{name_pattern}(?:\s|\.|,|$)', flags) for prefix in prefixes]
     
-    # Fall back to website extraction if ChatGPT failed
-    if website_url:
-        company_name = extract_company_name_from_website(website_url, event_name)
-        
-        if company_name:
-            return company_name, "Website"
+    def first_match(self, text, accept=None):
+        """Return the stripped name captured by the first accepted pattern, or None."""
+        for pattern in self.patterns:
+            match = pattern.search(text)
+            if match:
+                name = match.group(1).strip()
+                if accept is None or accept(name):
+                    return name
+        return None
+
+# Compiled once for extract_company_name_from_soup, in the original priority order
+_WEBSITE_NAME_PATTERN = r'([A-Z][a-zA-Z\s&]+?)'
+_ABOUT_SECTION_CLASS_RE = re.compile(r'about|contact|company|organization', re.IGNORECASE)
+_ABOUT_NAME_PATTERNS = PhrasePatternSet([
+    r'organized by\s+', r'hosted by\s+', r'sponsored by\s+', r'presented by\s+', r'produced by\s+',
+    r'managed by\s+', r'we are\s+', r'our company\s+', r'our organization\s+'
+], _WEBSITE_NAME_PATTERN)
+_ABOUT_STOP_WORDS = ['conference', 'expo', 'show', 'event', 'the', 'and', 'or']
+_FOOTER_CLASS_RE = re.compile(r'footer|bottom', re.IGNORECASE)
+_FOOTER_NAME_PATTERNS = PhrasePatternSet([
+    r'©\s*\d{4}\s*', r'copyright\s*\d{4}\s*', r'all rights reserved\s*', r'powered by\s+'
+], _WEBSITE_NAME_PATTERN, re.IGNORECASE)
+_DESCRIPTION_NAME_PATTERNS = PhrasePatternSet([
+    r'organized by\s+', r'hosted by\s+', r'sponsored by\s+', r'presented by\s+'
+], r'([a-zA-Z\s&]+?)')
+_GENERIC_EVENT_WORDS = ['conference', 'expo', 'show', 'event']
+_GENERIC_DOMAIN_WORDS = ['event', 'show', 'expo', 'conference', 'trade', 'fair']
+_TITLE_SPLIT_RE = re.compile(r'\s*[-|]\s*')
+_COMPANY_SUFFIXES = [' Inc', ' LLC', ' Corp', ' Corporation', ' Company', ' Co', ' Ltd', ' Limited']
+_COMPANY_PREFIXES = ['The ', 'Welcome to ', 'Home - ', 'About - ']
+# meta attribute (name, value) -> region key
+_NAME_META_TAGS = {
+    ('property', 'og:site_name'): 'og_site_name',
+    ('name', 'organization'): 'organization',
+    ('name', 'author'): 'author',
+    ('name', 'description'): 'description',
+}
+
+def _scan_name_regions(soup):
+    """
+    Walk the document once and collect every region the company-name methods read: all
+    about/contact sections, the first footer, the first of each relevant meta tag and the title.
+    Same elements, in the same document order, as the separate find/find_all calls would return.
+    """
+    regions = {'about': [], 'footer': None, 'title': None}
+    for key in _NAME_META_TAGS.values():
+        regions[key] = None
     
-    return "", "None"
+    for tag in soup.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        name = tag.name
+        if name in ('div', 'section', 'footer'):
+            classes = tag.get('class')
+            if not classes:
+                continue
+            if isinstance(classes, str):
+                classes = [classes]
+            if name != 'footer' and any(_ABOUT_SECTION_CLASS_RE.search(c) for c in classes):
+                regions['about'].append(tag)
+            if regions['footer'] is None and name != 'section' and any(_FOOTER_CLASS_RE.search(c) for c in classes):
+                regions['footer'] = tag
+        elif name == 'meta':
+            for (attribute, value), key in _NAME_META_TAGS.items():
+                if regions[key] is None and tag.get(attribute) == value:
+                    regions[key] = tag
+        elif name == 'title' and regions['title'] is None:
+            regions['title'] = tag
+    return regions
 
-def extract_contact_info(website_url, event_name):
+def extract_company_name_from_website(website_url, event_name):
     """
-    Extract contact information from an event website.
-    Returns a dictionary with contact details.
+    Extract company name by scraping the event website with improved accuracy.
     """
-    contact_info = {
-        'website': website_url,
-        'email': '',
-        'company_name': ''
-    }
+    if not website_url:
+        return ""
     
     try:
-        # Use requests for faster initial check
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(website_url, headers=headers, timeout=10, verify=False)
-        response.raise_for_status()
+        # Shared artifact: already parsed, with script and style elements removed
+        soup = fetch_page(website_url)['soup']
+        return extract_company_name_from_soup(soup, website_url, event_name)
+    except Exception as e:
+        print(f"Error extracting company name from website for {event_name}: {e}")
+        return ""
+
+def extract_company_name_from_soup(soup, website_url, event_name, log=print):
+    """
+    Company-name extraction over an already parsed page, trying eight methods in priority order.
+    The page is walked once to find the regions the methods read, and each region is matched
+    against the precompiled pattern sets above.
+    """
+    company_name = ""
+    extraction_methods = []
+    regions = _scan_name_regions(soup)
+    
+    # 1. Check for specific "About" or "Contact" sections first
+    about_result = "Not found"
+    accept_about = lambda name: len(name) > 3 and not any(word in name.lower() for word in _ABOUT_STOP_WORDS)
+    for section in regions['about']:
+        potential_name = _ABOUT_NAME_PATTERNS.first_match(section.get_text().lower(), accept_about)
+        if potential_name:
+            company_name = potential_name.title()
+            about_result = f"Found: {company_name}"
+            break
+    extraction_methods.append(f"1. About/Contact sections: {about_result}")
+    
+    # 2. Check footer for company info (often most reliable)
+    footer_result = "Not found"
+    if not company_name:
+        footer = regions['footer']
+        if footer:
+            # Look for copyright or company info in footer
+            potential_name = _FOOTER_NAME_PATTERNS.first_match(footer.get_text(), lambda name: len(name) > 3)
+            if potential_name:
+                company_name = potential_name.title()
+                footer_result = f"Found: {company_name}"
+    extraction_methods.append(f"2. Footer copyright: {footer_result}")
+    
+    # 3. Check meta tags for organization info
+    og_result = "Not found"
+    org_result = "Not found"
+    author_result = "Not found"
+    desc_result = "Not found"
+    
+    if not company_name:
+        # Check Open Graph site name (often contains company name)
+        og_site_name = regions['og_site_name']
+        if og_site_name:
+            company_name = og_site_name.get('content', '').strip().title()
+            og_result = f"Found: {company_name}"
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if not company_name:
+            meta_org = regions['organization']
+            if meta_org:
+                company_name = meta_org.get('content', '').strip().title()
+                org_result = f"Found: {company_name}"
         
-        # Look for contact information patterns
-        page_text = soup.get_text().lower()
+        if not company_name:
+            meta_author = regions['author']
+            if meta_author:
+                author_content = meta_author.get('content', '')
+                if '@' not in author_content:  # Not an email
+                    company_name = author_content.strip().title()
+                    author_result = f"Found: {company_name}"
         
-        # Email patterns
-        email_patterns = [
-            r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            r'info@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
-            r'contact@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
-            r'events@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
-            r'sales@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        ]
+        if not company_name:
+            # Check meta description for "organized by" or "hosted by" style mentions
+            meta_desc = regions['description']
+            if meta_desc:
+                potential_name = _DESCRIPTION_NAME_PATTERNS.first_match(
+                    meta_desc.get('content', '').lower(),
+                    lambda name: len(name) > 3 and not any(word in name.lower() for word in _GENERIC_EVENT_WORDS)
+                )
+                if potential_name:
+                    company_name = potential_name.title()
+                    desc_result = f"Found: {company_name}"
+    
+    extraction_methods.append(f"3. Open Graph site name: {og_result}")
+    extraction_methods.append(f"4. Organization meta tag: {org_result}")
+    extraction_methods.append(f"5. Author meta tag: {author_result}")
+    extraction_methods.append(f"6. Meta description: {desc_result}")
+    
+    # 7. Check title tag (but be more selective)
+    title_result = "Not found"
+    if not company_name:
+        title = regions['title']
+        if title:
+            title_text = title.get_text()
+            # Only extract if title looks like it contains company name
+            if ' - ' in title_text or ' | ' in title_text:
+                parts = _TITLE_SPLIT_RE.split(title_text)
+                if len(parts) > 1:
+                    potential_name = parts[0].strip()
+                    if len(potential_name) > 3 and not any(word in potential_name.lower() for word in _GENERIC_EVENT_WORDS):
+                        company_name = potential_name.title()
+                        title_result = f"Found: {company_name}"
+    extraction_methods.append(f"7. Title tag: {title_result}")
+    
+    # 8. Check domain name as last resort (but be more careful)
+    domain_result = "Not found"
+    if not company_name:
+        domain = urlparse(website_url).netloc
+        if domain:
+            domain_parts = domain.replace('www.', '').split('.')
+            if len(domain_parts) > 0:
+                domain_name = domain_parts[0]
+                # Only use domain if it looks like a company name (not generic)
+                if len(domain_name) > 3 and not any(word in domain_name.lower() for word in _GENERIC_DOMAIN_WORDS):
+                    domain_name = domain_name.replace('-', ' ').replace('_', ' ')
+                    company_name = domain_name.title()
+                    domain_result = f"Found: {company_name}"
+    extraction_methods.append(f"8. Domain name: {domain_result}")
+    
+    # Print all extraction methods for this website
+    log(f"  Website extraction methods for {event_name}:")
+    for method in extraction_methods:
+        log(f"    {method}")
+    
+    # Clean up the company name
+    if company_name:
+        # Remove common suffixes
+        for suffix in _COMPANY_SUFFIXES:
+            if company_name.endswith(suffix):
+                company_name = company_name[:-len(suffix)]
+                break
         
-        for pattern in email_patterns:
-            emails = re.findall(pattern, page_text)
-            if emails:
-                contact_info['email'] = emails[0]
+        # Clean up extra spaces and common words
+        company_name = ' '.join(company_name.split())
+        
+        # Remove common prefixes that aren't part of company name
+        for prefix in _COMPANY_PREFIXES:
+            if company_name.startswith(prefix):
+                company_name = company_name[len(prefix):]
                 break
         
+        log(f"  Final result: {company_name}")
+        return company_name
+    
+    log(f"  Final result: Not found")
+    return ""
 
+def resolve_company_name_by_rules(event_name):
+    """
+    Resolve the organizer from the event name alone using simple local rules.
+    Returns tuple: (company_name, confidence) with confidence between 0 and 1 ("", 0.0 if no rule applies).
+    """
+    name = ' '.join(event_name.split())
+    if not name:
+        return "", 0.0
+    
+    def strip_the(text):
+        return text[4:] if text.startswith('The ') and _ORGANIZATION_RE.search(text[4:]) is None else text
+    
+    def leading_score(match, text, confidence):
+        # "League of Legends": a keyword with only an "of/for X" tail is trusted when event words follow it
+        if match.group('bare') and not _EVENT_PREFIX_RE.match(text[match.end():].strip()):
+            return min(confidence, 0.7)
+        return confidence
+    
+    # "X - Y": the side naming an association/institute/... is the organizer
+    parts = _NAME_SPLIT_RE.split(name)
+    if len(parts) > 1:
+        for part in parts:
+            match = _LEADING_ORGANIZATION_RE.match(part)
+            if match and len(match.group(1)) < len(part):
+                return strip_the(match.group(1)), leading_score(match, part, 0.85)
+            if match:
+                return strip_the(part), leading_score(match, part, 0.9)
+            # A keyword opening the part starts an ordinary name ("Chamber Music Festival")
+            first_word = re.match(r'(?:The\s+)?\S+', part)
+            if _ORGANIZATION_RE.search(part, first_word.end()):
+                return strip_the(part), 0.9
         
-        # If no email found, try to find contact page and scrape from there
-        if not contact_info['email']:
-            contact_links = soup.find_all('a', href=True)
-            contact_keywords = ['contact', 'about', 'info', 'reach', 'connect']
+        # "Abilities Expo - Houston": a brand-style expo/show name followed by a short location or edition
+        first, rest = parts[0], parts[1:]
+        brand_words = [word for word in first.split()[:-1] if not _GENERIC_EVENT_NAME_WORD_RE.match(word)]
+        if (_BRAND_EVENT_SUFFIX_RE.search(first) and brand_words
+                and all(len(part.split()) <= 3 and not part.isupper() for part in rest)):
+            return strip_the(first), 0.8
+        return strip_the(first), 0.5
+    
+    # No separator: the name opens with an organization phrase followed by event words
+    match = _LEADING_ORGANIZATION_RE.match(name)
+    if match:
+        organization = match.group(1)
+        remainder = name[len(organization):].strip()
+        if not remainder or _EVENT_PREFIX_RE.match(remainder):
+            return strip_the(organization), leading_score(match, name, 0.85)
+        return strip_the(organization), leading_score(match, name, 0.6)
+    
+    # "Black Hat USA": drop a trailing country or year; good guess, but not certain enough alone
+    stripped = re.sub(r'\s+(?:USA|US|America|North America|(?:19|20)\d{2})$', '', name)
+    if stripped != name and len(stripped) > 3:
+        return stripped, 0.6
+    
+    return "", 0.0
+
+def get_company_name_hybrid(event_name, event_info, website_url="", api_key=None, chatgpt_name=None,
+                            cache_checked=False):
+    """
+    Try the local rules first, then ChatGPT, then fall back to website extraction.
+    chatgpt_name is an answer already obtained from a batched request; when it is None
+    ChatGPT is asked for this event alone. cache_checked means the batched request already
+    looked the event up in the ChatGPT cache.
+    Returns tuple: (company_name, source, complete); complete is False when ChatGPT was needed
+    but could not be asked, so the answer is worth retrying on a later run.
+    """
+    # Confident rule answers need no network round trip at all
+    company_name, confidence = resolve_company_name_by_rules(event_name)
+    if company_name and confidence >= RULES_CONFIDENCE_THRESHOLD:
+        return company_name, "Rules", True
+    
+    # Try ChatGPT next (faster and more accurate for event names than the website)
+    if chatgpt_name is None:
+        company_name = get_company_name_from_chatgpt(event_name, event_info, api_key, not cache_checked)
+    else:
+        company_name = chatgpt_name
+    complete = company_name is not None
+    
+    if company_name:
+        return company_name, "ChatGPT", complete
+    
+    # Fall back to website extraction if ChatGPT failed
+    if website_url:
+        company_name = extract_company_name_from_website(website_url, event_name)
+        
+        if company_name:
+            return company_name, "Website", complete
+    
+    return "", "None", complete
+
+# Email scanning over raw page bytes (see scan_emails)
+_EMAIL_ANCHOR_RE = re.compile(rb'[@%&\[\(\{]')  # First byte of every "at" form below
+_EMAIL_AT_RE = re.compile(rb'@|%40|&#0*64;|&#[xX]0*40;|[\[\(\{]\s*[aA][tT]\s*[\]\)\}]')
+_EMAIL_LOCAL_RE = re.compile(rb'[A-Za-z0-9._%+-]{1,64}\Z')
+_EMAIL_DOT = rb'(?:\.|&#0*46;|&#[xX]0*2[eE];|\s*[\[\(\{]\s*[dD][oO][tT]\s*[\]\)\}]\s*)'
+_EMAIL_DOMAIN_RE = re.compile(rb'\s*([A-Za-z0-9-]{1,63}(?:' + _EMAIL_DOT + rb'[A-Za-z0-9-]{1,63})+)')
+_EMAIL_DOT_RE = re.compile(_EMAIL_DOT)
+_CLOUDFLARE_EMAIL_RES = [
+    re.compile(rb'data-cfemail=["\']([0-9a-fA-F]+)'),
+    re.compile(rb'/email-protection#([0-9a-fA-F]+)'),
+]
+EMAIL_PREFERRED_PREFIXES = ['info', 'contact', 'events', 'sales']
+EMAIL_IGNORED_DOMAINS = ['example.com', 'domain.com', 'email.com', 'yourdomain.com', 'sentry.io', 'wixpress.com']
+EMAIL_IGNORED_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.css', '.js')
+
+def _base_domain(host):
+    """Registrable part of a host name, e.g. "www.expo.example.co.uk" -> "example.co.uk"."""
+    labels = host.lower().split(':')[0].strip('.').split('.')
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in ('co', 'com', 'org', 'net', 'ac', 'gov', 'edu'):
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+def _decode_cloudflare_email(hex_string):
+    """Decode a Cloudflare-protected address: the first byte is the XOR key for the rest."""
+    try:
+        data = bytes.fromhex(hex_string.decode('ascii'))
+        return ''.join(chr(byte ^ data[0]) for byte in data[1:])
+    except (ValueError, IndexError):
+        return ''
+
+def scan_emails(content, website_url=''):
+    """
+    Find email addresses in raw page bytes without parsing the page.
+    Handles plain addresses, mailto: links, entity/URL-encoded "@" and ".", bracketed
+    "name [at] domain [dot] com" style obfuscation and Cloudflare email protection.
+    Returns unique lowercased addresses, best first: on the website's own domain, then from
+    mailto:/decoded sources, then generic info/contact/events/sales boxes, then page order.
+    """
+    if not content:
+        return []
+    
+    found = []  # (position, email, explicit)
+    for pattern in _CLOUDFLARE_EMAIL_RES:
+        for match in pattern.finditer(content):
+            found.append((match.start(), _decode_cloudflare_email(match.group(1)), True))
+    
+    for anchor in _EMAIL_ANCHOR_RE.finditer(content):
+        position = anchor.start()
+        at = _EMAIL_AT_RE.match(content, position)
+        if at is None:
+            continue
+        # Bracketed forms may be spaced out from the name: "info [at] expo [dot] com"
+        local_end = position
+        if at.group(0)[:1] in b'[({':
+            while local_end > 0 and content[local_end - 1:local_end].isspace():
+                local_end -= 1
+        local = _EMAIL_LOCAL_RE.search(content, max(0, local_end - 64), local_end)
+        domain = _EMAIL_DOMAIN_RE.match(content, at.end())
+        if local is None or domain is None:
+            continue
+        explicit = content[max(0, local.start() - 7):local.start()].lower() == b'mailto:'
+        address = local.group(0) + b'@' + _EMAIL_DOT_RE.sub(b'.', domain.group(1))
+        found.append((local.start(), address.decode('ascii', 'ignore'), explicit))
+    
+    site_domain = _base_domain(urlparse(website_url).netloc) if website_url else ''
+    ranked = {}
+    for position, email, explicit in sorted(found):
+        email = email.lower().strip('.')
+        local, _, domain = email.partition('@')
+        domain = domain.rstrip('.')
+        tld = domain.rsplit('.', 1)[-1]
+        if (not local or local.startswith('.') or '.' not in domain or not tld.isalpha() or len(tld) < 2
+                or email.endswith(EMAIL_IGNORED_SUFFIXES)
+                or any(domain == ignored or domain.endswith('.' + ignored) for ignored in EMAIL_IGNORED_DOMAINS)):
+            continue
+        email = f"{local}@{domain}"
+        rank = (
+            not (site_domain and _base_domain(domain) == site_domain),
+            not explicit,
+            local not in EMAIL_PREFERRED_PREFIXES,
+            position
+        )
+        if email not in ranked or rank < ranked[email]:
+            ranked[email] = rank
+    return sorted(ranked, key=ranked.get)
+
+# Link keywords for the contact-page crawl, best first (score = position in this list)
+CONTACT_LINK_KEYWORDS = [['contact'], ['impressum', 'imprint'], ['about'], ['team'], ['info', 'reach', 'connect']]
+
+def is_site_email(email, website_url):
+    """True when an address belongs to the event website's own domain."""
+    host = urlparse(website_url).netloc
+    return bool(host) and _base_domain(email.partition('@')[2]) == _base_domain(host)
+
+def rank_contact_links(soup, website_url, limit=CONTACT_CRAWL_PAGES):
+    """
+    Pick the on-site links most likely to lead to an email address, best first.
+    Links are scored by the first keyword group their text or href matches (contact, imprint,
+    about, team, info/reach/connect); ties keep page order. Off-site links (relative links are
+    always on-site, even after a redirect), anchors on the homepage itself and non-HTTP links
+    are skipped.
+    """
+    site_domain = _base_domain(urlparse(website_url).netloc)
+    homepage = website_url.split('#')[0]
+    scored = {}
+    for order, link in enumerate(soup.find_all('a', href=True)):
+        href = link['href'].strip()
+        url = urljoin(website_url, href).split('#')[0]
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https') or url == homepage:
+            continue
+        if urlparse(href).netloc and _base_domain(parsed.netloc) != site_domain:
+            continue
+        
+        link_text = link.get_text().lower()
+        href = href.lower()
+        for score, keywords in enumerate(CONTACT_LINK_KEYWORDS):
+            if any(keyword in link_text or keyword in href for keyword in keywords):
+                if url not in scored or (score, order) < scored[url]:
+                    scored[url] = (score, order)
+                break
+    return sorted(scored, key=scored.get)[:limit]
+
+def crawl_contact_pages(urls, website_url, event_name, time_budget=CONTACT_CRAWL_SECONDS,
+                        byte_budget=CONTACT_CRAWL_BYTES):
+    """
+    Fetch candidate contact pages concurrently and return the best email found ('' if none,
+    None if the time budget ran out before any address turned up).
+    Stops at the first address on the event's own domain; otherwise, once every page is in or
+    the time or byte budget runs out, the best address from the highest-ranked page wins.
+    All pages download against one ByteBudget of byte_budget bytes; when the crawl ends, pages
+    still downloading stop at their next chunk and pages not yet requested are never sent.
+    With a host delay, pages on the same host are fetched one after another, so each reserves
+    its host-limiter slot only when it is next and a crawl that stops early leaves none behind.
+    """
+    if not urls:
+        return ''
+    
+    start = time.time()
+    deadline = start + time_budget
+    budget = ByteBudget(byte_budget)
+    timed_out = False
+    best = None  # (link rank, email)
+    executor = ThreadPoolExecutor(max_workers=len(urls))
+    
+    def fetch_after(url, previous):
+        if previous is not None:
+            wait_futures([previous])
+        return fetch_page(url, False, budget)
+    
+    take_turns = _host_limiter is not None and _host_limiter.interval > 0
+    last_by_host = {}  # host -> future of its most recent candidate page
+    try:
+        futures = {}
+        for rank, url in enumerate(urls):
+            host = HostRateLimiter.host_key(url)
+            future = executor.submit(fetch_after, url, last_by_host.get(host) if take_turns else None)
+            last_by_host[host] = future
+            futures[future] = rank
+        for future in as_completed(futures, timeout=max(0, deadline - time.time())):
+            try:
+                content = future.result()['content']
+            except Exception as e:
+                print(f"Could not scrape contact page for {event_name}: {e}")
+                continue
             
-            for link in contact_links:
-                link_text = link.get_text().lower()
-                href = link.get('href', '').lower()
-                
-                if any(keyword in link_text or keyword in href for keyword in contact_keywords):
-                    try:
-                        contact_url = urljoin(website_url, link['href'])
-                        contact_response = requests.get(contact_url, headers=headers, timeout=10, verify=False)
-                        contact_response.raise_for_status()
-                        contact_soup = BeautifulSoup(contact_response.content, 'html.parser')
-                        contact_text = contact_soup.get_text().lower()
-                        
-                        # Look for emails on contact page
-                        for pattern in email_patterns:
-                            emails = re.findall(pattern, contact_text)
-                            if emails:
-                                contact_info['email'] = emails[0]
-                                break
-                        
-
-                                
-                        break  # Found contact page, no need to check more links
-                        
-                    except Exception as e:
-                        print(f"Could not scrape contact page for {event_name}: {e}")
-                        continue
+            emails = scan_emails(content, website_url)
+            if emails:
+                # Site-domain addresses rank first, so this is the page's best candidate
+                if is_site_email(emails[0], website_url):
+                    return emails[0]
+                if best is None or futures[future] < best[0]:
+                    best = (futures[future], emails[0])
+            if budget.exhausted:
+                print(f"Contact crawl for {event_name} stopped at its {byte_budget // 1024} KB budget")
+                break
+    except FutureTimeoutError:
+        timed_out = True
+        print(f"Contact crawl for {event_name} stopped at its {time_budget}s budget")
+    finally:
+        budget.close()
+        executor.shutdown(wait=False, cancel_futures=True)
+        # Crawls cut off by the time budget count as the stage's errors
+        record_stage('contact_crawl', time.time() - start, budget.used, error=timed_out)
+    if best:
+        return best[1]
+    return None if timed_out else ''
+
+def extract_contact_info(website_url, event_name):
+    """
+    Extract contact information from an event website.
+    Returns a dictionary with contact details; 'complete' is False when the website could not
+    be read or the contact crawl ran out of time.
+    """
+    contact_info = {
+        'website': website_url,
+        'email': '',
+        'company_name': '',
+        'complete': True
+    }
+    
+    try:
+        # Reuses the page already fetched for company name extraction, if any
+        page = fetch_page(website_url)
+        soup = page['soup']
+        
+        # Emails are read straight from the raw page, best candidate first
+        emails = scan_emails(page['content'], website_url)
+        if emails:
+            contact_info['email'] = emails[0]
+        
+        # If no email found, crawl the most promising contact/about pages concurrently
+        if not contact_info['email']:
+            contact_urls = rank_contact_links(soup, website_url)
+            email = crawl_contact_pages(contact_urls, website_url, event_name)
+            if email is None:
+                contact_info['complete'] = False
+            else:
+                contact_info['email'] = email
         
     except Exception as e:
+        contact_info['complete'] = False
         print(f"Error scraping contact info for {event_name} ({website_url}): {e}")
     
     return contact_info
 
-def extract_website_url(row_element):
+def extract_website_url_from_row(row_tag, base_url=URL):
     """
-    Extract website URL from a table row element.
+    Extract website URL from a parsed (BeautifulSoup) table row: the first absolute link in
+    the event name column, else the first one anywhere in the row.
     """
-    try:
-        # Look for links in the event name column
-        name_cell = row_element.find_element(By.CSS_SELECTOR, "td:nth-child(1)")
-        links = name_cell.find_elements(By.TAG_NAME, "a")
-        
-        for link in links:
-            href = link.get_attribute("href")
-            if href and href.startswith("http"):
+    cells = row_tag.find_all("td")
+    # Look for links in the event name column first, then anywhere in the row
+    for container in (cells[0] if cells else None, row_tag):
+        if container is None:
+            continue
+        for link in container.find_all("a", href=True):
+            href = urljoin(base_url, link["href"].strip())
+            if href.startswith("http"):
                 return href
+    return ""
+
+def parse_listing_rows(html, month_aliases, year, base_url=URL):
+    """
+    Parse one calendar results page locally.
+    Only rows for US events in the given month/year are kept, and links are read for those rows only.
+    Returns tuple: (matching rows as dictionaries, number of table rows on the page)
+    """
+    start = time.perf_counter()
+    soup = make_soup(html, parse_only=SoupStrainer("tr", class_="row"))
+    row_tags = soup.find_all("tr", class_="row")
+    
+    rows = []
+    for row_tag in row_tags:
+        cols = row_tag.find_all("td")
+        if len(cols) < 6:
+            continue
         
-        # If no direct link, look for any links in the row
-        all_links = row_element.find_elements(By.TAG_NAME, "a")
-        for link in all_links:
-            href = link.get_attribute("href")
-            if href and href.startswith("http"):
-                return href
-                
-    except Exception as e:
-        print(f"Error extracting website URL: {e}")
+        name, dates, city, country, attendance, exhibitors = (
+            col.get_text(" ", strip=True) for col in cols[:6]
+        )
+        
+        # Filter for US events and the current month/year, allowing for multiple month aliases
+        if not (
+            "united states" in country.lower() and
+            any(alias in dates.upper() for alias in month_aliases) and
+            str(year) in dates
+        ):
+            continue
+        
+        rows.append({
+            'name': name,
+            'dates': dates,
+            'city': city,
+            'country': country,
+            'attendance': attendance,
+            'exhibitors': exhibitors,
+            'website': extract_website_url_from_row(row_tag, base_url)
+        })
     
-    return ""
+    record_stage('row_parse', time.perf_counter() - start, len(html))
+    return rows, len(row_tags)
 
 def click_next_button(driver):
     try:
@@ -437,224 +1740,1154 @@ def click_next_button(driver):
 
 
 
-def main():
-    """Main function to run the scraper"""
-    global event_counter, chatgpt_token_count
-    
-    # Reset counters
-    event_counter = 0
-    chatgpt_token_count = 0
-    
-    print("Starting event scraper...")
-    
-    # --- SELENIUM SETUP ---
+# Browser settings for the listing sessions (see create_driver)
+BLOCK_BROWSER_RESOURCES = True  # Skip images, fonts, stylesheets, media and analytics/ad scripts
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.css",
+    "*.mp4", "*.webm", "*.mp3",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*facebook.net*", "*connect.facebook.*", "*hotjar.com*", "*clarity.ms*", "*addthis.com*", "*sharethis.com*",
+]
+_pooled_drivers = {}
+_pooled_drivers_lock = threading.Lock()
+
+def create_driver(headless=True, block_resources=BLOCK_BROWSER_RESOURCES):
+    """
+    Start a lightweight Chrome for reading the calendar.
+    Unneeded Chrome features are turned off and, with block_resources, images, fonts, stylesheets,
+    media and common analytics/ad scripts are never downloaded.
+    """
     options = Options()
-    options.add_argument('--headless')  # Run in headless mode (no browser window)
+    if headless:
+        options.add_argument('--headless')  # Run in headless mode (no browser window)
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--disable-gpu')
     options.add_argument('--window-size=1920,1080')
-    options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-
+    options.add_argument(f'--user-agent={USER_AGENT}')
+    for argument in ('--disable-extensions', '--disable-background-networking', '--disable-sync',
+                     '--disable-default-apps', '--disable-notifications', '--disable-popup-blocking',
+                     '--no-first-run', '--mute-audio', '--metrics-recording-only',
+                     '--disable-features=Translate,OptimizationHints,MediaRouter,AutofillServerCommunication'):
+        options.add_argument(argument)
+    # Return from driver.get() at DOMContentLoaded; wait_for_listing_ready decides when the table is usable
+    options.page_load_strategy = 'eager'
+    
+    if block_resources:
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
+    
     driver = webdriver.Chrome(options=options)  # Or use webdriver.Firefox()
-    driver.get(URL)
-    wait = WebDriverWait(driver, 30)
     
-    # --- Select 'May' in the Month dropdown (name='vMo', value='5') ---
+    if block_resources:
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"Could not enable resource blocking: {e}")
+    return driver
+
+def get_pooled_driver(slot=0, headless=True):
+    """
+    Return the browser for listing session slot, starting it on first use.
+    Browsers stay alive between runs until quit_pooled_drivers() is called, so a warm
+    browser is reused; a browser that died or was started with another headless setting is replaced.
+    """
+    with _pooled_drivers_lock:
+        entry = _pooled_drivers.get(slot)
+    
+    if entry is not None:
+        driver, driver_headless = entry
+        try:
+            driver.current_url  # Health check: raises if the browser is gone
+            if driver_headless == headless:
+                return driver
+        except Exception:
+            pass
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    driver = create_driver(headless=headless)
+    with _pooled_drivers_lock:
+        _pooled_drivers[slot] = (driver, headless)
+    return driver
+
+def quit_pooled_drivers():
+    """Quit every pooled browser."""
+    with _pooled_drivers_lock:
+        entries = list(_pooled_drivers.values())
+        _pooled_drivers.clear()
+    for driver, _ in entries:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+# Seconds actually spent in each readiness wait (see wait_for_listing_ready)
+_wait_durations = []
+_wait_durations_lock = threading.Lock()
+
+def _pagination_marker(driver):
+    """Return the markup of the td.next pagination control (it changes from page to page), or None."""
+    try:
+        return driver.execute_script("var n = document.querySelector('td.next'); return n ? n.outerHTML : null;")
+    except Exception:
+        return None
+
+def _first_listing_row(driver):
+    """Return the first tr.row element currently on the page, or None."""
+    rows = driver.find_elements(By.CSS_SELECTOR, "tr.row")
+    return rows[0] if rows else None
+
+def _listing_changed(old_row, old_marker):
+    """Condition: the old first row went stale or the pagination control changed."""
+    def condition(driver):
+        if old_row is not None:
+            try:
+                old_row.is_enabled()
+            except StaleElementReferenceException:
+                return True
+        if old_marker is not None and _pagination_marker(driver) != old_marker:
+            return True
+        return False
+    return condition
+
+def wait_for_listing_ready(driver, timeout=WAIT_SECONDS, old_row=None, old_marker=None):
+    """
+    Wait until the results table reflects the last search or next click, instead of sleeping a fixed time.
+    Ready means the previous rows went stale (or the pagination control changed) and the document has
+    finished loading with result rows present. Gives up after timeout seconds and lets the caller read
+    the page as it is. Returns the seconds actually waited.
+    """
+    start = time.monotonic()
+    timed_out = False
+    try:
+        if old_row is not None or old_marker is not None:
+            WebDriverWait(driver, timeout, poll_frequency=0.2).until(_listing_changed(old_row, old_marker))
+        remaining = max(0.5, timeout - (time.monotonic() - start))
+        WebDriverWait(driver, remaining, poll_frequency=0.2).until(lambda d: d.execute_script(
+            "return document.readyState === 'complete' && document.querySelector('tr.row') !== null;"
+        ))
+    except TimeoutException:
+        timed_out = True
+    
+    elapsed = time.monotonic() - start
+    with _wait_durations_lock:
+        _wait_durations.append(elapsed)
+    # Waits that ran into the timeout count as the stage's errors
+    record_stage('listing_wait', elapsed, error=timed_out)
+    return elapsed
+
+def reset_wait_stats():
+    """Forget recorded readiness wait times (called at the start of each run)."""
+    with _wait_durations_lock:
+        _wait_durations.clear()
+
+def get_wait_stats():
+    """Return count, total, average and longest readiness wait in seconds for the current run."""
+    with _wait_durations_lock:
+        durations = list(_wait_durations)
+    if not durations:
+        return {'count': 0, 'total': 0.0, 'average': 0.0, 'longest': 0.0}
+    return {
+        'count': len(durations),
+        'total': sum(durations),
+        'average': sum(durations) / len(durations),
+        'longest': max(durations)
+    }
+
+class ListingBackendError(Exception):
+    """Raised when the HTTP listing backend cannot replay the calendar search."""
+
+class MonthListingError(Exception):
+    """Raised when a month cannot be searched at all; the run stops rather than skip the month."""
+
+def scrape_month_rows_selenium(driver, url, month, wait_seconds=WAIT_SECONDS, should_stop=None, log=print):
+    """
+    Selenium listing backend: search one month in the browser and yield its matching rows, page by page.
+    month is a (month_name, month_value, month_aliases, year) tuple.
+    Raises MonthListingError when the month cannot be selected or searched.
+    """
+    month_name, month_value, month_aliases, year = month
+    wait = WebDriverWait(driver, wait_seconds, poll_frequency=0.2)
+    
+    # Reload the page to reset state for each month; the dropdown wait below covers the load
+    with timed_stage('listing_page'):
+        driver.get(url)
+    
+    # Select the month in the dropdown
     try:
         month_select = wait.until(EC.visibility_of_element_located((By.NAME, "vMo")))
         select = Select(month_select)
-        select.select_by_value("5")
+        select.select_by_value(month_value)
     except Exception as e:
-        print("Could not select month:", e)
-        with open("debug.html", "w", encoding="utf-8") as f:
+        log(f"Could not select month {month_name}: {e}")
+        with open(f"debug_{month_name.lower()}.html", "w", encoding="utf-8") as f:
             f.write(driver.page_source)
-        driver.quit()
-        return
-
-    # --- Click the Search button ---
+        raise MonthListingError(f"Could not select month {month_name}: {e}")
+    
+    # Click the Search button
     try:
-        # The search button is a <button> with class 'sc-button-submit'
+        old_row = _first_listing_row(driver)
+        old_marker = _pagination_marker(driver)
         search_button = driver.find_element(By.CLASS_NAME, "sc-button-submit")
         search_button.click()
-        time.sleep(WAIT_SECONDS)
+        waited = wait_for_listing_ready(driver, wait_seconds, old_row, old_marker)
+        log(f"Results for {month_name} ready after {waited:.1f}s")
     except Exception as e:
-        print("Could not click search button:", e)
-        with open("debug_search.html", "w", encoding="utf-8") as f:
+        log(f"Could not click search button for {month_name}: {e}")
+        with open(f"debug_search_{month_name.lower()}.html", "w", encoding="utf-8") as f:
             f.write(driver.page_source)
-        driver.quit()
-        return
+        raise MonthListingError(f"Could not click search button for {month_name}: {e}")
+    
+    page = 1
+    while True:
+        if should_stop and should_stop():
+            return
+        
+        log(f"Processing {month_name} - Page {page}")
+        
+        # Read the whole page once and parse rows and links locally
+        rows, row_count = parse_listing_rows(driver.page_source, month_aliases, year, driver.current_url)
+        if not row_count:
+            return
+        
+        for row in rows:
+            yield row
+        
+        # Try to click the Next button for this month, regardless of event presence
+        old_row = _first_listing_row(driver)
+        old_marker = _pagination_marker(driver)
+        if click_next_button(driver):
+            page += 1
+            waited = wait_for_listing_ready(driver, wait_seconds, old_row, old_marker)
+            log(f"Page {page} ready after {waited:.1f}s")
+        else:
+            return
 
-    # --- Scrape all results for specified months in the USA (with pagination if needed) ---
-    months = [
-        ("July", "7", ["JUL", "JULY"]),
-        ("August", "8", ["AUG", "AUGUST"]),
-        ("September", "9", ["SEP", "SEPT", "SEPTEMBER"]),
-        ("October", "10", ["OCT", "OCTOBER"]),
-        ("November", "11", ["NOV", "NOVEMBER"]),
-        ("December", "12", ["DEC", "DECEMBER"]),
-    ]
-    year = "2025"
-    events = []
-    for month_name, month_value, month_aliases in months:
-        print(f"\nProcessing {month_name} {year}...")
-        # Reload the page to reset state for each month
-        driver.get(URL)
-        time.sleep(WAIT_SECONDS)
-        # Select the month in the dropdown
-        try:
-            month_select = wait.until(EC.visibility_of_element_located((By.NAME, "vMo")))
-            select = Select(month_select)
-            select.select_by_value(month_value)
-        except Exception as e:
-            print(f"Could not select month {month_name}:", e)
-            with open(f"debug_{month_name.lower()}.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            driver.quit()
+def _search_form_fields(form):
+    """Collect the values a browser would submit for a form, keyed by field name."""
+    fields = {}
+    for field in form.find_all('input'):
+        name = field.get('name')
+        field_type = (field.get('type') or 'text').lower()
+        if not name or field_type in ('submit', 'button', 'image', 'reset', 'file'):
+            continue
+        if field_type in ('checkbox', 'radio') and not field.has_attr('checked'):
+            continue
+        fields[name] = field.get('value', '')
+    
+    for field in form.find_all('select'):
+        name = field.get('name')
+        if not name:
+            continue
+        option = field.find('option', selected=True) or field.find('option')
+        fields[name] = option.get('value', option.get_text(strip=True)) if option else ''
+    
+    for field in form.find_all('textarea'):
+        if field.get('name'):
+            fields[field['name']] = field.get_text()
+    
+    # The search button itself is part of the submission when it is named
+    button = form.find(class_='sc-button-submit')
+    if button is not None and button.get('name'):
+        fields[button['name']] = button.get('value', '')
+    return fields
+
+def _submit_form(session, form, fields, page_url):
+    """Submit a parsed form the way the browser would. Returns the response."""
+    action = urljoin(page_url, form.get('action') or page_url)
+    with timed_stage('listing_page') as stage:
+        if (form.get('method') or 'get').lower() == 'post':
+            response = session.post(action, data=fields, timeout=HTTP_TIMEOUT)
+        else:
+            response = session.get(action, params=fields, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        stage['bytes'] = len(response.content)
+    return response
+
+def _next_page_request(soup, page_url, form, fields):
+    """
+    Work out the request behind the td.next pagination control.
+    Returns ('get', url, None), ('form', None, fields), or None when there is no next page.
+    Raises ListingBackendError when the control exists but cannot be replayed without a browser.
+    """
+    next_td = soup.select_one('td.next')
+    if next_td is None:
+        return None
+    
+    link = next_td.find('a', href=True)
+    if link is not None and not link['href'].lower().startswith('javascript'):
+        return ('get', urljoin(page_url, link['href']), None)
+    
+    clickable = next_td if next_td.has_attr('onclick') else next_td.find(attrs={'onclick': True})
+    if clickable is None:
+        # A next cell with nothing to click is the disabled control on the last page
+        return None
+    onclick = clickable['onclick']
+    
+    # location.href='index.php?...' style handlers
+    match = re.search(r"""['"]([^'"]*(?:\?|\.php|\.html?|=)[^'"]*)['"]""", onclick)
+    if match:
+        return ('get', urljoin(page_url, match.group(1)), None)
+    
+    # goPage(3) / goNext('3') style handlers: put the page number into the form's paging field and resubmit
+    match = re.search(r"""\(\s*['"]?(\d+)['"]?\s*\)""", onclick)
+    page_fields = [name for name in fields if re.search(r'page|pg|start|offset', name, re.IGNORECASE)]
+    if match and form is not None and page_fields:
+        next_fields = dict(fields)
+        next_fields[page_fields[0]] = match.group(1).strip()
+        return ('form', None, next_fields)
+    
+    raise ListingBackendError(f"Cannot replay pagination handler: {onclick}")
+
+def scrape_month_rows_http(url, month, should_stop=None, log=print, session=None):
+    """
+    HTTP listing backend: replay the month search and the td.next pagination as plain requests,
+    without a browser. Raises ListingBackendError when the search form or the pagination cannot
+    be replayed, so the caller can fall back to Selenium; a page's rows are only yielded once its
+    next-page request is known, so a first page that cannot be paged past yields nothing.
+    month is a (month_name, month_value, month_aliases, year) tuple. session defaults to the
+    shared session; parallel listings pass their own so the site's search state is not shared.
+    """
+    month_name, month_value, month_aliases, year = month
+    session = session or get_http_session()
+    
+    try:
+        with timed_stage('listing_page') as stage:
+            response = session.get(url, timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+            stage['bytes'] = len(response.content)
+    except requests.RequestException as e:
+        raise ListingBackendError(f"Could not load {url}: {e}")
+    
+    # Forms are read with html.parser, which keeps them nested as written (lxml moves
+    # fields out of forms that sit inside tables)
+    soup = BeautifulSoup(response.content, 'html.parser')
+    month_select = soup.find('select', attrs={'name': 'vMo'})
+    form = month_select.find_parent('form') if month_select is not None else None
+    if form is None:
+        raise ListingBackendError("Search form with the vMo month field not found")
+    
+    fields = _search_form_fields(form)
+    fields['vMo'] = month_value
+    try:
+        response = _submit_form(session, form, fields, response.url)
+    except requests.RequestException as e:
+        raise ListingBackendError(f"Could not submit search for {month_name}: {e}")
+    
+    page = 1
+    seen_urls = set()
+    while True:
+        if should_stop and should_stop():
+            return
+        
+        log(f"Processing {month_name} - Page {page}")
+        rows, row_count = parse_listing_rows(response.content, month_aliases, year, response.url)
+        if not row_count:
+            if page == 1:
+                # Nothing at all on the first page usually means the table is built by scripts
+                raise ListingBackendError(f"No result rows in the HTTP response for {month_name}")
+            return
+        
+        seen_urls.add(response.url)
+        page_soup = BeautifulSoup(response.content, 'html.parser')
+        next_request = _next_page_request(page_soup, response.url, form, fields)
+        
+        for row in rows:
+            yield row
+        
+        if next_request is None:
             return
+        kind, next_url, next_fields = next_request
+        try:
+            if kind == 'get':
+                if next_url in seen_urls:
+                    return
+                with timed_stage('listing_page') as stage:
+                    response = session.get(next_url, timeout=HTTP_TIMEOUT)
+                    response.raise_for_status()
+                    stage['bytes'] = len(response.content)
+            else:
+                fields = next_fields
+                response = _submit_form(session, form, fields, response.url)
+        except requests.RequestException as e:
+            raise ListingBackendError(f"Could not load page {page + 1} of {month_name}: {e}")
+        page += 1
 
-        # Click the Search button
+def scrape_month_rows(url, month, wait_seconds=WAIT_SECONDS, should_stop=None, log=print,
+                      backend=LISTING_BACKEND, get_driver=None, session=None):
+    """
+    Yield the matching rows of one month with the chosen backend.
+    With backend "http" the month falls back to the browser if it cannot be read over HTTP; when
+    that happens after some pages, the browser lists the month again and skips the rows already yielded.
+    """
+    month_name = month[0]
+    listed = set()
+    if backend == "http":
         try:
-            search_button = driver.find_element(By.CLASS_NAME, "sc-button-submit")
-            search_button.click()
-            time.sleep(WAIT_SECONDS)
-        except Exception as e:
-            print(f"Could not click search button for {month_name}:", e)
-            with open(f"debug_search_{month_name.lower()}.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            driver.quit()
+            for row in scrape_month_rows_http(url, month, should_stop, log, session):
+                listed.add(event_key(row))
+                yield row
+        except ListingBackendError as e:
+            if listed:
+                log(f"HTTP listing broke off for {month_name} ({e}); listing the remaining pages in the browser")
+            else:
+                log(f"HTTP listing failed for {month_name} ({e}); falling back to the browser")
+        else:
             return
+    
+    if get_driver is None:
+        raise MonthListingError(f"No browser available to list {month_name}")
+    for row in scrape_month_rows_selenium(get_driver(), url, month, wait_seconds, should_stop, log):
+        if event_key(row) not in listed:
+            yield row
 
-        page = 1
-        while True:
-            print(f"Processing {month_name} - Page {page}")
+def event_key(row):
+    """Stable identity of a listing row: name, dates and city, case and spacing normalized."""
+    return '|'.join(' '.join(str(row[field]).lower().split()) for field in ('name', 'dates', 'city'))
+
+def month_key(month):
+    """Identity of a (month_name, month_value, month_aliases, year) tuple, e.g. "July 2025"."""
+    return f"{month[0]} {month[3]}"
+
+def row_from_event(event, month=None):
+    """Turn a finished spreadsheet row back into a listing row that needs no more enrichment."""
+    return {
+        'name': event[0],
+        'dates': event[1],
+        'city': event[2],
+        'country': event[3],
+        'attendance': event[4],
+        'exhibitors': event[5],
+        'website': event[6],
+        'month': month,
+        'enriched': list(event)
+    }
+
+def listing_fingerprint(row):
+    """Hash of the listing fields outside the event identity; a different hash means the event changed."""
+    values = [' '.join(str(row.get(field, '')).lower().split())
+              for field in ('country', 'attendance', 'exhibitors', 'website')]
+    return hashlib.sha1('|'.join(values).encode('utf-8')).hexdigest()
+
+class EventHistory:
+    """
+    SQLite store of every enriched event across runs, keyed on event_key (name + dates + city).
+    Each entry keeps a fingerprint of the remaining listing fields, so a run can tell new,
+    changed and unchanged events apart and only enrich the first two.
+    With reuse=False nothing is reused (full run), but events are still counted as new, changed
+    or unchanged and the store is refreshed.
+    """
+    
+    def __init__(self, path=EVENT_HISTORY_PATH, reuse=True):
+        self.path = path
+        self.reuse = reuse
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS events (
+                event_key TEXT PRIMARY KEY,
+                fingerprint TEXT,
+                event TEXT,
+                first_seen REAL,
+                last_seen REAL
+            )
+        """)
+        self.conn.commit()
+        self.new = 0
+        self.changed = 0
+        self.unchanged = 0
+    
+    def lookup(self, row):
+        """Return the stored spreadsheet row if the event is unchanged since it was enriched, else None."""
+        key = event_key(row)
+        with self.lock:
+            stored = self.conn.execute(
+                "SELECT fingerprint, event FROM events WHERE event_key = ?", (key,)
+            ).fetchone()
+            if stored is None:
+                self.new += 1
+                return None
+            if stored[0] != listing_fingerprint(row):
+                self.changed += 1
+                return None
+            self.unchanged += 1
+            if not self.reuse:
+                return None
+            self.conn.execute("UPDATE events SET last_seen = ? WHERE event_key = ?", (time.time(), key))
+            self.conn.commit()
+        return json.loads(stored[1])
+    
+    def store(self, row, event):
+        """Remember a freshly enriched event."""
+        now = time.time()
+        with self.lock:
+            self.conn.execute("""
+                INSERT INTO events VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(event_key) DO UPDATE SET
+                    fingerprint = excluded.fingerprint, event = excluded.event, last_seen = excluded.last_seen
+            """, (event_key(row), listing_fingerprint(row), json.dumps(event), now, now))
+            self.conn.commit()
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+class EventJournal:
+    """
+    Append-only JSON-lines journal of a scrape run.
+    Every enriched event is written and fsynced as soon as it is finished, together with a
+    marker for each fully listed month, so an interrupted run can be resumed: completed months
+    are not listed again and journaled events are not enriched again.
+    Only the keys of the events finished in this run are kept in memory; full rows are held
+    just for the events loaded from the journal of the run being resumed.
+    """
+    
+    def __init__(self, path=JOURNAL_PATH, resume=False):
+        self.path = path
+        self.lock = threading.Lock()
+        self.events = {}  # event key -> finished spreadsheet row from the resumed run
+        self.month_events = {}  # month key -> [finished rows from the resumed run, in listing order]
+        self.finished_keys = set()  # keys of every journaled event, this run's included
+        self.month_counts = {}  # month key -> number of journaled events
+        self.months_listed = {}  # month key -> number of rows the listing produced
+        
+        if resume and os.path.exists(path):
+            self._load()
+        self.file = open(path, 'a' if resume else 'w', encoding='utf-8')
+        if resume and self.file.tell() > 0:
+            # Terminate a line cut short by a crash so the next record starts cleanly
+            with open(path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self.file.write("\n")
+    
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash; everything before it is intact
+                    continue
+                if record.get('type') == 'event':
+                    if record['key'] not in self.events:
+                        self.month_events.setdefault(record.get('month'), []).append(
+                            (record.get('seq') or 0, record['event'])
+                        )
+                        self._count_event(record['key'], record.get('month'))
+                    self.events[record['key']] = record['event']
+                elif record.get('type') == 'month':
+                    self.months_listed[record['month']] = record['count']
+        
+        # Events are journaled as they finish; put each month back into listing order
+        for month, events in self.month_events.items():
+            self.month_events[month] = [event for seq, event in sorted(events, key=lambda item: item[0])]
+    
+    def _count_event(self, key, month):
+        if key not in self.finished_keys:
+            self.finished_keys.add(key)
+            self.month_counts[month] = self.month_counts.get(month, 0) + 1
+    
+    def _append(self, record):
+        with self.lock:
+            self.file.write(json.dumps(record) + "\n")
+            self.file.flush()
+            os.fsync(self.file.fileno())
+    
+    def record_event(self, row, event):
+        """Durably record a finished event."""
+        key = event_key(row)
+        with self.lock:
+            self._count_event(key, row.get('month'))
+        self._append({'type': 'event', 'month': row.get('month'), 'seq': row.get('seq'), 'key': key, 'event': event})
+    
+    def record_month_listed(self, month, count):
+        """Mark a month as fully listed with count matching rows."""
+        self.months_listed[month_key(month)] = count
+        self._append({'type': 'month', 'month': month_key(month), 'count': count})
+    
+    def month_complete(self, month):
+        """True when the month was fully listed and all of its events are journaled."""
+        key = month_key(month)
+        return key in self.months_listed and self.month_counts.get(key, 0) >= self.months_listed[key]
+    
+    def has_event(self, row):
+        """True when the listing row's event is already journaled."""
+        return event_key(row) in self.finished_keys
+    
+    def finished_event(self, row):
+        """Return the spreadsheet row the resumed run journaled for a listing row, or None."""
+        return self.events.get(event_key(row))
+    
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+class ExcelEventWriter:
+    """
+    Streaming spreadsheet sink for finished events.
+    The workbook is opened in openpyxl write-only mode when the run starts and every event is
+    appended as soon as it is produced, so memory stays flat however many events are scraped.
+    close() finalizes the workbook - call it from a finally block so a stopped or failed run
+    still leaves the events written so far. The file is saved under a temporary name and then
+    swapped in, so an interrupted save never corrupts the previous events.xlsx.
+    Running totals for the end-of-run summary are kept instead of the rows themselves.
+    """
+    
+    def __init__(self, path=EXCEL_PATH, title=EXCEL_SHEET_TITLE, headers=EXCEL_HEADERS):
+        self.path = path
+        self.wb = openpyxl.Workbook(write_only=True)
+        self.ws = self.wb.create_sheet(title)
+        self.ws.append(headers)
+        self.closed = False
+        self.count = 0
+        self.with_website = 0
+        self.with_email = 0
+        self.with_company = 0
+        self.sources = {}  # Company Name Source -> number of events
+    
+    def append(self, event):
+        """Write one finished event row."""
+        self.ws.append(event)
+        self.count += 1
+        if event[6]:  # Website column
+            self.with_website += 1
+        if event[7]:  # Email column
+            self.with_email += 1
+        if event[8]:  # Company Name column
+            self.with_company += 1
+        self.sources[event[9]] = self.sources.get(event[9], 0) + 1
+    
+    def close(self, discard=False):
+        """Save the workbook (unless discard is set). Safe to call more than once."""
+        if self.closed:
+            return
+        self.closed = True
+        if discard:
+            return
+        temp_path = self.path + ".tmp"
+        self.wb.save(temp_path)
+        os.replace(temp_path, self.path)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+def scrape_listing_rows(months, url=URL, wait_seconds=WAIT_SECONDS, max_events=MAX_EVENTS,
+                        should_stop=None, log=print, backend=LISTING_BACKEND, get_driver=None,
+                        sessions=LISTING_SESSIONS, journal=None):
+    """
+    Listing stage: walk the calendar month by month and yield every matching US row.
+    Only reads the table - company name and contact lookups happen in the enrichment stage.
+    months is a list of (month_name, month_value, month_aliases, year) tuples.
+    backend is "http" (plain requests, falling back to Selenium per month) or "selenium".
+    get_driver(slot) returns the WebDriver for listing session slot (0 to sessions - 1); it is
+    only called when Selenium is needed and should return the same browser for the same slot.
+    With sessions > 1 the months are listed in parallel, but rows are still yielded in month
+    order and max_events applies to the merged result.
+    With a journal from a resumed run, completed months are replayed from the journal instead
+    of being listed, and rows already journaled carry their finished row in row['enriched'].
+    """
+    global event_counter
+    event_counter = 0
+    
+    completed = {month_key(month) for month in months if journal is not None and journal.month_complete(month)}
+    to_list = [month for month in months if month_key(month) not in completed]
+    sessions = max(1, min(int(sessions), len(to_list))) if to_list else 1
+    if sessions == 1:
+        listed_sources = [
+            scrape_month_rows(url, month, wait_seconds, should_stop, log, backend,
+                              (lambda: get_driver(0)) if get_driver else None)
+            for month in to_list
+        ]
+        stop_workers = None
+    else:
+        listed_sources, stop_workers = _start_month_workers(
+            to_list, url, wait_seconds, max_events, should_stop, log, backend, get_driver, sessions
+        )
+    listed_sources = iter(listed_sources)
+    
+    try:
+        for month in months:
+            if should_stop and should_stop():
+                return
+            
+            month_name, year = month[0], month[3]
+            if month_key(month) in completed:
+                log(f"\nSkipping {month_name} {year}: already finished in the journal")
+                month_rows = (row_from_event(event, month_key(month))
+                              for event in journal.month_events.get(month_key(month), []))
+                replayed = True
+            else:
+                log(f"\nProcessing {month_name} {year}...")
+                month_rows = next(listed_sources)
+                replayed = False
+            
+            month_events_found = 0
+            for row in month_rows:
+                row['month'] = month_key(month)
+                if journal is not None and 'enriched' not in row:
+                    finished = journal.finished_event(row)
+                    if finished is not None:
+                        row['enriched'] = finished
+                
+                # Check if we've reached the maximum number of events
+                if event_counter >= max_events:
+                    log(f"Reached maximum events ({max_events}). Stopping.")
+                    return
+                
+                event_counter += 1
+                row['seq'] = month_events_found  # Listing position, kept in the journal for replay
+                month_events_found += 1
+                log(f"Queued event {event_counter}/{max_events}: {row['name']}")
+                yield row
             
-            # Get all row elements using Selenium for better link extraction
-            row_elements = driver.find_elements(By.CSS_SELECTOR, "tr.row")
+            if should_stop and should_stop():
+                return
+            # Only a listing that reached the month's last page is marked; one that filled
+            # max_events exactly may have been cut short, so it is listed again on resume
+            if journal is not None and not replayed and event_counter < max_events:
+                journal.record_month_listed(month, month_events_found)
             
-            for row_element in row_elements:
+            if month_events_found > 0:
+                log(f"Completed {month_name} {year}: Found {month_events_found} events")
+            else:
+                log(f"No events found for {month_name} {year}")
+    finally:
+        if stop_workers is not None:
+            stop_workers()
+
+_MONTH_DONE = object()
+
+def _start_month_workers(months, url, wait_seconds, max_events, should_stop, log, backend, get_driver, sessions):
+    """
+    Start listing worker threads that take months from a shared queue.
+    A month whose listing raises hands the exception to its row iterator, which re-raises it.
+    Returns (one row iterator per month in month order, function that stops and joins the workers).
+    """
+    month_queue = queue.Queue()
+    for index, month in enumerate(months):
+        month_queue.put((index, month))
+    row_queues = [queue.Queue() for _ in months]
+    stop_event = threading.Event()
+    
+    def stopped():
+        return stop_event.is_set() or bool(should_stop and should_stop())
+    
+    def worker(slot):
+        # Each slot keeps its own HTTP session and browser so searches do not disturb each other
+        session = new_http_session()
+        slot_driver = (lambda: get_driver(slot)) if get_driver else None
+        try:
+            while not stopped():
+                try:
+                    index, month = month_queue.get_nowait()
+                except queue.Empty:
+                    return
                 try:
-                    cols = row_element.find_elements(By.TAG_NAME, "td")
-                    if len(cols) < 6:
-                        continue
-                        
-                    name = cols[0].text.strip()
-                    dates = cols[1].text.strip()
-                    city = cols[2].text.strip()
-                    country = cols[3].text.strip()
-                    attendance = cols[4].text.strip()
-                    exhibitors = cols[5].text.strip()
-
-                    # Filter for US events and the current month/year, allowing for multiple month aliases
-                    if (
-                        "united states" in country.lower() and
-                        any(alias in dates.upper() for alias in month_aliases) and
-                        year in dates
-                    ):
-                        # Check if we've reached the maximum number of events
-                        if event_counter >= MAX_EVENTS:
-                            print(f"Reached maximum events ({MAX_EVENTS}). Stopping.")
+                    found = 0
+                    for row in scrape_month_rows(url, month, wait_seconds, stopped, log, backend, slot_driver, session):
+                        row_queues[index].put(row)
+                        found += 1
+                        # No single month can contribute more than the global cap
+                        if found >= max_events or stopped():
                             break
-                        
-                        event_counter += 1
-                        print(f"Processing event {event_counter}/{MAX_EVENTS}: {name}")
-                        
-                        # Extract website URL
-                        website_url = extract_website_url(row_element)
-                        
-                        # Initialize contact info
-                        contact_info = {
-                            'website': website_url,
-                            'email': '',
-                            'company_name': ''
-                        }
-                        
-                        # Get company name using hybrid approach (ChatGPT first, then website)
-                        event_info = f"Event: {name}, Dates: {dates}, City: {city}, Country: {country}, Attendance: {attendance}, Exhibitors: {exhibitors}"
-                        # For standalone execution, try to get API key from environment
-                        api_key = os.getenv('OPENAI_API_KEY')
-                        company_name, source = get_company_name_hybrid(name, event_info, website_url, api_key)
-                        
-                        if company_name:
-                            contact_info['company_name'] = company_name
-                        
-                        # Scrape contact information if website URL is found
-                        if website_url:
-                            website_contact_info = extract_contact_info(website_url, name)
-                            # Preserve the company name from hybrid extraction, only update website and email
-                            contact_info['website'] = website_contact_info['website']
-                            contact_info['email'] = website_contact_info['email']
-                            time.sleep(CONTACT_SCRAPE_DELAY)  # Be respectful to websites
-                        
-                        # Add event with contact info and source
-                        events.append([
-                            name, dates, city, country, attendance, exhibitors,
-                            contact_info['website'], contact_info['email'], contact_info['company_name'], source
-                        ])
-                        
                 except Exception as e:
-                    print(f"Error processing row: {e}")
+                    log(f"Error listing {month[0]}: {e}")
+                    # Re-raised by month_rows, so a failed month aborts the run as with one session
+                    row_queues[index].put(e)
+                else:
+                    row_queues[index].put(_MONTH_DONE)
+        finally:
+            session.close()
+    
+    threads = [threading.Thread(target=worker, args=(slot,), daemon=True) for slot in range(sessions)]
+    for thread in threads:
+        thread.start()
+    
+    def month_rows(index):
+        while True:
+            try:
+                row = row_queues[index].get(timeout=0.5)
+            except queue.Empty:
+                # Workers stopped before reaching this month
+                if stopped() and not any(thread.is_alive() for thread in threads):
+                    return
+                continue
+            if row is _MONTH_DONE:
+                return
+            if isinstance(row, Exception):
+                raise row
+            yield row
+    
+    def stop_workers():
+        stop_event.set()
+        for thread in threads:
+            thread.join()
+    
+    return (month_rows(index) for index in range(len(months))), stop_workers
+
+def build_event_info(row):
+    """Describe a listing row for the ChatGPT prompt."""
+    return f"Event: {row['name']}, Dates: {row['dates']}, City: {row['city']}, Country: {row['country']}, Attendance: {row['attendance']}, Exhibitors: {row['exhibitors']}"
+
+def enrich_event(row, api_key=None, chatgpt_name=None, cache_checked=False):
+    """
+    Enrichment stage for a single listing row: company name (hybrid) plus website contact info.
+    chatgpt_name and cache_checked are passed through to get_company_name_hybrid when a batched
+    lookup already ran.
+    Returns tuple: (finished spreadsheet row, complete). Rows resumed from the journal are returned
+    as they were; complete is False when a lookup failed and the event should be enriched again.
+    """
+    if 'enriched' in row:
+        return row['enriched'], True
+    
+    name = row['name']
+    website_url = row['website']
+    
+    contact_info = {
+        'website': website_url,
+        'email': '',
+        'company_name': ''
+    }
+    source = "None"
+    
+    start = time.perf_counter()
+    failed = False
+    complete = False
+    try:
+        # Get company name using hybrid approach (ChatGPT first, then website)
+        event_info = build_event_info(row)
+        company_name, source, complete = get_company_name_hybrid(
+            name, event_info, website_url, api_key, chatgpt_name, cache_checked
+        )
+        
+        if company_name:
+            contact_info['company_name'] = company_name
+        
+        # Scrape contact information if website URL is found
+        if website_url:
+            website_contact_info = extract_contact_info(website_url, name)
+            # Preserve the company name from hybrid extraction, only update website and email
+            contact_info['website'] = website_contact_info['website']
+            contact_info['email'] = website_contact_info['email']
+            complete = complete and website_contact_info['complete']
+    except Exception as e:
+        failed = True
+        complete = False
+        print(f"Error enriching event {name}: {e}")
+    record_stage('event_enrichment', time.perf_counter() - start, error=failed)
+    
+    return [
+        name, row['dates'], row['city'], row['country'], row['attendance'], row['exhibitors'],
+        contact_info['website'], contact_info['email'], contact_info['company_name'], source
+    ], complete
+
+def _enrich_from_batch(row, batch_lookup, index, api_key, journal=None, history=None):
+    """
+    Wait for the batched ChatGPT answer covering this row, enrich it and record the result
+    in the journal and the event history. Incomplete results are left out of the history, so
+    the next run enriches the event again instead of reusing them.
+    """
+    chatgpt_name = None
+    cache_checked = False
+    if batch_lookup is not None:
+        try:
+            chatgpt_name = batch_lookup.result()[index]
+            # The batch already counted this event's cache hit or miss
+            cache_checked = True
+        except Exception as e:
+            print(f"Batched ChatGPT lookup failed for {row['name']}: {e}")
+    
+    freshly_enriched = 'enriched' not in row
+    event, complete = enrich_event(row, api_key, chatgpt_name, cache_checked)
+    if journal is not None and not journal.has_event(row):
+        try:
+            journal.record_event(row, event)
+        except Exception as e:
+            print(f"Could not write {row['name']} to the journal: {e}")
+    if history is not None and freshly_enriched and not complete:
+        print(f"Not keeping {row['name']} in the event history: enrichment was incomplete")
+    elif history is not None and freshly_enriched:
+        try:
+            history.store(row, event)
+        except Exception as e:
+            print(f"Could not write {row['name']} to the event history: {e}")
+    return event
+
+def run_enrichment_pipeline(rows, api_key=None, workers=ENRICHMENT_WORKERS,
+                            contact_delay=CONTACT_SCRAPE_DELAY, should_stop=None,
+                            batch_size=CHATGPT_BATCH_SIZE, journal=None, history=None):
+    """
+    Enrich listing rows on a bounded pool of worker threads.
+    rows can be a generator (e.g. scrape_listing_rows) so listing and enrichment overlap.
+    Rows are grouped into batches of batch_size for a single ChatGPT request each; events
+    missing from a batched answer fall back to their own request.
+    contact_delay is the minimum gap between requests to the same website host; requests to
+    different hosts are not delayed.
+    With a journal, every finished event is written to it as soon as it completes.
+    With an EventHistory, events unchanged since an earlier run reuse their stored enrichment
+    and only new or changed events are enriched (delta mode).
+    Yields finished event rows in the same order the listing stage produced them.
+    """
+    set_host_delay(contact_delay)
+    workers = max(1, int(workers))
+    batch_size = max(1, int(batch_size)) if api_key else 1
+    # Cap rows in flight so a long listing never queues hundreds of pending lookups
+    max_in_flight = max(workers, batch_size) * 2
+    pending = deque()
+    batch = []
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor, \
+            ThreadPoolExecutor(max_workers=2) as batch_executor:
+        
+        def submit_batch():
+            # Rows the local rules resolve confidently never reach ChatGPT
+            to_ask = []
+            for row in batch:
+                if 'enriched' in row:
                     continue
+                rule_name, confidence = resolve_company_name_by_rules(row['name'])
+                if not rule_name or confidence < RULES_CONFIDENCE_THRESHOLD:
+                    to_ask.append(row)
+            
+            batch_lookup = None
+            if batch_size > 1 and to_ask:
+                batch_lookup = batch_executor.submit(
+                    get_company_names_from_chatgpt_batch,
+                    [(row['name'], build_event_info(row)) for row in to_ask],
+                    api_key
+                )
+            
+            positions = {id(row): index for index, row in enumerate(to_ask)}
+            for row in batch:
+                index = positions.get(id(row))
+                lookup = batch_lookup if index is not None else None
+                pending.append(executor.submit(_enrich_from_batch, row, lookup, index, api_key, journal, history))
+            batch.clear()
+        
+        try:
+            for row in rows:
+                if should_stop and should_stop():
+                    return
+                if history is not None and 'enriched' not in row:
+                    stored = history.lookup(row)
+                    if stored is not None:
+                        row['enriched'] = stored
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    submit_batch()
+                
+                # Hand back finished results at the head of the queue without blocking the listing
+                while pending and (len(pending) >= max_in_flight or pending[0].done()):
+                    yield pending.popleft().result()
+            
+            if batch:
+                submit_batch()
+            
+            while pending:
+                if should_stop and should_stop():
+                    return
+                yield pending.popleft().result()
+        finally:
+            # Drop queued lookups that have not started yet (stop request or error)
+            for future in pending:
+                future.cancel()
 
-            # Check if we've reached max events and break out of pagination loop
-            if event_counter >= MAX_EVENTS:
-                break
+def main(argv=None):
+    """Main function to run the scraper"""
+    global event_counter
+    
+    parser = argparse.ArgumentParser(description="Scrape US trade show events with contact information.")
+    parser.add_argument("--workers", type=int, default=ENRICHMENT_WORKERS,
+                        help=f"Number of events enriched concurrently (default: {ENRICHMENT_WORKERS})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the on-disk website cache and fetch every page live")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="Delete the on-disk website cache before scraping")
+    parser.add_argument("--no-chatgpt-cache", action="store_true",
+                        help="Ask ChatGPT again even for events answered in earlier runs")
+    parser.add_argument("--batch-size", type=int, default=CHATGPT_BATCH_SIZE,
+                        help=f"Events per ChatGPT request; 1 disables batching (default: {CHATGPT_BATCH_SIZE})")
+    parser.add_argument("--listing-sessions", type=int, default=LISTING_SESSIONS,
+                        help=f"Months listed in parallel, each with its own session/browser (default: {LISTING_SESSIONS})")
+    parser.add_argument("--listing-backend", choices=["http", "selenium"], default=LISTING_BACKEND,
+                        help=f"How to read the calendar: plain HTTP with browser fallback, or always the browser (default: {LISTING_BACKEND})")
+    parser.add_argument("--html-parser", choices=["lxml", "html.parser"], default=HTML_PARSER,
+                        help=f"HTML parser for event websites and calendar pages (default: {HTML_PARSER}; html.parser if lxml is missing)")
+    parser.add_argument("--resume", action="store_true",
+                        help=f"Resume the last run from {JOURNAL_PATH}: finished months and events are not scraped again")
+    parser.add_argument("--full", action="store_true",
+                        help=f"Enrich every event again instead of reusing unchanged events from {EVENT_HISTORY_PATH}")
+    parser.add_argument("--url", default=URL,
+                        help="Trade show calendar search page to scrape (default: the live calendar)")
+    parser.add_argument("--max-events", type=int, default=MAX_EVENTS,
+                        help=f"Maximum number of events to collect (default: {MAX_EVENTS})")
+    parser.add_argument("--contact-delay", type=float, default=CONTACT_SCRAPE_DELAY,
+                        help=f"Minimum seconds between requests to the same website host (default: {CONTACT_SCRAPE_DELAY})")
+    parser.add_argument("--metrics-report", default=METRICS_REPORT_PATH,
+                        help=f"Where to write the per-stage timing report as JSON (default: {METRICS_REPORT_PATH})")
+    parser.add_argument("--metrics-prometheus", default=METRICS_PROMETHEUS_PATH,
+                        help="Also write the metrics in Prometheus text format to this file (e.g. for node_exporter's textfile collector)")
+    parser.add_argument("--profile", nargs="?", const="all", metavar="STAGES",
+                        help=f"Profile the run and write flame-graph files next to {EXCEL_PATH}: the whole run, or "
+                             f"comma-separated stages from {', '.join(PROFILE_STAGES)}")
+    args = parser.parse_args(argv)
+    try:
+        profile_stages = parse_profile_stages(args.profile)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    # Reset counters
+    event_counter = 0
+    reset_chatgpt_usage()
+    reset_wait_stats()
+    reset_metrics()
+    clear_page_cache()
+    set_html_parser(args.html_parser)
+    configure_http_cache(enabled=not args.no_cache, clear=args.clear_cache)
+    configure_chatgpt_cache(enabled=not args.no_chatgpt_cache)
+    
+    print("Starting event scraper...")
+    
+    # --- SELENIUM SETUP ---
+    # Chrome is only started if the listing actually needs a browser (one per listing session)
+    get_driver = lambda slot: get_pooled_driver(slot, headless=True)
 
-            # Try to click the Next button for this month, regardless of event presence
-            if click_next_button(driver):
-                page += 1
-                time.sleep(WAIT_SECONDS)
-            else:
-                break
+    # --- Scrape all results for specified months in the USA (with pagination if needed) ---
+    year = "2025"
+    months = [
+        ("July", "7", ["JUL", "JULY"], year),
+        ("August", "8", ["AUG", "AUGUST"], year),
+        ("September", "9", ["SEP", "SEPT", "SEPTEMBER"], year),
+        ("October", "10", ["OCT", "OCTOBER"], year),
+        ("November", "11", ["NOV", "NOVEMBER"], year),
+        ("December", "12", ["DEC", "DECEMBER"], year),
+    ]
+    
+    # For standalone execution, try to get API key from environment
+    api_key = os.getenv('OPENAI_API_KEY')
+    
+    # Every finished event is journaled so an interrupted run can be resumed
+    journal = EventJournal(JOURNAL_PATH, resume=args.resume)
+    if args.resume:
+        print(f"Resuming: {len(journal.events)} events already finished in {JOURNAL_PATH}")
     
-    # --- SAVE TO EXCEL ---
-    print(f"Total US events to save: {len(events)}")
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "US Events with Contact Info"
-    ws.append([
-        "Event Name", "Dates", "City", "Country", "Attendance", "Exhibitors",
-        "Website", "Email", "Company Name", "Company Name Source"
-    ])
-    for event in events:
-        ws.append(event)
-    wb.save("events.xlsx")
-
-    if events:
-        print(f"Saved {len(events)} events with contact information to events.xlsx")
+    # Delta mode: only new or changed events are enriched, the rest reuse the last run's results
+    history = EventHistory(EVENT_HISTORY_PATH, reuse=not args.full)
+    
+    # Listing stage feeds the enrichment pool; results come back in listing order and are
+    # streamed straight into the spreadsheet
+    writer = ExcelEventWriter(EXCEL_PATH)
+    profiler = RunProfiler(profile_stages).start() if args.profile else None
+    try:
+        rows = scrape_listing_rows(months, url=args.url, max_events=args.max_events,
+                                   backend=args.listing_backend, get_driver=get_driver,
+                                   sessions=args.listing_sessions, journal=journal)
+        for event in run_enrichment_pipeline(rows, api_key, workers=args.workers, batch_size=args.batch_size,
+                                             contact_delay=args.contact_delay, journal=journal, history=history):
+            writer.append(event)
+            print(f"Enriched event {writer.count}: {event[0]}")
+            if writer.count % METRICS_WRITE_EVERY == 0:
+                write_metrics_report(get_metrics_report(writer.count), args.metrics_report, args.metrics_prometheus)
+    finally:
+        # Clean up (the spreadsheet, metrics and profile are written even if the run was interrupted)
+        profile_paths = []
+        if profiler is not None:
+            profiler.stop()
+            try:
+                profile_paths = profiler.write(EXCEL_PATH)
+            except OSError as e:
+                print(f"Could not write the profile: {e}")
+        writer.close()
+        metrics = get_metrics_report(writer.count)
+        try:
+            write_metrics_report(metrics, args.metrics_report, args.metrics_prometheus)
+        except OSError as e:
+            print(f"Could not write the metrics report: {e}")
+        journal.close()
+        history.close()
+        quit_pooled_drivers()
+        close_http_session()
+        configure_http_cache(enabled=False)
+        configure_chatgpt_cache(enabled=False)
+    
+    if writer.count:
+        print(f"Saved {writer.count} events with contact information to {EXCEL_PATH}")
     else:
         print("No US events found for the selected months.")
 
     # Print summary of contact information found
-    if events:
-        events_with_website = sum(1 for event in events if event[6])  # Website column
-        events_with_email = sum(1 for event in events if event[7])    # Email column
-        events_with_company = sum(1 for event in events if event[8])  # Company Name column
-        
-        # Count sources
-        chatgpt_sources = sum(1 for event in events if event[9] == "ChatGPT")
-        website_sources = sum(1 for event in events if event[9] == "Website")
-        none_sources = sum(1 for event in events if event[9] == "None")
-        
+    if writer.count:
         print(f"\n--- CONTACT INFORMATION SUMMARY ---")
-        print(f"Total events: {len(events)}")
-        print(f"Events with website: {events_with_website}")
-        print(f"Events with email: {events_with_email}")
-        print(f"Events with company name: {events_with_company}")
-        print(f"Company names from ChatGPT: {chatgpt_sources}")
-        print(f"Company names from Website: {website_sources}")
-        print(f"Company names not found: {none_sources}")
-        print(f"Contact information found for {events_with_email + events_with_company} events")
-
-    # Clean up
-    driver.quit()
+        print(f"Total events: {writer.count}")
+        print(f"Events with website: {writer.with_website}")
+        print(f"Events with email: {writer.with_email}")
+        print(f"Events with company name: {writer.with_company}")
+        print(f"Company names from Rules: {writer.sources.get('Rules', 0)}")
+        print(f"Company names from ChatGPT: {writer.sources.get('ChatGPT', 0)}")
+        print(f"Company names from Website: {writer.sources.get('Website', 0)}")
+        print(f"Company names not found: {writer.sources.get('None', 0)}")
+        print(f"Contact information found for {writer.with_email + writer.with_company} events")
+
+    # Print how much of the listing actually needed enriching
+    if history.new or history.changed or history.unchanged:
+        print(f"\n--- DELTA SUMMARY ---")
+        print(f"New events: {history.new}")
+        print(f"Changed events: {history.changed}")
+        if history.reuse:
+            print(f"Unchanged events reused: {history.unchanged}")
+        else:
+            print(f"Unchanged events (enriched again, full run): {history.unchanged}")
+
+    # Print how long the browser actually waited for pages
+    wait_stats = get_wait_stats()
+    if wait_stats['count']:
+        print(f"\n--- PAGE WAIT SUMMARY ---")
+        print(f"Page waits: {wait_stats['count']}, total {wait_stats['total']:.1f}s, "
+              f"average {wait_stats['average']:.1f}s, longest {wait_stats['longest']:.1f}s")
+
+    # Print where the run spent its time
+    if metrics['stages']:
+        print(f"\n--- STAGE METRICS ---")
+        print(f"{'stage':<18} {'calls':>7} {'errors':>7} {'cached':>7} {'p50 s':>8} {'p95 s':>8} {'p99 s':>8} {'total s':>9} {'MB':>8}")
+        for stage, stats in metrics['stages'].items():
+            print(f"{stage:<18} {stats['count']:>7} {stats['errors']:>7} {stats['cache_hits']:>7} "
+                  f"{stats['p50_seconds']:>8.3f} {stats['p95_seconds']:>8.3f} {stats['p99_seconds']:>8.3f} "
+                  f"{stats['total_seconds']:>9.1f} {stats['bytes'] / 1e6:>8.1f}")
+        print(f"Run took {metrics['duration_seconds']:.1f}s; report written to {args.metrics_report}")
+
+    # Print the profile's hot spots and where the flame-graph files went
+    if profiler is not None:
+        print(f"\n--- PROFILE ---")
+        print(f"{profiler.samples} samples every {profiler.interval * 1000:.0f} ms")
+        for label, share in profiler.top_functions('all' if profiler.whole_run else profiler.stages[0]):
+            print(f"{share * 100:5.1f}%  {label}")
+        for path in profile_paths:
+            print(f"Flame-graph stacks written to {path}")
 
     # Print final token usage summary
-    if chatgpt_token_count > 0:
+    usage = get_chatgpt_usage()
+    if usage['tokens'] > 0 or usage['cache_hits'] > 0:
         print(f"\n--- CHATGPT USAGE SUMMARY ---")
-        print(f"Total tokens used: {chatgpt_token_count}")
+        print(f"Total tokens used: {usage['tokens']}")
+        print(f"Cache hits: {usage['cache_hits']}")
+        print(f"Cache misses: {usage['cache_misses']}")
 
     print("\nScraping completed!")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main() 
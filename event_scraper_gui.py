@@ -1,32 +1,37 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox
 import threading
 import os
 import json
-import time
 from datetime import datetime
 
 # Import scraper functions directly (like Hunter.io app)
 from event_scraper import (
-    get_company_name_from_chatgpt,
-    extract_company_name_from_website,
-    get_company_name_hybrid,
-    extract_contact_info,
-    extract_website_url,
-    click_next_button
+    scrape_listing_rows,
+    run_enrichment_pipeline,
+    clear_page_cache,
+    set_html_parser,
+    configure_http_cache,
+    configure_chatgpt_cache,
+    reset_chatgpt_usage,
+    reset_wait_stats,
+    get_wait_stats,
+    get_pooled_driver,
+    quit_pooled_drivers,
+    EventJournal,
+    JOURNAL_PATH,
+    EventHistory,
+    EVENT_HISTORY_PATH,
+    ExcelEventWriter,
+    EXCEL_PATH,
+    get_chatgpt_usage,
+    reset_metrics,
+    get_metrics_report,
+    write_metrics_report,
+    METRICS_REPORT_PATH,
+    RunProfiler,
+    parse_profile_stages
 )
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select, WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, ElementNotInteractableException, TimeoutException
-from bs4 import BeautifulSoup
-import re
-import openpyxl
-import requests
-from urllib.parse import urljoin, urlparse
-import openai
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -77,10 +82,21 @@ class EventScraperGUI:
         default_config = {
             "openai_api_key": api_key_from_env,
             "url": "https://thetradeshowcalendar.com/orbus/index.php?",
-            "wait_seconds": 7,
+            "wait_seconds": 30,
             "contact_scrape_delay": 2,
             "max_events": 600,
+            "enrichment_workers": 8,
+            "chatgpt_batch_size": 20,
             "headless_mode": True,
+            "keep_browser_warm": True,
+            "listing_backend": "http",
+            "listing_sessions": 3,
+            "html_parser": "lxml",
+            "use_http_cache": True,
+            "delta_mode": True,
+            "metrics_prometheus_path": "",
+            "profile_run": False,
+            "profile_stages": "all",
             "months": [
                 {"name": "January", "value": "1", "aliases": ["JAN", "JANUARY"]},
                 {"name": "February", "value": "2", "aliases": ["FEB", "FEBRUARY"]},
@@ -139,6 +155,9 @@ class EventScraperGUI:
         self.status_button = ttk.Button(status_frame, text="Scrape", command=self.toggle_scraping)
         self.status_button.pack()
         
+        self.resume_button = ttk.Button(status_frame, text="Resume Last Run", command=self.resume_scraping)
+        self.resume_button.pack(pady=(5, 0))
+        
         # Progress frame
         progress_frame = ttk.LabelFrame(main_frame, text="Progress", padding=10)
         progress_frame.pack(fill='x', padx=20, pady=10)
@@ -216,15 +235,15 @@ class EventScraperGUI:
         url_entry.pack(fill='x', pady=2)
         
         # Wait seconds
-        ttk.Label(scraping_frame, text="Wait seconds (increase if internet is slow):").pack(anchor='w')
-        self.wait_seconds_var = tk.IntVar(value=self.config.get('wait_seconds', 7))
-        wait_seconds_spin = ttk.Spinbox(scraping_frame, from_=1, to=30, textvariable=self.wait_seconds_var, width=10)
+        ttk.Label(scraping_frame, text="Maximum wait for each page (seconds, pages are read as soon as they are ready):").pack(anchor='w')
+        self.wait_seconds_var = tk.IntVar(value=self.config.get('wait_seconds', 30))
+        wait_seconds_spin = ttk.Spinbox(scraping_frame, from_=1, to=120, textvariable=self.wait_seconds_var, width=10)
         wait_seconds_spin.pack(anchor='w', pady=2)
         
         # Contact scrape delay
-        ttk.Label(scraping_frame, text="Contact scrape delay (seconds):").pack(anchor='w')
+        ttk.Label(scraping_frame, text="Delay between visits to the same website (seconds):").pack(anchor='w')
         self.contact_delay_var = tk.IntVar(value=self.config.get('contact_scrape_delay', 2))
-        contact_delay_spin = ttk.Spinbox(scraping_frame, from_=1, to=10, textvariable=self.contact_delay_var, width=10)
+        contact_delay_spin = ttk.Spinbox(scraping_frame, from_=0, to=10, textvariable=self.contact_delay_var, width=10)
         contact_delay_spin.pack(anchor='w', pady=2)
         
         # Max events
@@ -233,11 +252,77 @@ class EventScraperGUI:
         max_events_spin = ttk.Spinbox(scraping_frame, from_=1, to=1000, textvariable=self.max_events_var, width=10)
         max_events_spin.pack(anchor='w', pady=2)
         
+        # Enrichment workers
+        ttk.Label(scraping_frame, text="Concurrent enrichment workers:").pack(anchor='w')
+        self.workers_var = tk.IntVar(value=self.config.get('enrichment_workers', 8))
+        workers_spin = ttk.Spinbox(scraping_frame, from_=1, to=32, textvariable=self.workers_var, width=10)
+        workers_spin.pack(anchor='w', pady=2)
+        
+        # ChatGPT batch size
+        ttk.Label(scraping_frame, text="Events per ChatGPT request (1 = no batching):").pack(anchor='w')
+        self.batch_size_var = tk.IntVar(value=self.config.get('chatgpt_batch_size', 20))
+        batch_size_spin = ttk.Spinbox(scraping_frame, from_=1, to=50, textvariable=self.batch_size_var, width=10)
+        batch_size_spin.pack(anchor='w', pady=2)
+        
         # Headless mode
         self.headless_var = tk.BooleanVar(value=self.config.get('headless_mode', True))
         headless_check = ttk.Checkbutton(scraping_frame, text="Run browser in headless mode", variable=self.headless_var)
         headless_check.pack(anchor='w', pady=2)
         
+        # Keep browser warm
+        self.keep_browser_var = tk.BooleanVar(value=self.config.get('keep_browser_warm', True))
+        keep_browser_check = ttk.Checkbutton(scraping_frame, text="Keep browser open between runs (faster restarts)", variable=self.keep_browser_var)
+        keep_browser_check.pack(anchor='w', pady=2)
+        
+        # Listing backend
+        ttk.Label(scraping_frame, text="Calendar listing backend (http falls back to the browser if needed):").pack(anchor='w')
+        self.listing_backend_var = tk.StringVar(value=self.config.get('listing_backend', 'http'))
+        listing_backend_combo = ttk.Combobox(scraping_frame, textvariable=self.listing_backend_var,
+                                             values=["http", "selenium"], state="readonly", width=12)
+        listing_backend_combo.pack(anchor='w', pady=2)
+        
+        # Listing sessions
+        ttk.Label(scraping_frame, text="Months listed in parallel (each uses its own browser if needed):").pack(anchor='w')
+        self.listing_sessions_var = tk.IntVar(value=self.config.get('listing_sessions', 3))
+        listing_sessions_spin = ttk.Spinbox(scraping_frame, from_=1, to=12, textvariable=self.listing_sessions_var, width=10)
+        listing_sessions_spin.pack(anchor='w', pady=2)
+        
+        # HTML parser
+        ttk.Label(scraping_frame, text="HTML parser (lxml is several times faster on large pages):").pack(anchor='w')
+        self.html_parser_var = tk.StringVar(value=self.config.get('html_parser', 'lxml'))
+        html_parser_combo = ttk.Combobox(scraping_frame, textvariable=self.html_parser_var,
+                                         values=["lxml", "html.parser"], state="readonly", width=12)
+        html_parser_combo.pack(anchor='w', pady=2)
+        
+        # Website cache
+        self.http_cache_var = tk.BooleanVar(value=self.config.get('use_http_cache', True))
+        http_cache_check = ttk.Checkbutton(scraping_frame, text="Reuse cached website pages from earlier runs", variable=self.http_cache_var)
+        http_cache_check.pack(anchor='w', pady=2)
+        
+        clear_cache_button = ttk.Button(scraping_frame, text="Clear Website Cache", command=self.clear_http_cache)
+        clear_cache_button.pack(anchor='w', pady=2)
+        
+        # Delta mode
+        self.delta_mode_var = tk.BooleanVar(value=self.config.get('delta_mode', True))
+        delta_mode_check = ttk.Checkbutton(scraping_frame, text="Only enrich events that are new or changed since the last run", variable=self.delta_mode_var)
+        delta_mode_check.pack(anchor='w', pady=2)
+        
+        # Prometheus metrics file
+        ttk.Label(scraping_frame, text=f"Prometheus metrics file (optional; the JSON report always goes to {METRICS_REPORT_PATH}):").pack(anchor='w')
+        self.metrics_prometheus_var = tk.StringVar(value=self.config.get('metrics_prometheus_path', ''))
+        metrics_prometheus_entry = ttk.Entry(scraping_frame, textvariable=self.metrics_prometheus_var, width=40)
+        metrics_prometheus_entry.pack(anchor='w', pady=2)
+        
+        # Profiling
+        self.profile_run_var = tk.BooleanVar(value=self.config.get('profile_run', False))
+        profile_run_check = ttk.Checkbutton(scraping_frame, text=f"Profile the run (flame-graph files are written next to {EXCEL_PATH})", variable=self.profile_run_var)
+        profile_run_check.pack(anchor='w', pady=2)
+        
+        ttk.Label(scraping_frame, text="Stages to profile (comma-separated, or \"all\" for the whole run):").pack(anchor='w')
+        self.profile_stages_var = tk.StringVar(value=self.config.get('profile_stages', 'all'))
+        profile_stages_entry = ttk.Entry(scraping_frame, textvariable=self.profile_stages_var, width=40)
+        profile_stages_entry.pack(anchor='w', pady=2)
+        
         # Default year (for backward compatibility)
         ttk.Label(scraping_frame, text="Default year:").pack(anchor='w')
         self.year_var = tk.StringVar(value=self.config.get('year', '2025'))
@@ -388,7 +473,18 @@ class EventScraperGUI:
         self.config['wait_seconds'] = self.wait_seconds_var.get()
         self.config['contact_scrape_delay'] = self.contact_delay_var.get()
         self.config['max_events'] = self.max_events_var.get()
+        self.config['enrichment_workers'] = self.workers_var.get()
+        self.config['chatgpt_batch_size'] = self.batch_size_var.get()
         self.config['headless_mode'] = self.headless_var.get()
+        self.config['keep_browser_warm'] = self.keep_browser_var.get()
+        self.config['listing_backend'] = self.listing_backend_var.get()
+        self.config['listing_sessions'] = self.listing_sessions_var.get()
+        self.config['html_parser'] = self.html_parser_var.get()
+        self.config['use_http_cache'] = self.http_cache_var.get()
+        self.config['delta_mode'] = self.delta_mode_var.get()
+        self.config['metrics_prometheus_path'] = self.metrics_prometheus_var.get()
+        self.config['profile_run'] = self.profile_run_var.get()
+        self.config['profile_stages'] = self.profile_stages_var.get()
         self.config['year'] = self.year_var.get()
         
         # Save selected months with their individual years
@@ -408,6 +504,17 @@ class EventScraperGUI:
         self.save_config()
         messagebox.showinfo("Settings", "Settings saved successfully!")
     
+    def clear_http_cache(self):
+        """Delete all cached website pages"""
+        if self.is_scraping:
+            messagebox.showwarning("Website Cache", "Stop scraping before clearing the cache.")
+            return
+        try:
+            configure_http_cache(enabled=False, clear=True)
+            messagebox.showinfo("Website Cache", "Website cache cleared.")
+        except Exception as e:
+            messagebox.showerror("Website Cache", f"Could not clear the cache: {e}")
+    
     def toggle_scraping(self):
         """Toggle between start and stop scraping"""
         if self.is_scraping:
@@ -417,7 +524,16 @@ class EventScraperGUI:
             # Start scraping
             self.start_scraping()
     
-    def start_scraping(self):
+    def resume_scraping(self):
+        """Continue the last (interrupted) run from its journal"""
+        if self.is_scraping:
+            return
+        if not os.path.exists(JOURNAL_PATH):
+            messagebox.showinfo("Resume", "There is no previous run to resume.")
+            return
+        self.start_scraping(resume=True)
+    
+    def start_scraping(self, resume=False):
         """Start the scraping process in a separate thread"""
         # Load scraper modules first
         global event_counter, chatgpt_token_count
@@ -434,7 +550,8 @@ class EventScraperGUI:
         self.progress_label.config(text="0%")
         self.log_text.delete(1.0, tk.END)
         
-        self.scraping_thread = threading.Thread(target=self.run_scraper)
+        self.resume_button.config(state='disabled')
+        self.scraping_thread = threading.Thread(target=self.run_scraper, args=(resume,))
         self.scraping_thread.daemon = True
         self.scraping_thread.start()
     
@@ -461,10 +578,15 @@ class EventScraperGUI:
             if not result:
                 return
         
+        quit_pooled_drivers()
         self.root.quit()
     
-    def run_scraper(self):
+    def run_scraper(self, resume=False):
         """Run the actual scraping process"""
+        journal = None
+        history = None
+        writer = None
+        profiler = None
         try:
             self.update_status("Initializing scraper...")
             
@@ -475,214 +597,135 @@ class EventScraperGUI:
             global event_counter, chatgpt_token_count
             event_counter = 0
             chatgpt_token_count = 0
+            reset_chatgpt_usage()
+            reset_wait_stats()
+            reset_metrics()
+            clear_page_cache()
+            set_html_parser(self.html_parser_var.get())
+            configure_http_cache(enabled=self.http_cache_var.get())
+            configure_chatgpt_cache()
             
-            # Set up Chrome options
-            options = Options()
-            if self.headless_var.get():
-                options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-            
-            # Initialize driver
-            driver = webdriver.Chrome(options=options)
-            driver.get(self.url_var.get())
-            wait = WebDriverWait(driver, 30)
-            
-            # Disable SSL warnings
-
+            # Chrome is only started if the listing actually needs a browser (one per listing session).
+            # Pooled browsers are kept warm between runs unless the setting is off.
+            headless = self.headless_var.get()
+            get_driver = lambda slot: get_pooled_driver(slot, headless=headless)
             
             # Get selected months
             selected_months = self.config.get('selected_months', self.config.get('months', []))
             if not selected_months:
                 selected_months = self.config.get('months', [])
             
-            total_months = len(selected_months)
-            events = []
+            # Get the year for each month from the individual month year input
+            months = []
+            for month_data in selected_months:
+                month_name = month_data['name']
+                search_year = int(self.month_year_vars[month_name].get())
+                months.append((month_name, month_data['value'], month_data['aliases'], search_year))
             
-            # Get current date to determine smart year selection
-            from datetime import datetime
-            current_date = datetime.now()
-            current_month = current_date.month
-            current_year = current_date.year
+            max_events = self.max_events_var.get()
+            should_stop = lambda: not self.is_scraping
             
-            # Determine target year from settings
-            target_year = int(self.year_var.get())
+            # Every finished event is journaled so a stopped or crashed run can be resumed
+            journal = EventJournal(JOURNAL_PATH, resume=resume)
+            if resume:
+                self.log_message(f"Resuming last run: {len(journal.events)} events already finished")
             
-            for month_idx, month_data in enumerate(selected_months):
-                if not self.is_scraping:
-                    break
-                
-                month_name = month_data['name']
-                month_value = month_data['value']
-                month_aliases = month_data['aliases']
-                
-                # Get the year from the individual month year input
-                search_year = int(self.month_year_vars[month_name].get())
-                
-                self.update_status(f"Processing {month_name} {search_year}...")
-                self.log_message(f"Processing {month_name} {search_year}...")
-                
-                # Allow GUI to update
-                self.yield_to_gui()
-                
-                # Reload page for each month
-                driver.get(self.url_var.get())
-                time.sleep(self.wait_seconds_var.get())
-                
-                # Select month
-                try:
-                    month_select = wait.until(EC.visibility_of_element_located((By.NAME, "vMo")))
-                    select = Select(month_select)
-                    select.select_by_value(month_value)
-                except Exception as e:
-                    continue
-                
-                # Click search
-                try:
-                    search_button = driver.find_element(By.CLASS_NAME, "sc-button-submit")
-                    search_button.click()
-                    time.sleep(self.wait_seconds_var.get())
-                except Exception as e:
-                    continue
-                
-                # Process pages
-                page = 1
-                month_events_found = 0
-                
-                while self.is_scraping:
-                    # Get rows
-                    row_elements = driver.find_elements(By.CSS_SELECTOR, "tr.row")
-                    
-                    if not row_elements:
-                        self.log_message(f"No more events found for {month_name} {search_year}")
-                        break
-                    
-                    for row_element in row_elements:
-                        if not self.is_scraping or event_counter >= self.max_events_var.get():
-                            break
-                        
-                        try:
-                            cols = row_element.find_elements(By.TAG_NAME, "td")
-                            if len(cols) < 6:
-                                continue
-                            
-                            name = cols[0].text.strip()
-                            dates = cols[1].text.strip()
-                            city = cols[2].text.strip()
-                            country = cols[3].text.strip()
-                            attendance = cols[4].text.strip()
-                            exhibitors = cols[5].text.strip()
-                            
-                            # Filter for US events and smart year selection
-                            if (
-                                "united states" in country.lower() and
-                                any(alias in dates.upper() for alias in month_aliases) and
-                                str(search_year) in dates
-                            ):
-                                if event_counter >= self.max_events_var.get():
-                                    break
-                                
-                                event_counter += 1
-                                month_events_found += 1
-                                self.log_message(f"Processing: {name}")
-                                
-                                # Allow GUI to update every few events
-                                if event_counter % 5 == 0:
-                                    self.root.after(50)
-                                
-                                # Extract website URL
-                                website_url = extract_website_url(row_element)
-                                
-                                # Initialize contact info
-                                contact_info = {
-                                    'website': website_url,
-                                    'email': '',
-                                    'company_name': ''
-                                }
-                                
-                                # Get company name
-                                event_info = f"Event: {name}, Dates: {dates}, City: {city}, Country: {country}, Attendance: {attendance}, Exhibitors: {exhibitors}"
-                                company_name, source = get_company_name_hybrid(name, event_info, website_url, self.api_key_var.get())
-                                
-                                if company_name:
-                                    contact_info['company_name'] = company_name
-                                
-                                # Scrape contact information
-                                if website_url:
-                                    website_contact_info = extract_contact_info(website_url, name)
-                                    contact_info['website'] = website_contact_info['website']
-                                    contact_info['email'] = website_contact_info['email']
-                                    time.sleep(self.contact_delay_var.get())
-                                
-                                # Add event
-                                events.append([
-                                    name, dates, city, country, attendance, exhibitors,
-                                    contact_info['website'], contact_info['email'], contact_info['company_name'], source
-                                ])
-                                
-                                # Update progress
-                                progress = (event_counter / self.max_events_var.get()) * 100
-                                self.update_progress(progress, f"{event_counter}/{self.max_events_var.get()} events")
-                        
-                        except Exception as e:
-                            continue
-                    
-                    if event_counter >= self.max_events_var.get():
-                        break
-                    
-                    # Try next page
-                    if click_next_button(driver):
-                        page += 1
-                        time.sleep(self.wait_seconds_var.get())
-                    else:
-                        break
-                
-                # Log month completion
-                if month_events_found > 0:
-                    self.log_message(f"Completed {month_name} {search_year}: Found {month_events_found} events")
-                else:
-                    self.log_message(f"No events found for {month_name} {search_year}")
-                
-                # Update progress for months
-                month_progress = ((month_idx + 1) / total_months) * 100
-                self.update_progress(month_progress, f"Month {month_idx + 1}/{total_months}")
+            # Delta mode: only new or changed events are enriched, the rest reuse the last run's results
+            history = EventHistory(EVENT_HISTORY_PATH, reuse=self.delta_mode_var.get())
             
-            # Save results
-            if events and self.is_scraping:
-                wb = openpyxl.Workbook()
-                ws = wb.active
-                ws.title = "US Events with Contact Info"
-                ws.append([
-                    "Event Name", "Dates", "City", "Country", "Attendance", "Exhibitors",
-                    "Website", "Email", "Company Name", "Company Name Source"
-                ])
-                for event in events:
-                    ws.append(event)
-                wb.save("events.xlsx")
+            # Listing stage feeds the enrichment pool; results come back in listing order and are
+            # streamed straight into the spreadsheet
+            writer = ExcelEventWriter(EXCEL_PATH)
+            if self.profile_run_var.get():
+                profiler = RunProfiler(parse_profile_stages(self.profile_stages_var.get())).start()
+                self.log_message("Profiling this run")
+            rows = scrape_listing_rows(
+                months,
+                url=self.url_var.get(),
+                wait_seconds=self.wait_seconds_var.get(),
+                max_events=max_events,
+                should_stop=should_stop,
+                log=self.log_message,
+                backend=self.listing_backend_var.get(),
+                get_driver=get_driver,
+                sessions=self.listing_sessions_var.get(),
+                journal=journal
+            )
+            for event in run_enrichment_pipeline(
+                rows,
+                api_key=self.api_key_var.get(),
+                workers=self.workers_var.get(),
+                contact_delay=self.contact_delay_var.get(),
+                should_stop=should_stop,
+                batch_size=self.batch_size_var.get(),
+                journal=journal,
+                history=history
+            ):
+                writer.append(event)
+                event_counter = writer.count
+                self.log_message(f"Processed: {event[0]}")
                 
-                self.log_message(f"Scraping completed successfully! Saved {len(events)} events to events.xlsx")
+                # Update progress
+                progress = (event_counter / max_events) * 100
+                self.update_progress(progress, f"{event_counter}/{max_events} events")
+            
+            # Save results (also when stopped, so the events finished so far are not lost)
+            saved = writer.count
+            writer.close(discard=not saved)
+            
+            if saved and self.is_scraping:
+                self.log_message(f"Scraping completed successfully! Saved {saved} events to {EXCEL_PATH}")
+                reused = "reused" if history.reuse else "enriched again"
+                self.log_message(f"New events: {history.new}, changed: {history.changed}, unchanged ({reused}): {history.unchanged}")
+                wait_stats = get_wait_stats()
+                if wait_stats['count']:
+                    self.log_message(f"Page waits: {wait_stats['count']}, average {wait_stats['average']:.1f}s, longest {wait_stats['longest']:.1f}s")
+                usage = get_chatgpt_usage()
+                self.log_message(f"ChatGPT tokens used: {usage['tokens']} (cache hits: {usage['cache_hits']}, misses: {usage['cache_misses']})")
                 
                 self.update_status("Scraping completed successfully!")
-                self.root.after(0, lambda: messagebox.showinfo("Success", f"Scraping completed! Saved {len(events)} events to events.xlsx"))
+                self.root.after(0, lambda: messagebox.showinfo("Success", f"Scraping completed! Saved {saved} events to {EXCEL_PATH}"))
             elif not self.is_scraping:
-                self.log_message("Scraping was stopped by user.")
+                self.log_message(f"Scraping was stopped by user. Saved {saved} events to {EXCEL_PATH}; use Resume Last Run to continue.")
                 self.update_status("Scraping stopped by user.")
             else:
                 self.log_message("No events found matching the criteria.")
                 self.update_status("No events found.")
             
-            # Clean up
-            driver.quit()
-            
         except Exception as e:
             self.log_message(f"Error during scraping: {e}")
             self.update_status("Error occurred during scraping")
             self.root.after(0, lambda: messagebox.showerror("Error", f"An error occurred during scraping: {e}"))
         
         finally:
+            if profiler is not None:
+                profiler.stop()
+                try:
+                    for path in profiler.write(EXCEL_PATH):
+                        self.log_message(f"Profile written to {path}")
+                except OSError as e:
+                    self.log_message(f"Could not write the profile: {e}")
+            
+            # After an error, keep whatever was written before it
+            if writer is not None:
+                writer.close(discard=not writer.count)
+            if journal is not None:
+                journal.close()
+            if history is not None:
+                history.close()
+            
+            # Per-stage timings of the run (also after a stop or an error)
+            try:
+                write_metrics_report(get_metrics_report(writer.count if writer is not None else 0),
+                                     METRICS_REPORT_PATH, self.metrics_prometheus_var.get().strip())
+                self.log_message(f"Stage metrics written to {METRICS_REPORT_PATH}")
+            except OSError as e:
+                self.log_message(f"Could not write the metrics report: {e}")
+            
+            # Clean up (a warm browser is kept for the next run unless the setting is off)
+            if not self.keep_browser_var.get():
+                quit_pooled_drivers()
+            
             # Reset UI
             self.is_scraping = False
             self.root.after(0, self._reset_ui)
@@ -690,6 +733,7 @@ class EventScraperGUI:
     def _reset_ui(self):
         """Reset UI elements after scraping"""
         self.status_button.config(text="Scrape")
+        self.resume_button.config(state='normal')
         self.progress_var.set(0)
         self.progress_label.config(text="0%")
 
@@ -737,6 +781,9 @@ def main():
     print("Starting mainloop...")
     
     root.mainloop()
+    
+    # Close any browser kept warm between runs
+    quit_pooled_drivers()
 
 if __name__ == "__main__":
     main()
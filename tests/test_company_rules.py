@@ -0,0 +1,65 @@
+"""
+Tests for the rule-based company-name resolver (resolve_company_name_by_rules).
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from event_scraper import RULES_CONFIDENCE_THRESHOLD, resolve_company_name_by_rules
+
+@pytest.mark.parametrize("event_name, keyword", [
+    ("Chamber Music Festival - Houston", "Chamber"),
+    ("Board Game Expo - Austin", "Board"),
+    ("Foundation Repair Expo - Dallas", "Foundation"),
+    ("Academy Sports Expo", "Academy"),
+    ("Guild Wars Convention", "Guild"),
+    ("The Union Square Holiday Market", "The Union"),
+])
+def test_lone_organization_keyword_is_not_an_organizer(event_name, keyword):
+    company_name, confidence = resolve_company_name_by_rules(event_name)
+    assert company_name != keyword
+
+@pytest.mark.parametrize("event_name", [
+    "Academy Sports Expo",
+    "Guild Wars Convention",
+    "League of Legends Championship",
+    "League of Legends Championship - Seattle",
+])
+def test_organization_lookalikes_stay_below_threshold(event_name):
+    company_name, confidence = resolve_company_name_by_rules(event_name)
+    assert confidence < RULES_CONFIDENCE_THRESHOLD
+
+@pytest.mark.parametrize("event_name", [
+    "Conference - 2025",
+    "Annual Meeting - Chicago",
+    "IEEE Conference - San Diego",
+    "Trade Show - Orlando",
+    "International Expo - Dallas",
+    "Chamber Music Festival - Houston",
+])
+def test_generic_event_names_stay_below_threshold(event_name):
+    company_name, confidence = resolve_company_name_by_rules(event_name)
+    assert confidence < RULES_CONFIDENCE_THRESHOLD
+
+def test_expo_name_with_leading_keyword_is_kept_whole():
+    assert resolve_company_name_by_rules("Board Game Expo - Austin") == ("Board Game Expo", 0.8)
+
+@pytest.mark.parametrize("event_name, expected", [
+    ("National Association of Broadcasters Show", "National Association of Broadcasters"),
+    ("Society for Neuroscience Annual Meeting", "Society for Neuroscience"),
+    ("Academy of Management Annual Meeting", "Academy of Management"),
+    ("American Academy of Family Physicians - AAFP FUTURE", "American Academy of Family Physicians"),
+    ("Louisiana Restaurant Association - LRA Showcase", "Louisiana Restaurant Association"),
+    ("The Foodservice Conference - International Fresh Produce Association", "International Fresh Produce Association"),
+    ("Chamber Music Society of Lincoln Center - Summer Festival", "Chamber Music Society of Lincoln Center"),
+    ("Abilities Expo - Houston", "Abilities Expo"),
+    ("World Tea Expo - Las Vegas", "World Tea Expo"),
+])
+def test_confident_organizers(event_name, expected):
+    company_name, confidence = resolve_company_name_by_rules(event_name)
+    assert company_name == expected
+    assert confidence >= RULES_CONFIDENCE_THRESHOLD
@@ -0,0 +1,71 @@
+"""
+Tests for the contact page crawl (crawl_contact_pages) against a local HTTP server.
+
+    python -m pytest tests
+"""
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import event_scraper
+
+PAGE_BYTES = 2 * 1024 * 1024
+
+class PageHandler(BaseHTTPRequestHandler):
+    """Every path is a 2 MB HTML page without an email address."""
+    
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(PAGE_BYTES))
+        self.end_headers()
+        try:
+            for _ in range(PAGE_BYTES // 65536):
+                self.wfile.write(b"x" * 65536)
+        except OSError:
+            pass
+    
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def site(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    server.paths = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(event_scraper, '_http_cache', None)
+    monkeypatch.setattr(event_scraper, '_host_limiter', None)
+    event_scraper.clear_page_cache()
+    yield server, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+    event_scraper.clear_page_cache()
+
+def test_pages_share_the_byte_budget(site):
+    server, base = site
+    event_scraper.reset_metrics()
+    urls = [f"{base}/contact", f"{base}/about", f"{base}/team"]
+    assert event_scraper.crawl_contact_pages(urls, base, "Test Expo", byte_budget=3 * 1024 * 1024) == ''
+    assert event_scraper.get_metrics_report()['stages']['contact_crawl']['bytes'] == 3 * 1024 * 1024
+
+def test_stopped_crawl_leaves_no_host_slots_reserved(site):
+    server, base = site
+    event_scraper.set_host_delay(1.0)
+    event_scraper.fetch_page(f"{base}/")
+    homepage_slot_end = time.monotonic() + 1.0
+    
+    urls = [f"{base}/contact", f"{base}/about", f"{base}/team"]
+    start = time.monotonic()
+    assert event_scraper.crawl_contact_pages(urls, base, "Test Expo", time_budget=0.2) is None
+    assert time.monotonic() - start < 0.5
+    
+    time.sleep(0.3)  # Let the abandoned fetches wind down
+    host = event_scraper.HostRateLimiter.host_key(base)
+    assert event_scraper._host_limiter.next_allowed[host] <= homepage_slot_end
+    assert server.paths == ["/"]
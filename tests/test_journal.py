@@ -0,0 +1,64 @@
+"""
+Tests for resuming a run from the event journal (EventJournal), with the listing and the
+enrichment stubbed out.
+
+    python -m pytest tests
+"""
+import os
+import random
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import event_scraper
+
+MONTHS = [
+    ("July", "7", ["JUL"], 2025),
+    ("August", "8", ["AUG"], 2025),
+]
+
+def listing_row(month, number):
+    return {
+        'name': f"{month[0]} Event {number}", 'dates': f"{month[2][0]} {number}, 2025", 'city': "Houston",
+        'country': "United States", 'attendance': "", 'exhibitors': "", 'website': ""
+    }
+
+@pytest.fixture
+def stub_stages(monkeypatch):
+    """Twenty rows per month; enrichment finishes in a random order."""
+    shuffle = random.Random(7)
+    
+    def scrape_month_rows(url, month, *args, **kwargs):
+        for number in range(20):
+            yield listing_row(month, number)
+    
+    def enrich_event(row, *args):
+        if 'enriched' in row:
+            return row['enriched'], True
+        time.sleep(shuffle.random() * 0.01)
+        return [row['name'], row['dates'], row['city'], row['country'], '', '', '', '', '', 'None'], True
+    
+    monkeypatch.setattr(event_scraper, 'scrape_month_rows', scrape_month_rows)
+    monkeypatch.setattr(event_scraper, 'enrich_event', enrich_event)
+    return scrape_month_rows
+
+def run(journal):
+    rows = event_scraper.scrape_listing_rows(MONTHS, max_events=100, log=lambda message: None, journal=journal)
+    try:
+        return [event[0] for event in event_scraper.run_enrichment_pipeline(rows, workers=8, journal=journal)]
+    finally:
+        journal.close()
+
+def test_resumed_run_keeps_the_listing_order(stub_stages, tmp_path, monkeypatch):
+    path = str(tmp_path / "journal.jsonl")
+    first = run(event_scraper.EventJournal(path))
+    assert first == [f"{month[0]} Event {number}" for month in MONTHS for number in range(20)]
+    
+    # Both months are complete, so the resumed run replays them from the journal
+    def no_listing(*args, **kwargs):
+        raise AssertionError("completed months must not be listed again")
+        yield
+    monkeypatch.setattr(event_scraper, 'scrape_month_rows', no_listing)
+    assert run(event_scraper.EventJournal(path, resume=True)) == first
@@ -0,0 +1,47 @@
+"""
+Tests for replaying the calendar's td.next pagination over HTTP (_next_page_request),
+on the calendar pages of the benchmark corpus.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from event_scraper import ListingBackendError, _next_page_request, _search_form_fields
+
+CALENDAR_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures", "calendar")
+PAGE_URL = "https://www.example.com/index.php?"
+
+def load_page(name):
+    with open(os.path.join(CALENDAR_DIR, name), "rb") as f:
+        soup = BeautifulSoup(f.read(), "html.parser")
+    form = soup.find("select", attrs={"name": "vMo"}).find_parent("form")
+    return soup, form, _search_form_fields(form)
+
+def test_link_next_page_is_fetched():
+    soup, form, fields = load_page("july_2025_page1.html")
+    assert _next_page_request(soup, PAGE_URL, form, fields) == (
+        "get", "https://www.example.com/index.php?vMo=7&vYr=2025&page=2", None
+    )
+
+def test_onclick_next_page_resubmits_the_form():
+    soup, form, fields = load_page("september_2025_page1.html")
+    kind, url, next_fields = _next_page_request(soup, PAGE_URL, form, fields)
+    assert (kind, url) == ("form", None)
+    assert next_fields["page"] == "2"
+    assert next_fields["vMo"] == fields["vMo"]
+
+@pytest.mark.parametrize("name", ["july_2025_page2.html", "december_2025_page1.html"])
+def test_last_page_has_no_next_page(name):
+    soup, form, fields = load_page(name)
+    assert _next_page_request(soup, PAGE_URL, form, fields) is None
+
+def test_unreplayable_handler_raises():
+    soup, form, fields = load_page("september_2025_page1.html")
+    soup.select_one("td.next div")["onclick"] = "__doPostBack('pager', '')"
+    with pytest.raises(ListingBackendError):
+        _next_page_request(soup, PAGE_URL, form, fields)
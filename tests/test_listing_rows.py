@@ -0,0 +1,80 @@
+"""
+Tests for the listing stage (scrape_listing_rows) with the month listings stubbed out.
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import event_scraper
+
+MONTHS = [
+    ("July", "7", ["JUL"], 2025),
+    ("August", "8", ["AUG"], 2025),
+    ("September", "9", ["SEP"], 2025),
+]
+
+def listing_row(month, number):
+    return {
+        'name': f"{month[0]} Event {number}", 'dates': f"{month[2][0]} {number}, 2025", 'city': "Houston",
+        'country': "United States", 'attendance': "", 'exhibitors': "", 'website': ""
+    }
+
+@pytest.fixture
+def failing_august(monkeypatch):
+    """Every month lists three rows, except August, whose listing fails after one."""
+    def scrape_month_rows(url, month, *args, **kwargs):
+        for number in range(3):
+            if month[0] == "August" and number == 1:
+                raise RuntimeError("Could not select month")
+            yield listing_row(month, number)
+    monkeypatch.setattr(event_scraper, 'scrape_month_rows', scrape_month_rows)
+
+@pytest.mark.parametrize("sessions", [1, 2])
+def test_failed_month_aborts_the_listing(failing_august, sessions):
+    rows = event_scraper.scrape_listing_rows(MONTHS, max_events=100, log=lambda message: None, sessions=sessions)
+    listed = []
+    with pytest.raises(RuntimeError):
+        for row in rows:
+            listed.append(row['name'])
+    assert listed == ["July Event 0", "July Event 1", "July Event 2", "August Event 0"]
+
+@pytest.mark.parametrize("sessions", [1, 2])
+def test_failed_month_is_not_marked_listed(failing_august, tmp_path, sessions):
+    journal = event_scraper.EventJournal(str(tmp_path / "journal.jsonl"))
+    rows = event_scraper.scrape_listing_rows(MONTHS, max_events=100, log=lambda message: None,
+                                             sessions=sessions, journal=journal)
+    with pytest.raises(RuntimeError):
+        for row in rows:
+            journal.record_event(row, [row['name']])
+    journal.close()
+    assert journal.months_listed == {"July 2025": 3}
+    assert not journal.month_complete(MONTHS[1])
+
+def test_month_cut_by_max_events_is_not_marked_listed(failing_august, tmp_path):
+    journal = event_scraper.EventJournal(str(tmp_path / "journal.jsonl"))
+    for row in event_scraper.scrape_listing_rows(MONTHS, max_events=3, log=lambda message: None, journal=journal):
+        journal.record_event(row, [row['name']])
+    journal.close()
+    assert journal.months_listed == {}
+
+class BrokenCalendarDriver:
+    """A WebDriver whose calendar page never shows the month dropdown."""
+    page_source = "<html><body>Service unavailable</body></html>"
+    
+    def get(self, url):
+        pass
+    
+    def find_element(self, by, value):
+        raise NoSuchElementException(value)
+
+def test_selenium_month_that_cannot_be_selected_raises(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # The backend saves the page it could not use for debugging
+    rows = event_scraper.scrape_month_rows_selenium(BrokenCalendarDriver(), "https://www.example.com/", MONTHS[1],
+                                                    wait_seconds=0.2, log=lambda message: None)
+    with pytest.raises(event_scraper.MonthListingError):
+        next(rows)